@@ -0,0 +1,307 @@
+"""Micro-benchmarks for the operations of the package.
+
+Every benchmark plays its animations on a :class:`~manim_data_structures.m_scene.MRecordingScene`, so no renderer or ffmpeg is needed.
+
+Record a baseline::
+
+    python benchmarks/bench.py --output baseline.json
+
+Compare against it, failing if any benchmark got slower or used more memory than the threshold allows::
+
+    python benchmarks/bench.py --compare baseline.json --threshold 0.2
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import typing
+
+import manim
+
+from manim_data_structures import *
+
+SIZES = [10, 100, 1000, 10000]
+"""Array sizes the construction benchmarks are run for."""
+
+OP_SIZE = 1000
+"""Array size the operation benchmarks are run on."""
+
+
+def make_arr(size: int) -> typing.Tuple[MRecordingScene, MArray]:
+    """Makes an array of the specified size on a new recording scene.
+
+    Parameters
+    ----------
+    size
+        Specifies the number of elements.
+
+    Returns
+    -------
+    :class:`MRecordingScene`
+        The scene.
+    :class:`MArray`
+        The array.
+    """
+
+    scene = MRecordingScene()
+    arr = MArray(scene, list(range(size)))
+    scene.add(arr)
+    return (scene, arr)
+
+
+def bench_construct(size: int) -> typing.Tuple[typing.Callable, typing.Callable]:
+    """Benchmarks the construction of an array."""
+
+    def setup():
+        return list(range(size))
+
+    def run(values):
+        MArray(MRecordingScene(), values)
+
+    return (setup, run)
+
+
+def bench_append_elem() -> typing.Tuple[typing.Callable, typing.Callable]:
+    """Benchmarks appending an element."""
+
+    def setup():
+        return make_arr(OP_SIZE)[1]
+
+    def run(arr):
+        arr.append_elem(OP_SIZE)
+
+    return (setup, run)
+
+
+def bench_remove_elem(where: str) -> typing.Tuple[typing.Callable, typing.Callable]:
+    """Benchmarks removing the head, middle or tail element."""
+
+    index = {"head": 0, "middle": OP_SIZE // 2, "tail": OP_SIZE - 1}[where]
+
+    def setup():
+        return make_arr(OP_SIZE)[1]
+
+    def run(arr):
+        arr.remove_elem(index)
+
+    return (setup, run)
+
+
+def bench_update_elem_value() -> typing.Tuple[typing.Callable, typing.Callable]:
+    """Benchmarks updating the value of an element."""
+
+    def setup():
+        return make_arr(OP_SIZE)[1]
+
+    def run(arr):
+        arr.update_elem_value(OP_SIZE // 2, -1)
+
+    return (setup, run)
+
+
+def bench_pointer_shift() -> typing.Tuple[typing.Callable, typing.Callable]:
+    """Benchmarks shifting a pointer from the first to the last element."""
+
+    def setup():
+        (scene, arr) = make_arr(OP_SIZE)
+        pointer = MArrayPointer(scene, arr, 0)
+        scene.add(pointer)
+        return pointer
+
+    def run(pointer):
+        pointer.shift_to_elem(OP_SIZE - 1)
+
+    return (setup, run)
+
+
+def bench_window_resize() -> typing.Tuple[typing.Callable, typing.Callable]:
+    """Benchmarks growing a sliding window over most of the array."""
+
+    def setup():
+        (scene, arr) = make_arr(OP_SIZE)
+        window = MArraySlidingWindow(scene, arr, 0, 1)
+        scene.add(window)
+        return window
+
+    def run(window):
+        window.resize_window(OP_SIZE - 1)
+
+    return (setup, run)
+
+
+def bench_variable_update() -> typing.Tuple[typing.Callable, typing.Callable]:
+    """Benchmarks updating the value of a variable."""
+
+    def setup():
+        scene = MRecordingScene()
+        var = MVariable(scene, 0)
+        scene.add(var)
+        return var
+
+    def run(var):
+        var.update_value(1)
+
+    return (setup, run)
+
+
+BENCHMARKS = {
+    **{f"construct[{size}]": (lambda s=size: bench_construct(s)) for size in SIZES},
+    "append_elem": bench_append_elem,
+    "remove_elem[head]": lambda: bench_remove_elem("head"),
+    "remove_elem[middle]": lambda: bench_remove_elem("middle"),
+    "remove_elem[tail]": lambda: bench_remove_elem("tail"),
+    "update_elem_value": bench_update_elem_value,
+    "pointer.shift_to_elem": bench_pointer_shift,
+    "window.resize_window": bench_window_resize,
+    "variable.update_value": bench_variable_update,
+}
+"""Maps benchmark names to factories returning their setup and run functions."""
+
+
+def measure(factory: typing.Callable, repeat: int) -> dict:
+    """Measures the wall time and the peak memory of a benchmark.
+
+    Each repetition runs on fresh state from the setup function, which is not measured. Memory is traced in a separate run so it doesn't skew the timings.
+
+    Parameters
+    ----------
+    factory
+        Specifies the factory of the benchmark.
+    repeat
+        Specifies the number of timed runs.
+
+    Returns
+    -------
+    :class:`dict`
+        Median and minimum wall time in seconds and peak memory in KiB.
+    """
+
+    (setup, run) = factory()
+
+    times = []
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        times.append(time.perf_counter() - start)
+
+    state = setup()
+    tracemalloc.start()
+    run(state)
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "time_s": statistics.median(times),
+        "time_min_s": min(times),
+        "peak_kib": peak / 1024,
+    }
+
+
+def compare(baseline: dict, results: dict, threshold: float) -> typing.List[str]:
+    """Compares results against a baseline.
+
+    Parameters
+    ----------
+    baseline
+        Specifies the baseline results.
+    results
+        Specifies the current results.
+    threshold
+        Specifies the relative increase above which a metric is a regression.
+
+    Returns
+    -------
+    :class:`list` of :class:`str`
+        Descriptions of the regressions.
+    """
+
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        for metric in ("time_s", "peak_kib"):
+            old = baseline[name][metric]
+            new = result[metric]
+            if old > 0 and new > old * (1 + threshold):
+                regressions.append(
+                    f"{name} {metric}: {old:.6g} -> {new:.6g} (+{(new / old - 1):.0%})"
+                )
+    return regressions
+
+
+def main(argv: typing.List[str] = None) -> int:
+    """Runs the benchmarks from the command line.
+
+    Parameters
+    ----------
+    argv
+        Specifies the command line arguments. Defaults to :data:`sys.argv`.
+
+    Returns
+    -------
+    :class:`int`
+        Exit status, `1` if a regression was found.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare the results to this JSON baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative increase flagged as a regression (default: 0.2)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="timed runs per benchmark (default: 5)"
+    )
+    parser.add_argument(
+        "--filter", default="", help="only run benchmarks containing this string"
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, factory in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        results[name] = measure(factory, args.repeat)
+        print(
+            f"{name:<28} {results[name]['time_s'] * 1000:10.3f} ms"
+            f" {results[name]['peak_kib']:12.1f} KiB"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "meta": {
+                        "python": platform.python_version(),
+                        "platform": platform.platform(),
+                        "manim": manim.__version__,
+                        "repeat": args.repeat,
+                    },
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(baseline, results, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,42 @@
 __version__ = "0.1.7"
 
+from .m_animation import *
 from .m_array import *
+from .m_cache import *
 from .m_enum import *
+from .m_layout import *
+from .m_queue import *
+from .m_recorder import *
+from .m_scene import *
+from .m_stats import *
+from .m_trace import *
 from .m_variable import *
+from .m_virtual_array import *
 
 __all__ = [
     "MArrayElement",
     "MArray",
     "MArrayPointer",
     "MArraySlidingWindow",
+    "MVirtualArray",
+    "MQueue",
     "MArrayDirection",
     "MArrayElementComp",
+    "MArrayEvent",
     "MVariable",
+    "MTextCache",
+    "MElementPool",
+    "MTranslate",
+    "MStretch",
+    "MArrayLayout",
+    "MFenwickTree",
+    "MArrayRecorder",
+    "MArrayRecordedValue",
+    "MArrayTrace",
+    "MRecordingScene",
+    "MStats",
+    "MTracer",
+    "text_cache",
+    "stats",
+    "tracer",
 ]
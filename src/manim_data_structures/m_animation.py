@@ -0,0 +1,276 @@
+"""Contains lightweight animations that modify mobjects in place."""
+
+from manim import *
+from manim.utils.paths import path_along_arc
+
+
+class MTranslate(Animation):
+    """An animation that translates mobjects without copying them.
+
+    Unlike :class:`~manim.animation.transform.ApplyMethod`, no target copy is created. The points of all targets are gathered into a single array when the animation begins and every frame applies one vectorized translation to it.
+
+    Parameters
+    ----------
+    mobject
+        Specifies the mobject the animation is attached to.
+    vector
+        Specifies the translation vector.
+    targets
+        Specifies the mobjects to translate. Defaults to `mobject`.
+    path_arc
+        Specifies the angle of the arc along which the targets travel.
+    **kwargs
+        Forwarded to constructor of the parent.
+
+    Attributes
+    ----------
+    __vector : :class:`np.ndarray`
+        The translation vector.
+    __targets : :class:`~typing.List`\0[:class:`~manim.mobject.mobject.Mobject`]
+        The mobjects to translate.
+    __path_func : :data:`~typing.Callable`
+        The path function along the arc, `None` for a straight path.
+    __mobs : :class:`~typing.List`\0[:class:`~manim.mobject.mobject.Mobject`]
+        The family members of :attr:`__targets` that have points.
+    __sizes : :class:`~typing.List`\0[:class:`int`]
+        The number of points of each mobject in :attr:`__mobs`.
+    __start_points : :class:`np.ndarray`
+        The points of all mobjects in :attr:`__mobs` when the animation begins.
+    """
+
+    def __init__(
+        self,
+        mobject: Mobject,
+        vector: np.ndarray,
+        targets: typing.List[Mobject] = None,
+        path_arc: float = 0,
+        **kwargs
+    ) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        mobject
+            Specifies the mobject the animation is attached to.
+        vector
+            Specifies the translation vector.
+        targets
+            Specifies the mobjects to translate. Defaults to `mobject`.
+        path_arc
+            Specifies the angle of the arc along which the targets travel.
+        **kwargs
+            Forwarded to constructor of the parent.
+        """
+
+        self.__vector: np.ndarray = np.array(vector, dtype=float)
+        self.__targets: typing.List[Mobject] = (
+            [mobject] if targets is None else list(targets)
+        )
+        self.__path_func: typing.Callable = (
+            path_along_arc(path_arc) if path_arc else None
+        )
+        self.__mobs: typing.List[Mobject] = []
+        self.__sizes: typing.List[int] = []
+        self.__start_points: np.ndarray = np.zeros((0, 3))
+        super().__init__(mobject, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        """Skips copying the mobject, since start points are stored instead.
+
+        Returns
+        -------
+        :class:`~manim.mobject.mobject.Mobject`
+            The mobject itself.
+        """
+
+        return self.mobject
+
+    def begin(self) -> None:
+        """Gathers the points of the targets before the animation begins."""
+
+        mobs = []
+        for target in self.__targets:
+            mobs.extend(target.family_members_with_points())
+        self.__mobs = list(dict.fromkeys(mobs))
+        self.__sizes = [len(mob.points) for mob in self.__mobs]
+        if len(self.__mobs):
+            self.__start_points = np.concatenate(
+                [np.asarray(mob.points, dtype=float) for mob in self.__mobs]
+            )
+
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        """Translates the targets to the position for the specified progress.
+
+        Parameters
+        ----------
+        alpha
+            Specifies the progress of the animation.
+        """
+
+        if not len(self.__mobs):
+            return
+
+        alpha = self.rate_func(alpha)
+        if self.__path_func is None:
+            points = self.__start_points + alpha * self.__vector
+        else:
+            points = self.__path_func(
+                self.__start_points, self.__start_points + self.__vector, alpha
+            )
+
+        start = 0
+        for mob, size in zip(self.__mobs, self.__sizes):
+            mob.points = points[start : start + size]
+            start += size
+
+
+class MStretch(Animation):
+    """An animation that stretches mobjects along an axis without copying them.
+
+    The targets are stretched until their bounding box has the specified length along `dim`. The bounding box edge specified by `aligned_edge` stays fixed, or is moved to `point` if specified.
+
+    Parameters
+    ----------
+    mobject
+        Specifies the mobject the animation is attached to.
+    length
+        Specifies the length of the targets along `dim` at the end of the animation.
+    dim
+        Specifies the axis along which the targets are stretched.
+    point
+        Specifies where the `aligned_edge` of the targets ends up.
+    aligned_edge
+        Specifies the edge of the bounding box of the targets that is aligned with `point`.
+    targets
+        Specifies the mobjects to stretch. Defaults to `mobject`.
+    **kwargs
+        Forwarded to constructor of the parent.
+
+    Attributes
+    ----------
+    __length : :class:`float`
+        The length of the targets along :attr:`__dim` at the end of the animation.
+    __dim : :class:`int`
+        The axis along which the targets are stretched.
+    __point : :class:`np.ndarray`
+        Where the :attr:`__aligned_edge` of the targets ends up.
+    __aligned_edge : :class:`np.ndarray`
+        The edge of the bounding box of the targets that is aligned with :attr:`__point`.
+    __targets : :class:`~typing.List`\0[:class:`~manim.mobject.mobject.Mobject`]
+        The mobjects to stretch.
+    __mobs : :class:`~typing.List`\0[:class:`~manim.mobject.mobject.Mobject`]
+        The family members of :attr:`__targets` that have points.
+    __sizes : :class:`~typing.List`\0[:class:`int`]
+        The number of points of each mobject in :attr:`__mobs`.
+    __start_points : :class:`np.ndarray`
+        The points of all mobjects in :attr:`__mobs` when the animation begins.
+    __delta_points : :class:`np.ndarray`
+        The displacement of every point in :attr:`__start_points` at the end of the animation.
+    """
+
+    def __init__(
+        self,
+        mobject: Mobject,
+        length: float,
+        dim: int = 0,
+        point: np.ndarray = None,
+        aligned_edge: np.ndarray = ORIGIN,
+        targets: typing.List[Mobject] = None,
+        **kwargs
+    ) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        mobject
+            Specifies the mobject the animation is attached to.
+        length
+            Specifies the length of the targets along `dim` at the end of the animation.
+        dim
+            Specifies the axis along which the targets are stretched.
+        point
+            Specifies where the `aligned_edge` of the targets ends up.
+        aligned_edge
+            Specifies the edge of the bounding box of the targets that is aligned with `point`.
+        targets
+            Specifies the mobjects to stretch. Defaults to `mobject`.
+        **kwargs
+            Forwarded to constructor of the parent.
+        """
+
+        self.__length: float = length
+        self.__dim: int = dim
+        self.__point: np.ndarray = None if point is None else np.array(point)
+        self.__aligned_edge: np.ndarray = np.array(aligned_edge)
+        self.__targets: typing.List[Mobject] = (
+            [mobject] if targets is None else list(targets)
+        )
+        self.__mobs: typing.List[Mobject] = []
+        self.__sizes: typing.List[int] = []
+        self.__start_points: np.ndarray = np.zeros((0, 3))
+        self.__delta_points: np.ndarray = np.zeros((0, 3))
+        super().__init__(mobject, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        """Skips copying the mobject, since start points are stored instead.
+
+        Returns
+        -------
+        :class:`~manim.mobject.mobject.Mobject`
+            The mobject itself.
+        """
+
+        return self.mobject
+
+    def begin(self) -> None:
+        """Gathers the points of the targets and computes where they end up."""
+
+        mobs = []
+        for target in self.__targets:
+            mobs.extend(target.family_members_with_points())
+        self.__mobs = list(dict.fromkeys(mobs))
+        self.__sizes = [len(mob.points) for mob in self.__mobs]
+
+        if len(self.__mobs):
+            self.__start_points = np.concatenate(
+                [np.asarray(mob.points, dtype=float) for mob in self.__mobs]
+            )
+
+            min_np = self.__start_points.min(axis=0)
+            max_np = self.__start_points.max(axis=0)
+            about_np = (min_np + max_np) / 2 + np.sign(self.__aligned_edge) * (
+                (max_np - min_np) / 2
+            )
+
+            scale_np = np.ones(3)
+            current_length = max_np[self.__dim] - min_np[self.__dim]
+            if current_length:
+                scale_np[self.__dim] = self.__length / current_length
+
+            end_points = about_np + (self.__start_points - about_np) * scale_np
+            if self.__point is not None:
+                end_points += self.__point - about_np
+            self.__delta_points = end_points - self.__start_points
+
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        """Stretches the targets to the shape for the specified progress.
+
+        Parameters
+        ----------
+        alpha
+            Specifies the progress of the animation.
+        """
+
+        if not len(self.__mobs):
+            return
+
+        points = self.__start_points + self.rate_func(alpha) * self.__delta_points
+
+        start = 0
+        for mob, size in zip(self.__mobs, self.__sizes):
+            mob.points = points[start : start + size]
+            start += size
@@ -1,11 +1,17 @@
 """Contains classes to construct an array."""
 
+from contextlib import contextmanager
 from copy import deepcopy
+from itertools import islice
 
 import numpy as np
 from manim import *
 
-from .m_enum import MArrayDirection, MArrayElementComp
+from .m_animation import MStretch, MTranslate
+from .m_cache import MElementPool, text_cache
+from .m_enum import MArrayDirection, MArrayElementComp, MArrayEvent
+from .m_layout import MArrayLayout
+from .m_stats import stats
 
 
 class MArrayElement(VGroup):
@@ -35,6 +41,8 @@ class MArrayElement(VGroup):
         Specifies the placement for :attr:`__mob_square` w.r.t another :class:`MArrayElement`.
     next_to_dir
         Specifies the direction of placement for :attr:`__mob_square` w.r.t another :class:`MArrayElement`.
+    numeric_glyphs
+        If `True`, numeric values and indices are composed from the glyph atlas of :data:`~.m_cache.text_cache`, so their mobjects are :class:`~manim.mobject.types.vectorized_mobject.VGroup`\0s of glyphs instead of :class:`~manim.mobject.text.text_mobject.Text`\0s.
 
     Attributes
     ----------
@@ -56,16 +64,38 @@ class MArrayElement(VGroup):
         The position of :attr:`__mob_label` w.r.t :attr:`__mob_square`.
     __label_gap : :class:`float`
         The distance between :attr:`__mob_label` and :attr:`__mob_square`.
+    __numeric_glyphs : :class:`bool`
+        If `True`, numeric values and indices are composed from the glyph atlas of :data:`~.m_cache.text_cache`.
     __mob_square : :class:`~manim.mobject.geometry.polygram.Square`
         Represents the body of the element.
-    __mob_value : :class:`~manim.mobject.text.text_mobject.Text`
-        Represents the value of the element.
-    __mob_index : :class:`~manim.mobject.text.text_mobject.Text`
-        Represents the index of the element.
+    __mob_value : :class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`
+        Represents the value of the element, a :class:`~manim.mobject.types.vectorized_mobject.VGroup` of glyphs if composed from the glyph atlas.
+    __mob_index : :class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`
+        Represents the index of the element. `None` until the index is non-empty or fetched.
     __mob_label : :class:`~manim.mobject.text.text_mobject.Text`
-        Represents the label of the element.
+        Represents the label of the element. `None` until the label is non-empty or fetched.
     """
 
+    __comp_attr_map = {
+        MArrayElementComp.BODY: (
+            "_MArrayElement__mob_square",
+            "_MArrayElement__mob_square_props",
+        ),
+        MArrayElementComp.VALUE: (
+            "_MArrayElement__mob_value",
+            "_MArrayElement__mob_value_props",
+        ),
+        MArrayElementComp.INDEX: (
+            "_MArrayElement__mob_index",
+            "_MArrayElement__mob_index_props",
+        ),
+        MArrayElementComp.LABEL: (
+            "_MArrayElement__mob_label",
+            "_MArrayElement__mob_label_props",
+        ),
+    }
+    """Maps :class:`~.m_enum.MArrayElementComp` to the names of the mobject and properties attributes."""
+
     def __init_props(
         self,
         scene: Scene,
@@ -73,6 +103,7 @@ class MArrayElement(VGroup):
         index_gap: float,
         label_pos: np.ndarray,
         label_gap: float,
+        numeric_glyphs: bool,
     ) -> None:
         """Initializes the attributes for the class.
 
@@ -88,6 +119,8 @@ class MArrayElement(VGroup):
             Specifies the position of :attr:`__mob_label` w.r.t :attr:`__mob_square`.
         label_gap
             Specifies the distance between :attr:`__mob_label` and :attr:`__mob_square`.
+        numeric_glyphs
+            If `True`, numeric values and indices are composed from the glyph atlas of :data:`~.m_cache.text_cache`.
         """
 
         self.__mob_square_props: dict = {
@@ -104,6 +137,7 @@ class MArrayElement(VGroup):
         self.__index_gap: float = index_gap
         self.__label_pos: np.ndarray = label_pos
         self.__label_gap: float = label_gap
+        self.__numeric_glyphs: bool = numeric_glyphs
 
     def __update_props(
         self,
@@ -148,9 +182,12 @@ class MArrayElement(VGroup):
         init_label: bool = False,
         next_to_mob: "MArrayElement" = None,
         next_to_dir: np.ndarray = RIGHT,
+        force_init: bool = False,
     ) -> None:
         """Initializes the mobjects for the class.
 
+        Index and label mobjects are only instantiated when their text is non-empty, unless `force_init` is `True`.
+
         Parameters
         ----------
         init_square
@@ -165,38 +202,50 @@ class MArrayElement(VGroup):
             Specifies placement for :attr:`__mob_square` w.r.t another :class:`MArrayElement`.
         next_to_dir
             Specifies direction of placement for :attr:`__mob_square` w.r.t another :class:`MArrayElement`.
+        force_init
+            If `True`, instantiates index and label mobjects even if their text is empty.
         """
 
         if init_square:
             self.__mob_square: Square = Square(**self.__mob_square_props)
+            stats.count("Square")
             if next_to_mob is not None:
                 self.__mob_square.next_to(
                     next_to_mob.fetch_mob_square(), next_to_dir, 0
                 )
             self.add(self.__mob_square)
 
+        fetch_text = (
+            text_cache.fetch_numeric if self.__numeric_glyphs else text_cache.fetch
+        )
+
         if init_value:
-            self.__mob_value: Text = Text(**self.__mob_value_props)
+            self.__mob_value: VMobject = fetch_text(**self.__mob_value_props)
             self.__mob_value.next_to(self.__mob_square, np.array([0, 0, 0]), 0)
             self.add(self.__mob_value)
 
         if init_index:
-            self.__mob_index: Text = Text(**self.__mob_index_props)
-            self.__mob_index.next_to(
-                self.__mob_square, self.__index_pos, self.__index_gap
-            )
-            self.add(self.__mob_index)
+            self.__mob_index: VMobject = None
+            if self.__mob_index_props["text"] or force_init:
+                self.__mob_index = fetch_text(**self.__mob_index_props)
+                self.__mob_index.next_to(
+                    self.__mob_square, self.__index_pos, self.__index_gap
+                )
+                self.add(self.__mob_index)
 
         if init_label:
-            self.__mob_label: Text = Text(**self.__mob_label_props)
-            self.__mob_label.next_to(
-                self.__mob_square, self.__label_pos, self.__label_gap
-            )
-            self.add(self.__mob_label)
+            self.__mob_label: Text = None
+            if self.__mob_label_props["text"] or force_init:
+                self.__mob_label = text_cache.fetch(**self.__mob_label_props)
+                self.__mob_label.next_to(
+                    self.__mob_square, self.__label_pos, self.__label_gap
+                )
+                self.add(self.__mob_label)
 
     def __deepcopy__(self, memo):
         """Deepcopy that excludes attributes specified in `exclude_list`."""
 
+        stats.count("deepcopy")
         exclude_list = ["_MArrayElement__scene"]
 
         cls = self.__class__
@@ -220,6 +269,7 @@ class MArrayElement(VGroup):
         label_gap: float = 0.5,
         next_to_mob: "MArrayElement" = None,
         next_to_dir: np.ndarray = RIGHT,
+        numeric_glyphs: bool = False,
         **kwargs
     ) -> None:
         """Initializes the class.
@@ -248,12 +298,16 @@ class MArrayElement(VGroup):
             Specifies the placement for :attr:`__mob_square` w.r.t another :class:`MArrayElement`.
         next_to_dir
             Specifies the direction of placement for :attr:`__mob_square` w.r.t another :class:`MArrayElement`.
+        numeric_glyphs
+            If `True`, numeric values and indices are composed from the glyph atlas of :data:`~.m_cache.text_cache`.
         """
 
         super().__init__(**kwargs)
 
         # Initialize props
-        self.__init_props(scene, index_pos, index_gap, label_pos, label_gap)
+        self.__init_props(
+            scene, index_pos, index_gap, label_pos, label_gap, numeric_glyphs
+        )
 
         # Update props
         self.__update_props(
@@ -274,30 +328,33 @@ class MArrayElement(VGroup):
 
         return self.__mob_square
 
-    def fetch_mob_value(self) -> Text:
+    def fetch_mob_value(self) -> VMobject:
         """Fetches the value mobject.
 
         Returns
         -------
-        :class:`~manim.mobject.text.text_mobject.Text`
+        :class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`
             :attr:`__mob_value`.
         """
 
         return self.__mob_value
 
-    def fetch_mob_index(self) -> Text:
-        """Fetches the index mobject.
+    def fetch_mob_index(self) -> VMobject:
+        """Fetches the index mobject. An empty index mobject is instantiated if none exists.
 
         Returns
         -------
-        :class:`~manim.mobject.text.text_mobject.Text`
+        :class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`
             :attr:`__mob_index`.
         """
 
+        if self.__mob_index is None:
+            self.__init_mobs(init_index=True, force_init=True)
+
         return self.__mob_index
 
     def fetch_mob_label(self) -> Text:
-        """Fetches the label mobject.
+        """Fetches the label mobject. An empty label mobject is instantiated if none exists.
 
         Returns
         -------
@@ -305,8 +362,33 @@ class MArrayElement(VGroup):
             :attr:`__mob_label`.
         """
 
+        if self.__mob_label is None:
+            self.__init_mobs(init_label=True, force_init=True)
+
         return self.__mob_label
 
+    def has_mob_index(self) -> bool:
+        """Checks whether the index mobject is instantiated.
+
+        Returns
+        -------
+        :class:`bool`
+            `True` if :attr:`__mob_index` is instantiated.
+        """
+
+        return self.__mob_index is not None
+
+    def has_mob_label(self) -> bool:
+        """Checks whether the label mobject is instantiated.
+
+        Returns
+        -------
+        :class:`bool`
+            `True` if :attr:`__mob_label` is instantiated.
+        """
+
+        return self.__mob_label is not None
+
     def fetch_mob(self, mob_target: MArrayElementComp) -> Mobject:
         """Fetches the mobject based on the specified enum.
 
@@ -339,7 +421,7 @@ class MArrayElement(VGroup):
         update_anim_args: dict = {},
         play_anim: bool = True,
         play_anim_args: dict = {},
-    ) -> Text:
+    ) -> VMobject:
         """Re-intializes the value mobject.
 
         Parameters
@@ -357,7 +439,7 @@ class MArrayElement(VGroup):
 
         Returns
         -------
-        :class:`~manim.mobject.text.text_mobject.Text`
+        :class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`
             Updated :attr:`__mob_value`.
         """
 
@@ -375,8 +457,10 @@ class MArrayElement(VGroup):
 
         # Animate change
         if play_anim:
-            self.__scene.play(
-                update_anim(self.__mob_value, **update_anim_args), **play_anim_args
+            stats.play(
+                self.__scene,
+                update_anim(self.__mob_value, **update_anim_args),
+                **play_anim_args
             )
 
         return self.__mob_value
@@ -388,8 +472,8 @@ class MArrayElement(VGroup):
         update_anim_args: dict = {},
         play_anim: bool = True,
         play_anim_args: dict = {},
-    ) -> Text:
-        """Re-intializes the index mobject.
+    ) -> VMobject:
+        """Re-intializes the index mobject. An empty index mobject is instantiated if the index is empty, as in :meth:`fetch_mob_index`.
 
         Parameters
         ----------
@@ -406,7 +490,7 @@ class MArrayElement(VGroup):
 
         Returns
         -------
-        :class:`~manim.mobject.text.text_mobject.Text`
+        :class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`
             Updated :attr:`__mob_index`.
         """
 
@@ -414,18 +498,18 @@ class MArrayElement(VGroup):
         self.__update_props(mob_index_args=mob_index_args)
 
         # Remove current mob_index
-        self.remove(self.__mob_index)
+        if self.__mob_index is not None:
+            self.remove(self.__mob_index)
 
         # Initialize new mob_index
-        self.__init_mobs(init_index=True)
-
-        # Add new mob_index to group
-        self.add(self.__mob_index)
+        self.__init_mobs(init_index=True, force_init=True)
 
         # Animate change
         if play_anim:
-            self.__scene.play(
-                update_anim(self.__mob_index, **update_anim_args), **play_anim_args
+            stats.play(
+                self.__scene,
+                update_anim(self.__mob_index, **update_anim_args),
+                **play_anim_args
             )
 
         return self.__mob_index
@@ -438,7 +522,7 @@ class MArrayElement(VGroup):
         play_anim: bool = True,
         play_anim_args: dict = {},
     ) -> Text:
-        """Re-intializes the label mobject.
+        """Re-intializes the label mobject. An empty label mobject is instantiated if the label is empty, as in :meth:`fetch_mob_label`.
 
         Parameters
         ----------
@@ -463,22 +547,111 @@ class MArrayElement(VGroup):
         self.__update_props(mob_label_args=mob_label_args)
 
         # Remove current mob_label
-        self.remove(self.__mob_label)
+        if self.__mob_label is not None:
+            self.remove(self.__mob_label)
 
         # Initialize new mob_label
-        self.__init_mobs(init_label=True)
-
-        # Add new mob_label to group
-        self.add(self.__mob_label)
+        self.__init_mobs(init_label=True, force_init=True)
 
         # Animate change
         if play_anim:
-            self.__scene.play(
-                update_anim(self.__mob_label, **update_anim_args), **play_anim_args
+            stats.play(
+                self.__scene,
+                update_anim(self.__mob_label, **update_anim_args),
+                **play_anim_args
             )
 
         return self.__mob_label
 
+    def exchange_mob(
+        self, other: "MArrayElement", mob_target: MArrayElementComp
+    ) -> None:
+        """Exchanges the specified component mobject, along with its properties, with another element.
+
+        The mobjects keep their positions, no mobject is instantiated.
+
+        Parameters
+        ----------
+        other
+            Specifies the element to exchange the component mobject with.
+        mob_target
+            Specifies the component mobject to exchange.
+        """
+
+        (mob_attr, props_attr) = self.__comp_attr_map[mob_target]
+
+        mob = getattr(self, mob_attr)
+        other_mob = getattr(other, mob_attr)
+        if mob is not None:
+            self.remove(mob)
+        if other_mob is not None:
+            other.remove(other_mob)
+
+        setattr(self, mob_attr, other_mob)
+        setattr(other, mob_attr, mob)
+        props = getattr(self, props_attr)
+        setattr(self, props_attr, getattr(other, props_attr))
+        setattr(other, props_attr, props)
+
+        # The body is kept behind the other components
+        for group, group_mob in ((self, other_mob), (other, mob)):
+            if group_mob is None:
+                continue
+            if mob_target == MArrayElementComp.BODY:
+                group.add_to_back(group_mob)
+            else:
+                group.add(group_mob)
+
+    def reset(
+        self,
+        mob_square_args: dict = {},
+        mob_value_args: dict = {},
+        mob_index_args: dict = {},
+        index_pos: np.ndarray = UP,
+        pool: MElementPool = None,
+    ) -> None:
+        """Resets the element to the state of a newly constructed one at the origin, reusing its body.
+
+        Parameters
+        ----------
+        mob_square_args
+            Arguments for :class:`~manim.mobject.geometry.polygram.Square` that represents the element body.
+        mob_value_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the element value.
+        mob_index_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the element index.
+        index_pos
+            Specifies the position of :attr:`__mob_index` w.r.t :attr:`__mob_square`
+        pool
+            Specifies the :class:`~.m_cache.MElementPool` whose :class:`~manim.mobject.geometry.polygram.Square` prototype is copied onto :attr:`__mob_square`. If `None`, a new prototype is instantiated.
+        """
+
+        # Reset props
+        self.__init_props(
+            self.__scene,
+            index_pos,
+            self.__index_gap,
+            self.__label_pos,
+            self.__label_gap,
+            self.__numeric_glyphs,
+        )
+        self.__update_props(mob_square_args, mob_value_args, mob_index_args)
+
+        # Restore the body in place, so its points and style are those of a new square
+        self.remove(*self.submobjects)
+        if pool is None:
+            mob_square = Square(**self.__mob_square_props)
+            stats.count("Square")
+        else:
+            mob_square = pool.fetch_square(**self.__mob_square_props)
+        self.__mob_square.become(mob_square)
+        if self.__mob_square.side_length != mob_square.side_length:
+            self.__mob_square.side_length = mob_square.side_length
+        self.add(self.__mob_square)
+
+        # Fetch the other components from the text cache
+        self.__init_mobs(init_value=True, init_index=True, init_label=True)
+
     def animate_mob_square(self) -> "_AnimationBuilder":  # type: ignore
         """Invokes the animate property over square mobject.
 
@@ -510,7 +683,7 @@ class MArrayElement(VGroup):
             Animate property of :attr:`__mob_index`.
         """
 
-        return self.__mob_index.animate
+        return self.fetch_mob_index().animate
 
     def animate_mob_label(self) -> "_AnimationBuilder":  # type: ignore
         """Invokes the animate property over label mobject.
@@ -521,7 +694,7 @@ class MArrayElement(VGroup):
             Animate property of :attr:`__mob_label`.
         """
 
-        return self.__mob_label.animate
+        return self.fetch_mob_label().animate
 
 
 class MArray(VGroup):
@@ -543,12 +716,20 @@ class MArray(VGroup):
         If `True`, displays indices in hex.
     hide_index
         If `True`, doesn't display indices.
+    index_rail
+        If `True`, indices belong to the slots of the array instead of its elements.
+    numeric_glyphs
+        If `True`, numeric values and indices are composed from the glyph atlas of :data:`~.m_cache.text_cache`, so their mobjects are :class:`~manim.mobject.types.vectorized_mobject.VGroup`\0s of glyphs instead of :class:`~manim.mobject.text.text_mobject.Text`\0s.
+    pool_size
+        Specifies the maximum number of removed elements kept for reuse by later appends and insertions.
     arr_dir
         Specifies the growth direction of the array.
     arr_label_pos
         Specifies the position of :attr:`__mob_arr_label` w.r.t :attr:`__mob_arr`.
     arr_label_gap
         Specifies the distance between :attr:`__mob_arr_label` and :attr:`__mob_arr`.
+    fmt
+        Specifies the printf-style format of the values.
     mob_arr_label_args
         Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the array label.
     mob_square_args
@@ -564,8 +745,10 @@ class MArray(VGroup):
     ----------
     __scene : :class:`~manim.scene.scene.Scene`
         The scene where the object is to be rendered.
-    __arr : :class:`list`
-        The array to represent.
+    __arr : :class:`list` | :class:`np.ndarray`
+        The array to represent. A NumPy array is converted to a list once an element is added or removed, or a value can't be cast to its dtype without loss.
+    __fmt : :class:`str`
+        The printf-style format of the values, `None` to display values as they are.
     __label : :class:`str`
         The value of the array label.
     __index_offset : :class:`int`
@@ -576,6 +759,12 @@ class MArray(VGroup):
         If `True`, displays indices in hex.
     __hide_index : :class:`bool`
         If `True`, doesn't display indices.
+    __index_rail : :class:`bool`
+        If `True`, indices belong to the slots of the array instead of its elements.
+    __numeric_glyphs : :class:`bool`
+        If `True`, numeric values and indices are composed from the glyph atlas of :data:`~.m_cache.text_cache`.
+    __pool : :class:`~.m_cache.MElementPool`
+        Holds removed elements for reuse by later appends and insertions.
     __arr_dir : :class:`~.m_enum.MArrayDirection`
         The growth direction of the array.
     __arr_label_pos : :class:`~.m_enum.MArrayDirection`
@@ -584,10 +773,38 @@ class MArray(VGroup):
         The distance between :attr:`__mob_arr_label` and :attr:`__mob_arr`.
     __mob_arr_label_props : :class:`dict`
         Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the array label.
+    __mob_index_props : :class:`dict`
+        Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents a rail index.
     __mob_arr : :class:`~typing.List`\0[:class:`MArrayElement`]
         Represents the array.
+    __layout : :class:`~.m_layout.MArrayLayout`
+        Computes the geometry of the array from the `side_length`\0s of the elements in :attr:`__mob_arr`.
+    __dirty_elems : :class:`~typing.List`\0[:class:`MArrayElement`]
+        Elements that may be resized by animations, measured again whenever :attr:`__layout` is used until the next append, insertion or removal.
+    __geometry_version : :class:`int`
+        Incremented whenever the array is moved, transformed or changed. See :meth:`fetch_geometry_version`.
+    __move_pending : :class:`bool`
+        If `True`, the array was moved since the subscribers were last notified of :attr:`~.m_enum.MArrayEvent.MOVE`.
     __mob_arr_label : :class:`~manim.mobject.text.text_mobject.Text`
         Represents the array label.
+    __mob_rail : :class:`~typing.List`\0[:class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`]
+        Represents the index of each slot when :attr:`__index_rail` is `True`.
+    __batch_anims : :class:`~typing.List`\0[:class:`~typing.Tuple`\0[Any, :class:`~manim.animation.animation.Animation`]]
+        Keyed animations queued by the open batch, `None` if no batch is open.
+    __batch_play_args : :class:`dict`
+        Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>` used when the batch is flushed.
+    __batch_lag_ratio : :class:`float`
+        Lag ratio of the :class:`~manim.animation.composition.AnimationGroup` played when the batch is flushed.
+    __batch_label_shift : :class:`np.ndarray`
+        Accumulated shift of :attr:`__mob_arr_label` queued by the open batch.
+    __batch_settle : :class:`bool`
+        If `True`, the queued animations move existing elements and must be played before any further operation.
+    __batch_swapped : :class:`~typing.Set`\0[:class:`int`]
+        Indices of the elements whose mobjects are moved by swaps queued by the open batch.
+    __batch_removed : :class:`~typing.List`\0[:class:`MArrayElement`]
+        Elements removed by the open batch, released into :attr:`__pool` once the batch is flushed.
+    __subscribers : :class:`~typing.List`\0[:data:`~typing.Callable`\0[[:class:`~.m_enum.MArrayEvent`, :class:`int`], :class:`~typing.List`\0[:class:`~manim.animation.animation.Animation`]]]
+        Callbacks notified of every change to the array, e.g. by attached pointers and sliding windows.
     """
 
     __dir_map = [
@@ -622,57 +839,171 @@ class MArray(VGroup):
         ):
             raise Exception("Index out of bounds!")
 
-        total_len = 0
-        for i in range(index_start, index_end + 1):
-            total_len += self.__mob_arr[i].fetch_mob_square().side_length
-        return total_len
+        self.__sync_layout()
+        return self.__layout.calc_elems_len(index_start, index_end)
 
-    def __calc_label_pos_and_mob(self) -> typing.Tuple[Square, np.ndarray]:
-        """Calculates the position of the array label relative to one of the element's square mobjects.
+    def __calc_half_np(self, mob: Mobject) -> np.ndarray:
+        """Calculates the half dimensions of the specified mobject.
+
+        Parameters
+        ----------
+        mob
+            Specifies the mobject.
 
         Returns
         -------
-        :class:`~manim.mobject.geometry.polygram.Square`
-            Square mobject next to which the array label is positioned.
         :class:`np.ndarray`
-            The relative position of the array label.
+            Half of the width and height of `mob`.
         """
 
-        # Label position is parallel to array growth direction
-        if np.array_equal(
-            self.__dir_map[self.__arr_label_pos.value]["arr"],
-            self.__dir_map[self.__arr_dir.value]["arr"],
-        ):
-            return (
-                self.__mob_arr[-1].fetch_mob_square(),
-                self.__dir_map[self.__arr_label_pos.value]["arr"],
-            )
-        elif np.array_equal(
-            self.__dir_map[self.__arr_label_pos.value]["arr"],
-            -self.__dir_map[self.__arr_dir.value]["arr"],
-        ):
-            return (
-                self.__mob_arr[0].fetch_mob_square(),
-                self.__dir_map[self.__arr_label_pos.value]["arr"],
-            )
+        return np.array([mob.get_width() / 2, mob.get_height() / 2, 0])
 
-        # Label position is perpendicular to array growth direction
-        else:
-            middle_index = len_before = len_after = 0
-            if len(self.__mob_arr) > 1:
-                odd_indices = len(self.__mob_arr) % 2 == 1
-                middle_index = int(len(self.__mob_arr) / 2)
-                len_before = self.__sum_elem_len(0, middle_index - 1)
-                len_after = self.__sum_elem_len(
-                    middle_index + 1 if odd_indices else middle_index,
-                    len(self.__mob_arr) - 1,
+    def __calc_side_length(self, mob: MArrayElement) -> float:
+        """Calculates the current length of an element along the growth direction of the array.
+
+        The `side_length` of a :class:`~manim.mobject.geometry.polygram.Square` is fixed at construction, so the length is measured from its points instead to account for scaling.
+
+        Parameters
+        ----------
+        mob
+            Specifies the element.
+
+        Returns
+        -------
+        :class:`float`
+            Length of the square of `mob` along :attr:`__arr_dir`.
+        """
+
+        dim = 0 if self.__layout.fetch_dir_np()[0] else 1
+        return mob.fetch_mob_square().length_over_dim(dim)
+
+    def __sync_layout(self, clear_dirty: bool = False) -> None:
+        """Moves :attr:`__layout` to where the first element currently begins, since the array may have been moved by animations, and notifies the subscribers of the coalesced changes.
+
+        Elements marked in :attr:`__dirty_elems`, e.g. by :meth:`animate_elem`, are measured again. If the first element no longer has the length held by :attr:`__layout`, the whole array was transformed, e.g. scaled, and the lengths of all elements are measured again. The subscribers are notified of a pending :attr:`~.m_enum.MArrayEvent.MOVE` and of every changed length with :attr:`~.m_enum.MArrayEvent.RESIZE`.
+
+        Parameters
+        ----------
+        clear_dirty
+            If `True`, the elements marked in :attr:`__dirty_elems` are considered settled once measured.
+        """
+
+        resized = []
+        if len(self.__mob_arr):
+            tree = self.__layout.fetch_tree()
+            if not np.isclose(
+                self.__calc_side_length(self.__mob_arr[0]), tree.fetch_value(0)
+            ):
+                self.__layout.update_side_lengths(
+                    [self.__calc_side_length(mob) for mob in self.__mob_arr]
                 )
-            return (
-                self.__mob_arr[middle_index].fetch_mob_square(),
-                self.__dir_map[self.__arr_label_pos.value]["arr"]
-                + self.__dir_map[self.__arr_dir.value]["arr"]
-                * ((len_after - len_before) / 2),
+                resized.append(None)
+            elif len(self.__dirty_elems):
+                dirty_ids = {id(mob) for mob in self.__dirty_elems}
+                for i, mob in enumerate(self.__mob_arr):
+                    if id(mob) not in dirty_ids:
+                        continue
+                    side_length = self.__calc_side_length(mob)
+                    if not np.isclose(side_length, tree.fetch_value(i)):
+                        self.__layout.update_side_length(i, side_length)
+                        resized.append(i)
+
+            square = self.__mob_arr[0].fetch_mob_square()
+            self.__layout.set_start(
+                square.get_center()
+                - self.__layout.fetch_dir_np()
+                * (self.__calc_side_length(self.__mob_arr[0]) / 2)
+            )
+
+        if clear_dirty:
+            self.__dirty_elems = []
+
+        # Notify once the layout is consistent, since subscribers may read it
+        if self.__move_pending:
+            self.__move_pending = False
+            self.__emit(MArrayEvent.MOVE)
+        for index in resized:
+            self.__emit(MArrayEvent.RESIZE, index)
+
+    def __detach_arr(self) -> None:
+        """Converts :attr:`__arr` to a list if it is a NumPy array, since its length is about to change."""
+
+        if isinstance(self.__arr, np.ndarray):
+            self.__arr = self.__arr.tolist()
+
+    def __write_arr(self, index: int, value: Any) -> None:
+        """Writes a value to :attr:`__arr`.
+
+        A NumPy array keeps the value cast to its dtype. If the value can't be cast to it without loss, :attr:`__arr` is converted to a list first, so it never holds a different value than the one displayed.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element.
+        value
+            Specifies the value to write.
+        """
+
+        if isinstance(self.__arr, np.ndarray):
+            try:
+                cast_value = self.__arr.dtype.type(value)
+                lossless = bool(cast_value == value)
+            except (TypeError, ValueError, OverflowError):
+                lossless = False
+
+            if lossless:
+                self.__arr[index] = cast_value
+                return
+            self.__detach_arr()
+
+        self.__arr[index] = value
+
+    def __calc_value_text(self, value: Any) -> Any:
+        """Calculates the text that displays a value, formatted with :attr:`__fmt` if set.
+
+        Parameters
+        ----------
+        value
+            Specifies the value.
+
+        Returns
+        -------
+        Any
+            The formatted value, or `value` itself if no format is set or it doesn't apply to `value`.
+        """
+
+        if self.__fmt is None:
+            return value
+
+        try:
+            return self.__fmt % value
+        except (TypeError, ValueError):
+            return value
+
+    def __calc_value_texts(self, values: typing.Iterable) -> list:
+        """Calculates the texts that display the values.
+
+        A NumPy array is formatted with :attr:`__fmt` in one vectorized pass and identical texts are shared, so each distinct value is rendered once.
+
+        Parameters
+        ----------
+        values
+            Specifies the values.
+
+        Returns
+        -------
+        :class:`list`
+            The formatted values.
+        """
+
+        if self.__fmt is not None and isinstance(values, np.ndarray):
+            (labels, inverse) = np.unique(
+                np.char.mod(self.__fmt, values), return_inverse=True
             )
+            labels = labels.tolist()
+            return [labels[i] for i in inverse.tolist()]
+
+        return [self.__calc_value_text(value) for value in values]
 
     def __calc_index(self, index: int) -> typing.Union[int, str]:
         """Calculates the displayable index of the specified element based on attributes set at initialization.
@@ -698,6 +1029,67 @@ class MArray(VGroup):
             )
         )
 
+    def __calc_elem_index(self, index: int) -> typing.Union[int, str]:
+        """Calculates the index displayed by the element itself, which is empty when indices belong to the index rail.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element.
+
+        Returns
+        -------
+        :data:`~typing.Union`\0[:class:`int`, :class:`str`]
+            Displayable index of the element.
+        """
+
+        return "" if self.__index_rail else self.__calc_index(index)
+
+    def __fetch_index_text(self, mob_index_props: dict) -> VMobject:
+        """Fetches a rail index mobject, composed from the glyph atlas if :attr:`__numeric_glyphs` is `True`.
+
+        Parameters
+        ----------
+        mob_index_props
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the rail index.
+
+        Returns
+        -------
+        :class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`
+            Rail index mobject.
+        """
+
+        if self.__numeric_glyphs:
+            return text_cache.fetch_numeric(**mob_index_props)
+        return text_cache.fetch(**mob_index_props)
+
+    def __extend_rail(self) -> typing.List[VMobject]:
+        """Instantiates the rail indices of all slots that don't have one yet.
+
+        Existing rail indices are left untouched.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`]
+            The new rail indices.
+        """
+
+        if not self.__index_rail or self.__hide_index:
+            return []
+
+        new_mobs = []
+        for i in range(len(self.__mob_rail), len(self.__mob_arr)):
+            self.__mob_index_props["text"] = str(self.__calc_index(i))
+            mob = self.__fetch_index_text(self.__mob_index_props)
+            mob.move_to(self.__layout.calc_index_center(i, self.__calc_half_np(mob)))
+            new_mobs.append(mob)
+
+        if len(new_mobs):
+            self.__mob_rail.extend(new_mobs)
+            self.add(*new_mobs)
+
+        return new_mobs
+
     def __calc_index_pos(self) -> np.ndarray:
         """Calculates the index position of all elements based on attributes set at initialization.
 
@@ -707,11 +1099,7 @@ class MArray(VGroup):
             Index position.
         """
 
-        return (
-            self.__dir_map[self.__arr_dir.value]["index"]
-            if not self.__switch_index_pos
-            else self.__dir_map[self.__arr_dir.value]["index"] * -1
-        )
+        return self.__layout.calc_index_dir()
 
     def __calc_label_shift_factor(self, mob: MArrayElement) -> float:
         """Calculates how much to shift the array label after insertion/removal of an element.
@@ -731,14 +1119,56 @@ class MArray(VGroup):
             self.__dir_map[self.__arr_label_pos.value]["arr"],
             self.__dir_map[self.__arr_dir.value]["arr"],
         ):
-            return mob.fetch_mob_square().side_length
+            return self.__calc_side_length(mob)
         elif not np.array_equal(
             self.__dir_map[self.__arr_label_pos.value]["arr"],
             -self.__dir_map[self.__arr_dir.value]["arr"],
         ):
-            return mob.fetch_mob_square().side_length / 2
+            return self.__calc_side_length(mob) / 2
         return 0
 
+    def __fetch_elem(
+        self,
+        mob_square_args: dict,
+        mob_value_args: dict,
+        mob_index_args: dict,
+        index_pos: np.ndarray,
+    ) -> MArrayElement:
+        """Fetches a new element at the origin, reusing a pooled element if there is one.
+
+        Parameters
+        ----------
+        mob_square_args
+            Arguments for :class:`~manim.mobject.geometry.polygram.Square` that represents the element body.
+        mob_value_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the element value.
+        mob_index_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the element index.
+        index_pos
+            Specifies the position of the element index w.r.t the element body.
+
+        Returns
+        -------
+        :class:`MArrayElement`
+            The new element.
+        """
+
+        mob = self.__pool.acquire()
+        if mob is None:
+            return MArrayElement(
+                scene=self.__scene,
+                mob_square_args=mob_square_args,
+                mob_value_args=mob_value_args,
+                mob_index_args=mob_index_args,
+                index_pos=index_pos,
+                numeric_glyphs=self.__numeric_glyphs,
+            )
+
+        mob.reset(
+            mob_square_args, mob_value_args, mob_index_args, index_pos, self.__pool
+        )
+        return mob
+
     def __append_elem(
         self,
         value,
@@ -777,19 +1207,22 @@ class MArray(VGroup):
             List of append animations.
         """
 
-        mob_value_args["text"] = value
-        mob_index_args["text"] = self.__calc_index(len(self.__mob_arr))
+        self.__sync_layout(clear_dirty=True)
+
+        mob_value_args["text"] = self.__calc_value_text(value)
+        mob_index_args["text"] = self.__calc_elem_index(len(self.__mob_arr))
         self.__mob_arr.append(
-            MArrayElement(
-                scene=self.__scene,
-                mob_square_args=mob_square_args,
-                mob_value_args=mob_value_args,
-                mob_index_args=mob_index_args,
-                index_pos=self.__calc_index_pos(),
-                next_to_mob=self.__mob_arr[-1] if len(self.__mob_arr) else None,
-                next_to_dir=self.__dir_map[self.__arr_dir.value]["arr"],
+            self.__fetch_elem(
+                mob_square_args,
+                mob_value_args,
+                mob_index_args,
+                self.__calc_index_pos(),
             )
         )
+        self.__layout.append(self.__calc_side_length(self.__mob_arr[-1]))
+        self.__mob_arr[-1].shift(
+            self.__layout.calc_elem_center(len(self.__mob_arr) - 1)
+        )
         self.add(self.__mob_arr[-1])
 
         anim_list = [
@@ -798,87 +1231,121 @@ class MArray(VGroup):
             )
         ]
 
+        for mob in self.__extend_rail():
+            anim_list.append(append_anim(mob, **append_anim_args))
+
+        anim_list.extend(self.__emit(MArrayEvent.APPEND, len(self.__mob_arr) - 1))
+
         if shift_label:
             label_shift_factor = self.__calc_label_shift_factor(self.__mob_arr[-1])
             anim_list.append(
-                ApplyMethod(
-                    self.__mob_arr_label.shift,
+                MTranslate(
+                    self,
                     self.__dir_map[self.__arr_dir.value]["arr"] * label_shift_factor,
+                    targets=[self.__mob_arr_label],
                 )
             )
 
         return anim_list
 
-    def __remove_elem(
+    def __append_elems(
+        self,
+        values: typing.Iterable,
+        mob_square_args: dict = {},
+        mob_value_args: dict = {},
+        mob_index_args: dict = {},
+    ) -> typing.Tuple[
+        typing.List[MArrayElement], typing.List[VMobject], typing.List[Animation]
+    ]:
+        """Creates and inserts new elements in the array in bulk.
+
+        The elements are created at the origin and then shifted into place in a single pass. Their positions are computed with a cumulative sum over their `side_length`\0s instead of placing each element next to the previous one.
+
+        Parameters
+        ----------
+        values
+            Specifies the values of the new elements.
+        mob_square_args
+            Arguments for :class:`~manim.mobject.geometry.polygram.Square` that represents the element body.
+        mob_value_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the element value.
+        mob_index_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the element index.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`MArrayElement`]
+            The new elements.
+        :class:`~typing.List`\0[:class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`]
+            The new rail indices.
+        :class:`~typing.List`\0[:class:`~manim.animation.animation.Animation`]
+            Animations of the subscribers to the appends.
+        """
+
+        self.__sync_layout(clear_dirty=True)
+        index_pos = self.__calc_index_pos()
+
+        new_mobs = []
+        for value_text in self.__calc_value_texts(values):
+            mob_value_args["text"] = value_text
+            mob_index_args["text"] = self.__calc_elem_index(
+                len(self.__mob_arr) + len(new_mobs)
+            )
+            new_mobs.append(
+                self.__fetch_elem(
+                    mob_square_args, mob_value_args, mob_index_args, index_pos
+                )
+            )
+
+        if not len(new_mobs):
+            return (new_mobs, [], [])
+
+        self.__layout.extend([self.__calc_side_length(mob) for mob in new_mobs])
+        shifts_np = self.__layout.calc_elem_centers(len(self.__mob_arr))
+
+        for mob, shift_np in zip(new_mobs, shifts_np):
+            mob.shift(shift_np)
+
+        self.__mob_arr.extend(new_mobs)
+        self.add(*new_mobs)
+        rail_mobs = self.__extend_rail()
+
+        anim_list = []
+        for i in range(len(self.__mob_arr) - len(new_mobs), len(self.__mob_arr)):
+            anim_list.extend(self.__emit(MArrayEvent.APPEND, i))
+
+        return (new_mobs, rail_mobs, anim_list)
+
+    def __make_update_indices(
         self,
         index: int,
-        removal_anim: Animation = FadeOut,
         update_anim: Animation = Indicate,
-        removal_anim_args: dict = {},
         update_anim_args: dict = {},
-        removal_anim_target: MArrayElementComp = None,
         update_anim_target: MArrayElementComp = MArrayElementComp.INDEX,
-    ) -> typing.Tuple[Succession, typing.Callable[[bool], typing.List[Animation]]]:
-        """Removes the element from the array at the specified index.
+    ) -> typing.Callable[[bool], typing.List[Animation]]:
+        """Makes the method that updates the indices of the elements from the specified index onwards.
 
         Parameters
         ----------
         index
-            Specifies the index of the element to remove.
-        removal_anim
-            Animation to be applied to the element being removed.
+            Specifies the index of the first element whose index is to be updated.
         update_anim
-            Animation to be applied on remaining elements.
-        removal_anim_args
-            Arguments for removal :class:`~manim.animation.animation.Animation`.
+            Animation to be applied on the updated elements.
         update_anim_args
             Arguments for update :class:`~manim.animation.animation.Animation`.
-        removal_anim_target
-            Specifies the target :class:`~manim.mobject.mobject.Mobject` of the :class:`MArrayElement` on which the removal :class:`~manim.animation.animation.Animation` is to be played.
         update_anim_target
             Specifies the target :class:`~manim.mobject.mobject.Mobject` of the :class:`MArrayElement` on which the update :class:`~manim.animation.animation.Animation` is to be played.
 
         Returns
         -------
-        :class:`~manim.animation.composition.Succession`
-            Contains :class:`~manim.animation.animation.Animation` played for removal and shifting of element(s).
         :data:`~typing.Callable`\0[[:class:`bool`], :class:`~typing.List`\0[:class:`~manim.animation.animation.Animation`]]
-            Method that updates the indices of element(s) after the removed element and returns a list of update :class:`~manim.animation.animation.Animation`\0(s).
+            Method that updates the indices of the element(s) and returns a list of update :class:`~manim.animation.animation.Animation`\0(s).
         """
 
-        if index < 0 or index > len(self.__mob_arr):
-            raise Exception("Index out of bounds!")
-
-        self.remove(self.__mob_arr[index])
-        removed_mob = self.__mob_arr[index]
-        self.__mob_arr = self.__mob_arr[0:index] + self.__mob_arr[index + 1 :]
-
-        anims_shift = []
-        for i in range(index, len(self.__mob_arr)):
-            anims_shift.append(
-                ApplyMethod(
-                    self.__mob_arr[i].shift,
-                    -(
-                        self.__dir_map[self.__arr_dir.value]["arr"]
-                        * removed_mob.fetch_mob_square().side_length
-                    ),
-                )
-            )
-
-        label_shift_factor = self.__calc_label_shift_factor(removed_mob)
-
-        if label_shift_factor != 0:
-            anims_shift.append(
-                ApplyMethod(
-                    self.__mob_arr_label.shift,
-                    -self.__dir_map[self.__arr_dir.value]["arr"] * label_shift_factor,
-                )
-            )
-
         def update_indices(
             play_anim: bool = True, play_anim_args: dict = {}
         ) -> typing.List[Animation]:
-            """Updates the indices of :class:`MArrayElement`(s) that occur after the removal.
+            """Updates the indices of :class:`MArrayElement`(s) that occur after an insertion or removal.
 
             Parameters
             ----------
@@ -895,9 +1362,20 @@ class MArray(VGroup):
 
             anims_index = []
             for i in range(index, len(self.__mob_arr)):
-                self.__mob_arr[i].update_mob_index(
-                    mob_index_args={"text": self.__calc_index(i)}, play_anim=False
-                )
+                elem_index = self.__calc_index(i)
+                # Hidden indices stay uninstantiated
+                if not self.__index_rail and (
+                    elem_index != "" or self.__mob_arr[i].has_mob_index()
+                ):
+                    self.__mob_arr[i].update_mob_index(
+                        mob_index_args={"text": elem_index}, play_anim=False
+                    )
+                # Hidden indices are never instantiated, so there's nothing to animate
+                if (
+                    update_anim_target == MArrayElementComp.INDEX
+                    and not self.__mob_arr[i].has_mob_index()
+                ):
+                    continue
                 anims_index.append(
                     update_anim(
                         (self.__mob_arr[i].fetch_mob(update_anim_target)),
@@ -905,11 +1383,94 @@ class MArray(VGroup):
                     )
                 )
 
-            if play_anim:
-                self.__scene.play(*anims_index, **play_anim_args)
+            if play_anim and anims_index:
+                stats.play(self.__scene, *anims_index, **play_anim_args)
 
             return anims_index
 
+        return update_indices
+
+    def __remove_elem(
+        self,
+        index: int,
+        removal_anim: Animation = FadeOut,
+        update_anim: Animation = Indicate,
+        removal_anim_args: dict = {},
+        update_anim_args: dict = {},
+        removal_anim_target: MArrayElementComp = None,
+        update_anim_target: MArrayElementComp = MArrayElementComp.INDEX,
+    ) -> typing.Tuple[Succession, typing.Callable[[bool], typing.List[Animation]]]:
+        """Removes the element from the array at the specified index.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element to remove.
+        removal_anim
+            Animation to be applied to the element being removed.
+        update_anim
+            Animation to be applied on remaining elements.
+        removal_anim_args
+            Arguments for removal :class:`~manim.animation.animation.Animation`.
+        update_anim_args
+            Arguments for update :class:`~manim.animation.animation.Animation`.
+        removal_anim_target
+            Specifies the target :class:`~manim.mobject.mobject.Mobject` of the :class:`MArrayElement` on which the removal :class:`~manim.animation.animation.Animation` is to be played.
+        update_anim_target
+            Specifies the target :class:`~manim.mobject.mobject.Mobject` of the :class:`MArrayElement` on which the update :class:`~manim.animation.animation.Animation` is to be played.
+
+        Returns
+        -------
+        :class:`~manim.animation.composition.Succession`
+            Contains :class:`~manim.animation.animation.Animation` played for removal and shifting of element(s).
+        :data:`~typing.Callable`\0[[:class:`bool`], :class:`~typing.List`\0[:class:`~manim.animation.animation.Animation`]]
+            Method that updates the indices of element(s) after the removed element and returns a list of update :class:`~manim.animation.animation.Animation`\0(s).
+        """
+
+        if index < 0 or index > len(self.__mob_arr):
+            raise Exception("Index out of bounds!")
+
+        self.__sync_layout(clear_dirty=True)
+
+        self.remove(self.__mob_arr[index])
+        removed_mob = self.__mob_arr[index]
+        self.__mob_arr = self.__mob_arr[0:index] + self.__mob_arr[index + 1 :]
+        removed_len = self.__layout.remove(index)
+
+        # Trailing elements are shifted together by a single animation
+        anims_shift = []
+        if index < len(self.__mob_arr):
+            anims_shift.append(
+                MTranslate(
+                    self,
+                    -(self.__dir_map[self.__arr_dir.value]["arr"] * removed_len),
+                    targets=self.__mob_arr[index:],
+                )
+            )
+
+        # Only the rail index of the trailing slot goes away
+        if len(self.__mob_rail) > len(self.__mob_arr):
+            removed_rail_mob = self.__mob_rail.pop()
+            self.remove(removed_rail_mob)
+            anims_shift.append(FadeOut(removed_rail_mob))
+
+        anims_shift.extend(self.__emit(MArrayEvent.REMOVE, index))
+
+        label_shift_factor = self.__calc_label_shift_factor(removed_mob)
+
+        if label_shift_factor != 0:
+            anims_shift.append(
+                MTranslate(
+                    self,
+                    -self.__dir_map[self.__arr_dir.value]["arr"] * label_shift_factor,
+                    targets=[self.__mob_arr_label],
+                )
+            )
+
+        update_indices = self.__make_update_indices(
+            index, update_anim, update_anim_args, update_anim_target
+        )
+
         return (
             Succession(
                 removal_anim(
@@ -920,6 +1481,258 @@ class MArray(VGroup):
             update_indices,
         )
 
+    def __insert_elem(
+        self,
+        index: int,
+        value,
+        insert_anim: Animation = Write,
+        update_anim: Animation = Indicate,
+        insert_anim_args: dict = {},
+        update_anim_args: dict = {},
+        insert_anim_target: MArrayElementComp = None,
+        update_anim_target: MArrayElementComp = MArrayElementComp.INDEX,
+        mob_square_args: dict = {},
+        mob_value_args: dict = {},
+        mob_index_args: dict = {},
+    ) -> typing.Tuple[Succession, typing.Callable[[bool], typing.List[Animation]]]:
+        """Creates and inserts a new element in the array at the specified index.
+
+        Parameters
+        ----------
+        index
+            Specifies the index at which the new element is to be inserted.
+        value
+            Specifies the value of the new element.
+        insert_anim
+            Animation to be applied to the new element.
+        update_anim
+            Animation to be applied on the following elements.
+        insert_anim_args
+            Arguments for insert :class:`~manim.animation.animation.Animation`.
+        update_anim_args
+            Arguments for update :class:`~manim.animation.animation.Animation`.
+        insert_anim_target
+            Specifies the target :class:`~manim.mobject.mobject.Mobject` of the :class:`MArrayElement` on which the insert :class:`~manim.animation.animation.Animation` is to be played.
+        update_anim_target
+            Specifies the target :class:`~manim.mobject.mobject.Mobject` of the :class:`MArrayElement` on which the update :class:`~manim.animation.animation.Animation` is to be played.
+        mob_square_args
+            Arguments for :class:`~manim.mobject.geometry.polygram.Square` that represents the element body.
+        mob_value_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the element value.
+        mob_index_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the element index.
+
+        Returns
+        -------
+        :class:`~manim.animation.composition.Succession`
+            Contains :class:`~manim.animation.animation.Animation` played for shifting of element(s) and insertion.
+        :data:`~typing.Callable`\0[[:class:`bool`], :class:`~typing.List`\0[:class:`~manim.animation.animation.Animation`]]
+            Method that updates the indices of element(s) after the inserted element and returns a list of update :class:`~manim.animation.animation.Animation`\0(s).
+        """
+
+        if index < 0 or index > len(self.__mob_arr):
+            raise Exception("Index out of bounds!")
+
+        self.__sync_layout(clear_dirty=True)
+        arr_dir_np = self.__layout.fetch_dir_np()
+
+        mob_value_args["text"] = self.__calc_value_text(value)
+        mob_index_args["text"] = self.__calc_elem_index(index)
+        inserted_mob = self.__fetch_elem(
+            mob_square_args, mob_value_args, mob_index_args, self.__calc_index_pos()
+        )
+        side_length = self.__calc_side_length(inserted_mob)
+
+        # The new element takes the slot of the element it displaces
+        self.__layout.insert(index, side_length)
+        inserted_mob.shift(self.__layout.calc_elem_center(index))
+
+        # Trailing elements are shifted together by a single animation
+        anims_shift = []
+        if index < len(self.__mob_arr):
+            anims_shift.append(
+                MTranslate(
+                    self, arr_dir_np * side_length, targets=self.__mob_arr[index:]
+                )
+            )
+
+        self.__mob_arr.insert(index, inserted_mob)
+        self.add(inserted_mob)
+
+        # Only a rail index for the new trailing slot is needed
+        for mob in self.__extend_rail():
+            anims_shift.append(FadeIn(mob))
+
+        label_shift_factor = self.__calc_label_shift_factor(inserted_mob)
+        if label_shift_factor != 0:
+            anims_shift.append(
+                MTranslate(
+                    self,
+                    arr_dir_np * label_shift_factor,
+                    targets=[self.__mob_arr_label],
+                )
+            )
+
+        anims_shift.extend(self.__emit(MArrayEvent.INSERT, index))
+
+        update_indices = self.__make_update_indices(
+            index + 1, update_anim, update_anim_args, update_anim_target
+        )
+
+        insert_anim = insert_anim(
+            inserted_mob.fetch_mob(insert_anim_target), **insert_anim_args
+        )
+
+        return (
+            Succession(AnimationGroup(*anims_shift), insert_anim)
+            if len(anims_shift)
+            else Succession(insert_anim),
+            update_indices,
+        )
+
+    def __update_rail(self, index: int, value, mob_index_args: dict = {}) -> VMobject:
+        """Re-initializes the rail index of the specified slot.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the slot.
+        value
+            New value to be assigned to the rail index.
+        mob_index_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the rail index.
+
+        Returns
+        -------
+        :class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`
+            Updated rail index.
+        """
+
+        if index >= len(self.__mob_rail):
+            return None
+
+        mob_index_props = dict(self.__mob_index_props)
+        mob_index_props.update(mob_index_args)
+        mob_index_props["text"] = str(value)
+
+        old_mob = self.__mob_rail[index]
+        new_mob = self.__fetch_index_text(mob_index_props)
+        self.__sync_layout()
+        new_mob.move_to(
+            self.__layout.calc_index_center(index, self.__calc_half_np(new_mob))
+        )
+        self.remove(old_mob)
+        self.add(new_mob)
+        self.__mob_rail[index] = new_mob
+
+        return new_mob
+
+    def __play(
+        self,
+        anims: typing.List[Animation],
+        play_anim_args: dict = {},
+        keys: typing.List[typing.Any] = None,
+    ) -> None:
+        """Plays the animations, or queues them if a batch is open.
+
+        Parameters
+        ----------
+        anims
+            Specifies the animations to play.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`. Ignored if a batch is open.
+        keys
+            Specifies a key for each animation. A queued animation is dropped when a later one with the same key is queued.
+        """
+
+        if not len(anims):
+            return
+
+        if self.__batch_anims is None:
+            stats.play(self.__scene, *anims, **play_anim_args)
+            return
+
+        if keys is None:
+            keys = [None] * len(anims)
+
+        new_keys = {key for key in keys if key is not None}
+        if new_keys:
+            self.__batch_anims = [
+                (key, anim) for (key, anim) in self.__batch_anims if key not in new_keys
+            ]
+        self.__batch_anims.extend(zip(keys, anims))
+
+    def __flush_batch(self) -> None:
+        """Plays all animations queued by the open batch in a single :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`."""
+
+        anims = [anim for (_, anim) in self.__batch_anims]
+        if np.any(self.__batch_label_shift):
+            anims.append(
+                MTranslate(
+                    self, self.__batch_label_shift, targets=[self.__mob_arr_label]
+                )
+            )
+
+        self.__batch_anims = []
+        self.__batch_label_shift = np.zeros(3)
+        self.__batch_settle = False
+        self.__batch_swapped = set()
+        removed_mobs = self.__batch_removed
+        self.__batch_removed = []
+
+        if len(anims):
+            stats.play(
+                self.__scene,
+                AnimationGroup(*anims, lag_ratio=self.__batch_lag_ratio),
+                **self.__batch_play_args
+            )
+
+        for mob in removed_mobs:
+            self.__pool.release(mob)
+
+    def __settle_batch(self) -> None:
+        """Flushes the open batch if its queued animations move existing elements."""
+
+        if self.__batch_anims is not None and self.__batch_settle:
+            self.__flush_batch()
+
+    def __settle_swaps(self, *indices: int) -> None:
+        """Flushes the open batch if a queued swap moves mobjects of the specified elements.
+
+        Parameters
+        ----------
+        *indices
+            Specifies the indices of the elements.
+        """
+
+        if self.__batch_anims is not None and not self.__batch_swapped.isdisjoint(
+            indices
+        ):
+            self.__flush_batch()
+
+    def __emit(self, event: MArrayEvent, index: int = None) -> typing.List[Animation]:
+        """Notifies the subscribers of a change to the array.
+
+        Parameters
+        ----------
+        event
+            Specifies the change.
+        index
+            Specifies the index of the element that changed, `None` if the change concerns the whole array.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`~manim.animation.animation.Animation`]
+            Animations returned by the subscribers, to be played alongside the change.
+        """
+
+        self.__geometry_version += 1
+
+        anims = []
+        for callback in list(self.__subscribers):
+            anims.extend(callback(event, index))
+        return anims
+
     def __init_props(
         self,
         scene: Scene,
@@ -929,10 +1742,14 @@ class MArray(VGroup):
         index_start: int,
         index_hex_display: bool,
         hide_index: bool,
+        index_rail: bool,
+        numeric_glyphs: bool,
+        pool_size: int,
         arr_dir: MArrayDirection,
         switch_index_pos: bool,
         arr_label_pos: MArrayDirection,
         arr_label_gap: float,
+        fmt: str,
     ) -> None:
         """Initializes the attributes for the class.
 
@@ -952,35 +1769,69 @@ class MArray(VGroup):
             If `True`, displays indices in hex.
         hide_index
             If `True`, doesn't display indices.
+        index_rail
+            If `True`, indices belong to the slots of the array instead of its elements.
+        numeric_glyphs
+            If `True`, numeric values and indices are composed from the glyph atlas of :data:`~.m_cache.text_cache`.
+        pool_size
+            Specifies the maximum number of removed elements kept for reuse by later appends and insertions.
         arr_dir
             Specifies the growth direction of the array.
         arr_label_pos
             Specifies the position of :attr:`__mob_arr_label` w.r.t :attr:`__mob_arr`.
         arr_label_gap
             Specifies the distance between :attr:`__mob_arr_label` and :attr:`__mob_arr`.
+        fmt
+            Specifies the printf-style format of the values.
         """
 
+        self.__mob_index_props: dict = {"text": "", "color": BLUE_D, "font_size": 32}
         self.__mob_arr_label_props: dict = {
             "text": "",
             "color": BLUE_A,
             "font_size": 38,
         }
         self.__scene: Scene = scene
-        self.__arr: typing.List[Any] = arr
+        self.__arr: typing.Union[typing.List[Any], np.ndarray] = arr
+        self.__fmt: str = fmt
         self.__label: str = label
         self.__mob_arr: typing.List[MArrayElement] = []
+        self.__dirty_elems: typing.List[MArrayElement] = []
+        self.__geometry_version: int = 0
+        self.__move_pending: bool = False
+        self.__layout: MArrayLayout = MArrayLayout(
+            arr_dir=arr_dir,
+            switch_index_pos=switch_index_pos,
+            arr_label_pos=arr_label_pos,
+            arr_label_gap=arr_label_gap,
+        )
         self.__index_offset: int = index_offset
         self.__index_start: int = index_start
         self.__index_hex_display: bool = index_hex_display
         self.__hide_index: int = hide_index
+        self.__index_rail: bool = index_rail
+        self.__numeric_glyphs: bool = numeric_glyphs
+        self.__pool: MElementPool = MElementPool(pool_size)
+        self.__mob_rail: typing.List[VMobject] = []
         self.__arr_dir: MArrayDirection = arr_dir
         self.__switch_index_pos: bool = switch_index_pos
         self.__arr_label_pos: MArrayDirection = arr_label_pos
         self.__arr_label_gap: float = arr_label_gap
+        self.__batch_anims: typing.List[typing.Tuple[typing.Any, Animation]] = None
+        self.__batch_play_args: dict = {}
+        self.__batch_lag_ratio: float = 0
+        self.__batch_label_shift: np.ndarray = np.zeros(3)
+        self.__batch_settle: bool = False
+        self.__batch_swapped: typing.Set[int] = set()
+        self.__batch_removed: typing.List[MArrayElement] = []
+        self.__subscribers: typing.List[
+            typing.Callable[[MArrayEvent, int], typing.List[Animation]]
+        ] = []
 
     def __update_props(
         self,
         mob_arr_label_args: dict = {},
+        mob_index_args: dict = {},
     ) -> None:
         """Updates the attributes of the class.
 
@@ -988,10 +1839,13 @@ class MArray(VGroup):
         ----------
         mob_arr_label_args
             Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the array label.
+        mob_index_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents a rail index.
         """
 
         self.__mob_arr_label_props["text"] = self.__label
         self.__mob_arr_label_props.update(mob_arr_label_args)
+        self.__mob_index_props.update(mob_index_args)
 
         if type(self.__mob_arr_label_props["text"]) != str:
             self.__mob_arr_label_props["text"] = str(self.__mob_arr_label_props["text"])
@@ -1009,23 +1863,21 @@ class MArray(VGroup):
         """
 
         if init_arr_label:
-            self.__mob_arr_label = Text(**self.__mob_arr_label_props)
+            self.__mob_arr_label = text_cache.fetch(**self.__mob_arr_label_props)
             if len(self.__mob_arr):
-                (next_to_mob, label_pos) = self.__calc_label_pos_and_mob()
-                self.__mob_arr_label.next_to(
-                    next_to_mob, label_pos, self.__arr_label_gap
-                )
-                if len(self.__mob_arr) % 2 == 0:
-                    self.__mob_arr_label.shift(
-                        -self.__dir_map[self.__arr_dir.value]["arr"]
-                        * (next_to_mob.side_length / 2)
+                self.__sync_layout()
+                self.__mob_arr_label.move_to(
+                    self.__layout.calc_arr_label_center(
+                        self.__calc_half_np(self.__mob_arr_label)
                     )
+                )
             self.add(self.__mob_arr_label)
 
     def __deepcopy__(self, memo):
         """Deepcopy that excludes attributes specified in `exclude_list`."""
 
-        exclude_list = ["_MArray__scene"]
+        stats.count("deepcopy")
+        exclude_list = ["_MArray__scene", "_MArray__subscribers", "_MArray__pool"]
 
         cls = self.__class__
         result = cls.__new__(cls)
@@ -1033,6 +1885,10 @@ class MArray(VGroup):
         for k, v in self.__dict__.items():
             if k not in exclude_list:
                 setattr(result, k, deepcopy(v, memo))
+        # Copies don't notify the subscribers of the original
+        result.__subscribers = []
+        # Pooled elements are interchangeable, so copies share the pool
+        result.__pool = self.__pool
         return result
 
     def __init__(
@@ -1044,10 +1900,14 @@ class MArray(VGroup):
         index_start: int = 0,
         index_hex_display: bool = False,
         hide_index: bool = False,
+        index_rail: bool = False,
+        numeric_glyphs: bool = False,
+        pool_size: int = 64,
         arr_dir: MArrayDirection = MArrayDirection.RIGHT,
         switch_index_pos: bool = False,
         arr_label_pos: MArrayDirection = MArrayDirection.LEFT,
         arr_label_gap: float = 0.5,
+        fmt: str = None,
         mob_arr_label_args: dict = {},
         mob_square_args: dict = {},
         mob_value_args: dict = {},
@@ -1072,12 +1932,20 @@ class MArray(VGroup):
             If `True`, displays indices in hex.
         hide_index
             If `True`, doesn't display indices.
+        index_rail
+            If `True`, indices belong to the slots of the array instead of its elements. Removing an element then only removes the index of the trailing slot instead of re-rendering the indices of all following elements.
+        numeric_glyphs
+            If `True`, numeric values and indices are composed from the glyph atlas of :data:`~.m_cache.text_cache` instead of rendering every distinct number. Speeds up arrays and counters holding integers or hex indices.
+        pool_size
+            Specifies the maximum number of removed elements kept for reuse by later appends and insertions. An element is only pooled once :meth:`remove_elem` has played a removal animation that removes it from the scene (see :meth:`~manim.animation.animation.Animation.is_remover`), so it must not be displayed or modified afterwards. `0` disables the pool.
         arr_dir
             Specifies the growth direction of the array.
         arr_label_pos
             Specifies the position of :attr:`__mob_arr_label` w.r.t :attr:`__mob_arr`.
         arr_label_gap
             Specifies the distance between :attr:`__mob_arr_label` and :attr:`__mob_arr`.
+        fmt
+            Specifies the printf-style format of the values, e.g. `"%.2f"` for a precision of two decimals. A NumPy `arr` is formatted in one vectorized pass. `None` displays values as they are.
         mob_arr_label_args
             Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the array label.
         mob_square_args
@@ -1101,34 +1969,69 @@ class MArray(VGroup):
             index_start,
             index_hex_display,
             hide_index,
+            index_rail,
+            numeric_glyphs,
+            pool_size,
             arr_dir,
             switch_index_pos,
             arr_label_pos,
             arr_label_gap,
+            fmt,
         )
 
         # Update props
-        self.__update_props(mob_arr_label_args)
+        self.__update_props(mob_arr_label_args, mob_index_args)
 
         # Append elements to __mob_arr
-        for v in arr:
-            self.__append_elem(
-                v,
-                False,
-                mob_square_args=mob_square_args,
-                mob_value_args=mob_value_args,
-                mob_index_args=mob_index_args,
-            )
+        self.__append_elems(
+            arr,
+            mob_square_args=mob_square_args,
+            mob_value_args=mob_value_args,
+            mob_index_args=mob_index_args,
+        )
 
         # Initialize other mobjects (e.g. __arr_label)
         self.__init_mobs(True)
 
-    def fetch_arr(self) -> list:
+    @classmethod
+    def from_numpy(
+        cls, scene: Scene, arr: np.ndarray, fmt: str = "%g", **kwargs
+    ) -> "MArray":
+        """Creates an array from a one-dimensional NumPy array.
+
+        All values are formatted in one vectorized pass and identical strings are shared, so each distinct value is rendered once. Values written or added later are formatted with `fmt` too.
+
+        The NumPy array itself, not a copy, becomes the array model returned by :meth:`fetch_arr`, so value updates and swaps write into the caller's buffer. Written values are cast to its dtype. The model is converted to a list, and stops mutating the buffer, once an element is added or removed or a value can't be cast without loss, e.g. `2.5` into an integer array.
+
+        Parameters
+        ----------
+        scene
+            Specifies the scene where the object is to be rendered.
+        arr
+            Specifies the NumPy array to represent.
+        fmt
+            Specifies the printf-style format of the values, e.g. `"%.2f"` for a precision of two decimals.
+        **kwargs
+            Forwarded to constructor of the class.
+
+        Returns
+        -------
+        :class:`MArray`
+            The created array.
+        """
+
+        arr = np.asarray(arr)
+        if arr.ndim != 1:
+            raise Exception("Array must be one-dimensional!")
+
+        return cls(scene, arr, fmt=fmt, **kwargs)
+
+    def fetch_arr(self) -> typing.Union[list, np.ndarray]:
         """Fetches the original array.
 
         Returns
         -------
-        :class:`list`
+        :class:`list` | :class:`np.ndarray`
             :attr:`__arr`.
         """
 
@@ -1156,6 +2059,17 @@ class MArray(VGroup):
 
         return self.__mob_arr_label
 
+    def fetch_mob_rail(self) -> typing.List[VMobject]:
+        """Fetches the rail index mobjects of the array.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`]
+            :attr:`__mob_rail`.
+        """
+
+        return self.__mob_rail
+
     def fetch_arr_dir(self) -> MArrayDirection:
         """Fetches the growth direction enum of the array.
 
@@ -1167,6 +2081,200 @@ class MArray(VGroup):
 
         return self.__arr_dir
 
+    def fetch_layout(self) -> MArrayLayout:
+        """Fetches the layout model of the array.
+
+        Returns
+        -------
+        :class:`~.m_layout.MArrayLayout`
+            :attr:`__layout`.
+        """
+
+        self.__sync_layout()
+        return self.__layout
+
+    def fetch_pool(self) -> MElementPool:
+        """Fetches the pool of removed elements reused by appends and insertions.
+
+        Returns
+        -------
+        :class:`~.m_cache.MElementPool`
+            :attr:`__pool`.
+        """
+
+        return self.__pool
+
+    def fetch_elems_len(self, index_start: int, index_end: int) -> float:
+        """Fetches the total length of the elements between the specified range.
+
+        Parameters
+        ----------
+        index_start
+            Starting index of the range (inclusive).
+        index_end
+            Ending index of the range (inclusive).
+
+        Returns
+        -------
+        :class:`float`
+            Sum of the `side_length`\0s of the elements' squares in the range.
+        """
+
+        return self.__sum_elem_len(index_start, index_end)
+
+    def subscribe(
+        self, callback: typing.Callable[[MArrayEvent, int], typing.List[Animation]]
+    ) -> None:
+        """Subscribes a callback to the changes of the array.
+
+        The callback is called with the :class:`~.m_enum.MArrayEvent` and the index of the element that changed, or `None` if the change concerns the whole array. It returns the animations to be played alongside the change.
+
+        Parameters
+        ----------
+        callback
+            Specifies the callback.
+        """
+
+        if callback not in self.__subscribers:
+            self.__subscribers.append(callback)
+
+    def unsubscribe(
+        self, callback: typing.Callable[[MArrayEvent, int], typing.List[Animation]]
+    ) -> None:
+        """Unsubscribes a callback from the changes of the array.
+
+        Parameters
+        ----------
+        callback
+            Specifies the callback.
+        """
+
+        if callback in self.__subscribers:
+            self.__subscribers.remove(callback)
+
+    def shift(self, *vectors: np.ndarray) -> "MArray":
+        """Shifts the array. The subscribers are notified of :attr:`~.m_enum.MArrayEvent.MOVE` once before the geometry of the array is next used, so a burst of shifts, e.g. by :py:meth:`Mobject.move_to() <manim.mobject.mobject.Mobject.move_to>` or a parent group, is coalesced.
+
+        Parameters
+        ----------
+        *vectors
+            Specifies the vectors to shift by.
+
+        Returns
+        -------
+        :class:`MArray`
+            The array itself.
+        """
+
+        super().shift(*vectors)
+        self.__geometry_version += 1
+        self.__move_pending = True
+        return self
+
+    def apply_points_function_about_point(self, *args, **kwargs) -> "MArray":
+        """Applies a function to the points of the array, e.g. to scale or rotate it, and notifies the subscribers if the elements were resized.
+
+        Parameters
+        ----------
+        *args
+            Forwarded to :py:meth:`Mobject.apply_points_function_about_point() <manim.mobject.mobject.Mobject.apply_points_function_about_point>`.
+        **kwargs
+            Forwarded to :py:meth:`Mobject.apply_points_function_about_point() <manim.mobject.mobject.Mobject.apply_points_function_about_point>`.
+
+        Returns
+        -------
+        :class:`MArray`
+            The array itself.
+        """
+
+        super().apply_points_function_about_point(*args, **kwargs)
+        self.__geometry_version += 1
+        self.__sync_layout()
+        return self
+
+    def interpolate(self, *args, **kwargs) -> "MArray":
+        """Interpolates the array between two mobjects, e.g. on every frame of a :class:`~manim.animation.transform.Transform`, and invalidates its geometry.
+
+        Parameters
+        ----------
+        *args
+            Forwarded to :py:meth:`Mobject.interpolate() <manim.mobject.mobject.Mobject.interpolate>`.
+        **kwargs
+            Forwarded to :py:meth:`Mobject.interpolate() <manim.mobject.mobject.Mobject.interpolate>`.
+
+        Returns
+        -------
+        :class:`MArray`
+            The array itself.
+        """
+
+        super().interpolate(*args, **kwargs)
+        self.__geometry_version += 1
+        return self
+
+    def fetch_geometry_version(self) -> int:
+        """Fetches the geometry version of the array.
+
+        The version changes whenever the array is moved, transformed or changed, so attached mobjects only need to be repositioned when it differs from the version they were positioned against. While elements requested through :meth:`animate_elem` or :meth:`animate_elem_square` may still be resizing, every call returns a new version. Pending notifications of the subscribers are delivered first.
+
+        Returns
+        -------
+        :class:`int`
+            :attr:`__geometry_version`.
+        """
+
+        if len(self.__dirty_elems) or self.__move_pending:
+            self.__sync_layout()
+        if len(self.__dirty_elems):
+            self.__geometry_version += 1
+        return self.__geometry_version
+
+    @contextmanager
+    def batch(
+        self, run_time: float = None, lag_ratio: float = 0, play_anim_args: dict = {}
+    ) -> typing.Iterator["MArray"]:
+        """Merges the animations of the operations performed inside the context into a single :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Operations that would play their animations queue them instead and the queue is played on exit. Queued updates of the same value or index mobject are coalesced so that only the latest one is played, and array label shifts of appended elements are merged. Insertions and removals change the length of the array and move existing elements, so they aren't merged with other operations: the queue is flushed before each insertion or removal and again by the next operation after it. A batch that mixes them with other operations therefore plays once per insertion or removal, plus once per run of other operations around them. Swaps of disjoint elements are merged, while an operation on an element moved by a queued swap flushes the queue first.
+
+        Parameters
+        ----------
+        run_time
+            Specifies the run time of the merged animation.
+        lag_ratio
+            Specifies the lag ratio of the merged :class:`~manim.animation.composition.AnimationGroup`.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Yields
+        ------
+        :class:`MArray`
+            The array itself.
+        """
+
+        # Nested batches are merged into the outermost one
+        if self.__batch_anims is not None:
+            yield self
+            return
+
+        self.__batch_anims = []
+        self.__batch_play_args = dict(play_anim_args)
+        if run_time is not None:
+            self.__batch_play_args["run_time"] = run_time
+        self.__batch_lag_ratio = lag_ratio
+        self.__batch_label_shift = np.zeros(3)
+        self.__batch_settle = False
+
+        try:
+            yield self
+            self.__flush_batch()
+        finally:
+            self.__batch_anims = None
+            self.__batch_label_shift = np.zeros(3)
+            self.__batch_settle = False
+            self.__batch_swapped = set()
+            self.__batch_removed = []
+
     def update_elem_value(
         self,
         index: int,
@@ -1176,7 +2284,7 @@ class MArray(VGroup):
         update_anim_args: dict = {},
         play_anim: bool = True,
         play_anim_args: dict = {},
-    ) -> Text:
+    ) -> VMobject:
         """Updates the elements value.
 
         Parameters
@@ -1198,19 +2306,114 @@ class MArray(VGroup):
 
         Returns
         -------
-        :class:`~manim.mobject.text.text_mobject.Text`
+        :class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`
             Updated element's value mobject.
         """
 
         if index < 0 or index > len(self.__mob_arr):
             raise Exception("Index out of bounds!")
 
-        self.__arr[index] = value
-        mob_value_args["text"] = value
-        return self.__mob_arr[index].update_mob_value(
-            mob_value_args, update_anim, update_anim_args, play_anim, play_anim_args
+        self.__settle_batch()
+        self.__settle_swaps(index)
+
+        self.__write_arr(index, value)
+        mob_value_args["text"] = self.__calc_value_text(value)
+        mob_value = self.__mob_arr[index].update_mob_value(
+            mob_value_args, play_anim=False
         )
 
+        if play_anim:
+            self.__play(
+                [update_anim(mob_value, **update_anim_args)],
+                play_anim_args,
+                [("value", id(self.__mob_arr[index]))],
+            )
+
+        return mob_value
+
+    def update_elem_values(
+        self,
+        indices: typing.Union[typing.Iterable[int], slice],
+        values: typing.Iterable,
+        mob_value_args: dict = {},
+        update_anim: Animation = Write,
+        update_anim_args: dict = {},
+        lag_ratio: float = 0,
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> AnimationGroup:
+        """Updates the values of many elements with a single animation.
+
+        Elements whose displayed value doesn't change are written to the array but not animated. Equal new values are rendered once by :data:`~.m_cache.text_cache`.
+
+        Parameters
+        ----------
+        indices
+            Specifies the indices of elements whose values to update, or a slice of them.
+        values
+            New values to be assigned to the elements, one for each index.
+        mob_value_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the element value.
+        update_anim
+            Animation to be applied to each updated element.
+        update_anim_args
+            Arguments for update :class:`~manim.animation.animation.Animation`.
+        lag_ratio
+            Specifies the delay between the update animations as a fraction of their run time, as in :class:`~manim.animation.composition.LaggedStart`.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Returns
+        -------
+        :class:`~manim.animation.composition.AnimationGroup`
+            Update animations of the changed elements.
+        """
+
+        if isinstance(indices, slice):
+            indices = range(*indices.indices(len(self.__mob_arr)))
+        indices = list(indices)
+        values = list(values)
+
+        if len(indices) != len(values):
+            raise Exception("Number of indices and values don't match!")
+
+        for index in indices:
+            if index < 0 or index >= len(self.__mob_arr):
+                raise Exception("Index out of bounds!")
+
+        self.__settle_batch()
+        self.__settle_swaps(*indices)
+
+        anims = []
+        keys = []
+        for index, value in zip(indices, values):
+            # Compare displayed texts, since values like 1 and True compare equal
+            value_text = self.__calc_value_text(value)
+            old_text = self.__calc_value_text(self.__arr[index])
+            self.__write_arr(index, value)
+            if str(value_text) == str(old_text):
+                continue
+
+            mob_value = self.__mob_arr[index].update_mob_value(
+                {**mob_value_args, "text": value_text},
+                play_anim=False,
+            )
+            anims.append(update_anim(mob_value, **update_anim_args))
+            keys.append(("value", id(self.__mob_arr[index])))
+
+        update_anim = AnimationGroup(*anims, lag_ratio=lag_ratio)
+
+        if play_anim:
+            # An open batch merges the animations itself, so they stay keyed per element
+            if self.__batch_anims is not None:
+                self.__play(anims, play_anim_args, keys)
+            elif len(anims):
+                self.__play([update_anim], play_anim_args)
+
+        return update_anim
+
     def update_elem_index(
         self,
         index: int,
@@ -1220,7 +2423,7 @@ class MArray(VGroup):
         update_anim_args: dict = {},
         play_anim: bool = True,
         play_anim_args: dict = {},
-    ) -> Text:
+    ) -> VMobject:
         """Updates the elements index.
 
         Parameters
@@ -1242,17 +2445,35 @@ class MArray(VGroup):
 
         Returns
         -------
-        :class:`~manim.mobject.text.text_mobject.Text`
+        :class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`
             Updated element's index mobject.
         """
 
         if index < 0 or index > len(self.__mob_arr):
             raise Exception("Index out of bounds!")
 
-        mob_index_args["text"] = value
-        return self.__mob_arr[index].update_mob_index(
-            mob_index_args, update_anim, update_anim_args, play_anim, play_anim_args
-        )
+        self.__settle_batch()
+
+        if self.__index_rail:
+            mob_index = self.__update_rail(index, value, mob_index_args)
+        else:
+            mob_index_args["text"] = value
+            mob_index = self.__mob_arr[index].update_mob_index(
+                mob_index_args, play_anim=False
+            )
+
+        if play_anim and mob_index is not None:
+            self.__play(
+                [update_anim(mob_index, **update_anim_args)],
+                play_anim_args,
+                [
+                    ("rail", index)
+                    if self.__index_rail
+                    else ("index", id(self.__mob_arr[index]))
+                ],
+            )
+
+        return mob_index
 
     def update_mob_arr_label(
         self,
@@ -1286,6 +2507,8 @@ class MArray(VGroup):
             Updated :attr:`__mob_arr_label`.
         """
 
+        self.__settle_batch()
+
         self.__label = label
 
         # Update props of mob_label
@@ -1302,14 +2525,16 @@ class MArray(VGroup):
 
         # Animate change
         if play_anim:
-            self.__scene.play(
-                update_anim(self.__mob_arr_label, **update_anim_args), **play_anim_args
+            self.__play(
+                [update_anim(self.__mob_arr_label, **update_anim_args)],
+                play_anim_args,
+                ["arr_label"],
             )
 
         return self.__mob_arr_label
 
     def animate_elem(self, index: int) -> "_AnimationBuilder":  # type: ignore
-        """Invokes the animate property over element mobject specified.
+        """Invokes the animate property over element mobject specified. The element is measured again before the next layout computation.
 
         Parameters
         ----------
@@ -1325,10 +2550,11 @@ class MArray(VGroup):
         if index < 0 or index > len(self.__mob_arr):
             raise Exception("Index out of bounds!")
 
+        self.__dirty_elems.append(self.__mob_arr[index])
         return self.__mob_arr[index].animate
 
     def animate_elem_square(self, index: int) -> "_AnimationBuilder":  # type: ignore
-        """Invokes the animate property over square mobject of the specified element.
+        """Invokes the animate property over square mobject of the specified element. The element is measured again before the next layout computation.
 
         Parameters
         ----------
@@ -1344,70 +2570,260 @@ class MArray(VGroup):
         if index < 0 or index > len(self.__mob_arr):
             raise Exception("Index out of bounds!")
 
+        self.__dirty_elems.append(self.__mob_arr[index])
         return self.__mob_arr[index].animate_mob_square()
 
-    def animate_elem_value(self, index: int) -> "_AnimationBuilder":  # type: ignore
-        """Invokes the animate property over value mobject of the specified element.
+    def animate_elem_value(self, index: int) -> "_AnimationBuilder":  # type: ignore
+        """Invokes the animate property over value mobject of the specified element.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element who's value mobject animate.
+
+        Returns
+        -------
+        :class:`_AnimationBuilder`
+            Animate property of :class:`~manim.mobject.text.text_mobject.Text`.
+        """
+
+        if index < 0 or index > len(self.__mob_arr):
+            raise Exception("Index out of bounds!")
+
+        return self.__mob_arr[index].animate_mob_value()
+
+    def animate_elem_index(self, index: int) -> "_AnimationBuilder":  # type: ignore
+        """Invokes the animate property over index mobject of the specified element.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element who's index mobject animate.
+
+        Returns
+        -------
+        :class:`_AnimationBuilder`
+            Animate property of :class:`~manim.mobject.text.text_mobject.Text`.
+        """
+
+        if index < 0 or index > len(self.__mob_arr):
+            raise Exception("Index out of bounds!")
+
+        if self.__index_rail and index < len(self.__mob_rail):
+            return self.__mob_rail[index].animate
+
+        return self.__mob_arr[index].animate_mob_index()
+
+    def append_elem(
+        self,
+        value: Any,
+        append_anim: Animation = Write,
+        append_anim_args: dict = {},
+        append_anim_target: MArrayElementComp = None,
+        mob_square_args: dict = {},
+        mob_value_args: dict = {},
+        mob_index_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> typing.List[Animation]:
+        """Creates and inserts a new element in the array.
+
+        Parameters
+        ----------
+        value
+            Specifies the value of the new element.
+        append_anim
+            Animation to be applied to the new element.
+        append_anim_args
+            Arguments for append :class:`~manim.animation.animation.Animation`.
+        append_anim_target
+            Specifies the target :class:`~manim.mobject.mobject.Mobject` of the :class:`MArrayElement` on which the append :class:`~manim.animation.animation.Animation` is to be played.
+        mob_square_args
+            Arguments for :class:`~manim.mobject.geometry.polygram.Square` that represents the element body.
+        mob_value_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the element value.
+        mob_index_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the element index.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Returns
+        -------
+        :class:`typing.List`\0[:class:`~manim.animation.animation.Animation`]
+            List of append animations.
+        """
+
+        self.__settle_batch()
+
+        self.__detach_arr()
+        self.__arr.append(value)
+
+        # An open batch merges the label shifts of all appended elements
+        batch_label = play_anim and self.__batch_anims is not None
+
+        anim_list = self.__append_elem(
+            value,
+            shift_label=not batch_label,
+            mob_square_args=mob_square_args,
+            mob_value_args=mob_value_args,
+            mob_index_args=mob_index_args,
+            append_anim=append_anim,
+            append_anim_args=append_anim_args,
+            append_anim_target=append_anim_target,
+        )
+
+        if batch_label:
+            self.__batch_label_shift = self.__batch_label_shift + (
+                self.__dir_map[self.__arr_dir.value]["arr"]
+                * self.__calc_label_shift_factor(self.__mob_arr[-1])
+            )
+
+        if play_anim:
+            self.__play(anim_list, play_anim_args)
+
+        return anim_list
+
+    def extend_elems(
+        self,
+        values: typing.Iterable,
+        chunk_size: int = 100,
+        append_anim: Animation = Write,
+        append_anim_args: dict = {},
+        append_anim_target: MArrayElementComp = None,
+        lag_ratio: float = 0.05,
+        mob_square_args: dict = {},
+        mob_value_args: dict = {},
+        mob_index_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> int:
+        """Creates and inserts new elements at the end of the array, chunk by chunk.
+
+        The values are consumed lazily, so a generator of any length can be streamed in. Each chunk is laid out in a single pass, shifts the :attr:`__mob_arr_label` once and is played as one :class:`~manim.animation.composition.AnimationGroup`. No values or animations of a chunk are kept once it is played.
 
         Parameters
         ----------
-        index
-            Specifies the index of the element who's value mobject animate.
+        values
+            Specifies the values of the new elements.
+        chunk_size
+            Specifies the number of elements created and played at a time.
+        append_anim
+            Animation to be applied to each new element.
+        append_anim_args
+            Arguments for append :class:`~manim.animation.animation.Animation`.
+        append_anim_target
+            Specifies the target :class:`~manim.mobject.mobject.Mobject` of the :class:`MArrayElement` on which the append :class:`~manim.animation.animation.Animation` is to be played.
+        lag_ratio
+            Specifies the lag ratio of the append animations within a chunk.
+        mob_square_args
+            Arguments for :class:`~manim.mobject.geometry.polygram.Square` that represents the element body.
+        mob_value_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the element value.
+        mob_index_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the element index.
+        play_anim
+            If `True`, plays the animation(s). Otherwise the elements are added without animations.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
 
         Returns
         -------
-        :class:`_AnimationBuilder`
-            Animate property of :class:`~manim.mobject.text.text_mobject.Text`.
+        :class:`int`
+            Number of appended elements.
         """
 
-        if index < 0 or index > len(self.__mob_arr):
-            raise Exception("Index out of bounds!")
+        if chunk_size < 1:
+            raise Exception("Chunk size must be at least 1!")
 
-        return self.__mob_arr[index].animate_mob_value()
+        self.__settle_batch()
+        self.__detach_arr()
 
-    def animate_elem_index(self, index: int) -> "_AnimationBuilder":  # type: ignore
-        """Invokes the animate property over index mobject of the specified element.
+        values = iter(values)
+        count = 0
+        while True:
+            chunk = list(islice(values, chunk_size))
+            if not len(chunk):
+                break
 
-        Parameters
-        ----------
-        index
-            Specifies the index of the element who's index mobject animate.
+            self.__arr.extend(chunk)
+            count += len(chunk)
 
-        Returns
-        -------
-        :class:`_AnimationBuilder`
-            Animate property of :class:`~manim.mobject.text.text_mobject.Text`.
-        """
+            (new_mobs, rail_mobs, anim_list) = self.__append_elems(
+                chunk,
+                mob_square_args=mob_square_args,
+                mob_value_args=mob_value_args,
+                mob_index_args=mob_index_args,
+            )
 
-        if index < 0 or index > len(self.__mob_arr):
-            raise Exception("Index out of bounds!")
+            label_shift_np = self.__dir_map[self.__arr_dir.value]["arr"] * sum(
+                self.__calc_label_shift_factor(mob) for mob in new_mobs
+            )
 
-        return self.__mob_arr[index].animate_mob_index()
+            if not play_anim:
+                self.__mob_arr_label.shift(label_shift_np)
+                continue
 
-    def append_elem(
+            append_anims = [
+                append_anim(mob.fetch_mob(append_anim_target), **append_anim_args)
+                for mob in new_mobs
+            ]
+            append_anims.extend(
+                append_anim(mob, **append_anim_args) for mob in rail_mobs
+            )
+            anim_list.insert(0, AnimationGroup(*append_anims, lag_ratio=lag_ratio))
+
+            # An open batch merges the label shifts of all appended chunks
+            if self.__batch_anims is not None:
+                self.__batch_label_shift = self.__batch_label_shift + label_shift_np
+            else:
+                anim_list.append(
+                    MTranslate(self, label_shift_np, targets=[self.__mob_arr_label])
+                )
+
+            self.__play(anim_list, play_anim_args)
+
+        return count
+
+    def insert_elem(
         self,
+        index: int,
         value: Any,
-        append_anim: Animation = Write,
-        append_anim_args: dict = {},
-        append_anim_target: MArrayElementComp = None,
+        insert_anim: Animation = Write,
+        update_anim: Animation = Indicate,
+        insert_anim_args: dict = {},
+        update_anim_args: dict = {},
+        insert_anim_target: MArrayElementComp = None,
+        update_anim_target: MArrayElementComp = MArrayElementComp.INDEX,
         mob_square_args: dict = {},
         mob_value_args: dict = {},
         mob_index_args: dict = {},
         play_anim: bool = True,
         play_anim_args: dict = {},
-    ) -> typing.List[Animation]:
-        """Creates and inserts a new element in the array.
+    ) -> typing.Tuple[Succession, typing.Callable[[bool], typing.List[Animation]]]:
+        """Creates and inserts a new element in the array at the specified index.
+
+        Only the new element is instantiated. The following elements are shifted by a single animation and pointers and sliding windows attached to the array keep pointing to the same elements.
 
         Parameters
         ----------
+        index
+            Specifies the index at which the new element is to be inserted.
         value
             Specifies the value of the new element.
-        append_anim
+        insert_anim
             Animation to be applied to the new element.
-        append_anim_args
-            Arguments for append :class:`~manim.animation.animation.Animation`.
-        append_anim_target
-            Specifies the target :class:`~manim.mobject.mobject.Mobject` of the :class:`MArrayElement` on which the append :class:`~manim.animation.animation.Animation` is to be played.
+        update_anim
+            Animation to be applied on the following elements.
+        insert_anim_args
+            Arguments for insert :class:`~manim.animation.animation.Animation`.
+        update_anim_args
+            Arguments for update :class:`~manim.animation.animation.Animation`.
+        insert_anim_target
+            Specifies the target :class:`~manim.mobject.mobject.Mobject` of the :class:`MArrayElement` on which the insert :class:`~manim.animation.animation.Animation` is to be played.
+        update_anim_target
+            Specifies the target :class:`~manim.mobject.mobject.Mobject` of the :class:`MArrayElement` on which the update :class:`~manim.animation.animation.Animation` is to be played.
         mob_square_args
             Arguments for :class:`~manim.mobject.geometry.polygram.Square` that represents the element body.
         mob_value_args
@@ -1421,26 +2837,154 @@ class MArray(VGroup):
 
         Returns
         -------
-        :class:`typing.List`\0[:class:`~manim.animation.animation.Animation`]
-            List of append animations.
+        :class:`~manim.animation.composition.Succession`
+            Contains :class:`~manim.animation.animation.Animation` played for shifting of element(s) and insertion.
+        :data:`~typing.Callable`\0[[:class:`bool`], :class:`~typing.List`\0[:class:`~manim.animation.animation.Animation`]]
+            Method that updates the indices of element(s) after the inserted element and returns a list of update :class:`~manim.animation.animation.Animation`\0(s).
         """
 
-        self.__arr.append(value)
+        if index < 0 or index > len(self.__mob_arr):
+            raise Exception("Index out of bounds!")
 
-        anim_list = self.__append_elem(
+        # Insertion moves existing elements, so it can't be merged with queued animations
+        if self.__batch_anims is not None:
+            self.__flush_batch()
+
+        self.__detach_arr()
+        self.__arr.insert(index, value)
+
+        (insert_anim, update_indices) = self.__insert_elem(
+            index,
             value,
-            mob_square_args=mob_square_args,
-            mob_value_args=mob_value_args,
-            mob_index_args=mob_index_args,
-            append_anim=append_anim,
-            append_anim_args=append_anim_args,
-            append_anim_target=append_anim_target,
+            insert_anim,
+            update_anim,
+            insert_anim_args,
+            update_anim_args,
+            insert_anim_target,
+            update_anim_target,
+            mob_square_args,
+            mob_value_args,
+            mob_index_args,
         )
 
         if play_anim:
-            self.__scene.play(*anim_list, **play_anim_args)
+            if self.__batch_anims is None:
+                stats.play(self.__scene, insert_anim, **play_anim_args)
+                update_indices(play_anim_args=play_anim_args)
+            else:
+                anims_index = update_indices(play_anim=False)
+                self.__play(
+                    [
+                        Succession(insert_anim, AnimationGroup(*anims_index))
+                        if len(anims_index)
+                        else insert_anim
+                    ]
+                )
+                self.__batch_settle = True
 
-        return anim_list
+        return (insert_anim, update_indices)
+
+    def swap_elems(
+        self,
+        index_1: int,
+        index_2: int,
+        swap_target: MArrayElementComp = MArrayElementComp.VALUE,
+        path_arc: float = 0,
+        swap_anim_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> AnimationGroup:
+        """Swaps two elements of the array by moving their existing mobjects.
+
+        No mobject is instantiated. With :attr:`~.m_enum.MArrayElementComp.VALUE` only the value mobjects trade places. With :attr:`~.m_enum.MArrayElementComp.BODY` the whole elements trade places, while the indices stay with their slots.
+
+        Parameters
+        ----------
+        index_1
+            Specifies the index of the first element.
+        index_2
+            Specifies the index of the second element.
+        swap_target
+            Specifies whether to swap the value mobjects (:attr:`~.m_enum.MArrayElementComp.VALUE`) or the whole elements (:attr:`~.m_enum.MArrayElementComp.BODY`).
+        path_arc
+            Specifies the angle of the arc along which the mobjects travel. `0` moves them along a straight line.
+        swap_anim_args
+            Arguments for the :class:`~.m_animation.MTranslate` that move the mobjects.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Returns
+        -------
+        :class:`~manim.animation.composition.AnimationGroup`
+            Swap animation.
+        """
+
+        if (
+            index_1 < 0
+            or index_1 >= len(self.__mob_arr)
+            or index_2 < 0
+            or index_2 >= len(self.__mob_arr)
+        ):
+            raise Exception("Index out of bounds!")
+
+        if swap_target not in (MArrayElementComp.VALUE, MArrayElementComp.BODY):
+            raise Exception("Invalid swap target!")
+
+        self.__settle_batch()
+        self.__settle_swaps(index_1, index_2)
+
+        if index_1 == index_2:
+            return AnimationGroup()
+
+        elem_1 = self.__mob_arr[index_1]
+        elem_2 = self.__mob_arr[index_2]
+        shift_np = (
+            elem_2.fetch_mob_square().get_center()
+            - elem_1.fetch_mob_square().get_center()
+        )
+
+        if swap_target == MArrayElementComp.VALUE:
+            targets_1 = [elem_1.fetch_mob_value()]
+            targets_2 = [elem_2.fetch_mob_value()]
+            elem_1.exchange_mob(elem_2, MArrayElementComp.VALUE)
+        else:
+            if not np.isclose(
+                self.__calc_side_length(elem_1), self.__calc_side_length(elem_2)
+            ):
+                raise Exception("Elements of different side lengths can't be swapped!")
+
+            # Indices belong to the slots, so they are handed over instead of moved
+            elem_1.exchange_mob(elem_2, MArrayElementComp.INDEX)
+            targets_1 = [elem_1.fetch_mob_square(), elem_1.fetch_mob_value()]
+            targets_2 = [elem_2.fetch_mob_square(), elem_2.fetch_mob_value()]
+            if elem_1.has_mob_label():
+                targets_1.append(elem_1.fetch_mob_label())
+            if elem_2.has_mob_label():
+                targets_2.append(elem_2.fetch_mob_label())
+            self.__mob_arr[index_1], self.__mob_arr[index_2] = elem_2, elem_1
+
+        self.__arr[index_1], self.__arr[index_2] = (
+            self.__arr[index_2],
+            self.__arr[index_1],
+        )
+
+        swap_anim = AnimationGroup(
+            MTranslate(
+                self, shift_np, targets=targets_1, path_arc=path_arc, **swap_anim_args
+            ),
+            MTranslate(
+                self, -shift_np, targets=targets_2, path_arc=path_arc, **swap_anim_args
+            ),
+        )
+
+        if play_anim:
+            self.__play([swap_anim], play_anim_args)
+            if self.__batch_anims is not None:
+                self.__batch_swapped.update((index_1, index_2))
+
+        return swap_anim
 
     def remove_elem(
         self,
@@ -1488,7 +3032,13 @@ class MArray(VGroup):
         if index < 0 or index > len(self.__mob_arr):
             raise Exception("Index out of bounds!")
 
+        # Removal moves existing elements, so it can't be merged with queued animations
+        if self.__batch_anims is not None:
+            self.__flush_batch()
+
+        self.__detach_arr()
         self.__arr = self.__arr[0:index] + self.__arr[index + 1 :]
+        removed_mob = self.__mob_arr[index]
 
         (remove_anim, update_indices) = self.__remove_elem(
             index,
@@ -1500,9 +3050,27 @@ class MArray(VGroup):
             update_anim_target,
         )
 
+        # A removal animation that isn't a remover leaves the element displayed
+        pool_removed = remove_anim.animations[0].is_remover()
+
         if play_anim:
-            self.__scene.play(remove_anim, **play_anim_args)
-            update_indices(play_anim_args=play_anim_args)
+            if self.__batch_anims is None:
+                stats.play(self.__scene, remove_anim, **play_anim_args)
+                if pool_removed:
+                    self.__pool.release(removed_mob)
+                update_indices(play_anim_args=play_anim_args)
+            else:
+                anims_index = update_indices(play_anim=False)
+                self.__play(
+                    [
+                        Succession(remove_anim, AnimationGroup(*anims_index))
+                        if len(anims_index)
+                        else remove_anim
+                    ]
+                )
+                self.__batch_settle = True
+                if pool_removed:
+                    self.__batch_removed.append(removed_mob)
 
         return (remove_anim, update_indices)
 
@@ -1563,6 +3131,10 @@ class MArrayPointer(VGroup):
         Represents the label of the element.
     __updater_pos : :data:`typing.Callable`\0[[], None]
         The updater function that keeps the pointer intact with the array.
+    __arrow_pos_np : :class:`np.ndarray`
+        The direction vector of :attr:`__mob_arrow`.
+    __pos_version : :class:`int`
+        The geometry version of :attr:`__arr` the pointer was last positioned against, `None` if the pointer must be repositioned.
     """
 
     __dir_map = [
@@ -1582,17 +3154,9 @@ class MArrayPointer(VGroup):
             Position vector for :attr:`__mob_arrow`.
         """
 
-        arr_dir_np = self.__dir_map[self.__arr.fetch_arr_dir().value]["np"]
-        arrow_pos_np = np.copy(self.__dir_map[self.__pointer_pos.value]["np"])
-
-        # If array's direction and pointer's direction are not perpendicular to each other
-        if np.dot(arr_dir_np, arrow_pos_np):
-            # swap the x and y values of arrow_pos_np
-            arrow_pos_np[0], arrow_pos_np[1] = arrow_pos_np[1], arrow_pos_np[0]
-            # update the __pointer_pos accordingly
-            self.__pointer_pos = self.__dir_map[
-                (self.__pointer_pos.value + 2) % len(self.__dir_map)
-            ]["dir"]
+        (arrow_pos_np, self.__pointer_pos) = self.__arr.fetch_layout().calc_arrow_dir(
+            self.__pointer_pos
+        )
 
         return arrow_pos_np
 
@@ -1600,7 +3164,12 @@ class MArrayPointer(VGroup):
         """Attaches the position updater function with the pointer."""
 
         def updater_pos(mob: Mobject) -> None:
-            self.__init_pos()
+            # Only reposition once the geometry of the array has changed
+            if (
+                len(self.__arr.fetch_mob_arr())
+                and self.__arr.fetch_geometry_version() != self.__pos_version
+            ):
+                self.__init_pos()
 
         self.__updater_pos = updater_pos
 
@@ -1611,6 +3180,33 @@ class MArrayPointer(VGroup):
 
         self.remove_updater(self.__updater_pos)
 
+    def __on_event(self, event: MArrayEvent, index: int) -> typing.List[Animation]:
+        """Keeps the pointer attached to the same element after a change to the array.
+
+        Parameters
+        ----------
+        event
+            Specifies the change.
+        index
+            Specifies the index of the element that changed.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`~manim.animation.animation.Animation`]
+            Animations to play alongside the change.
+        """
+
+        if event == MArrayEvent.INSERT and index <= self.__index:
+            self.__index += 1
+        elif event == MArrayEvent.REMOVE:
+            arr_len = len(self.__arr.fetch_mob_arr())
+            if index < self.__index or self.__index >= arr_len:
+                self.__index = max(0, self.__index - 1)
+        elif event == MArrayEvent.MOVE and len(self.__arr.fetch_mob_arr()):
+            self.__init_pos()
+
+        return []
+
     def __calc_shift_np(self, new_index: int) -> np.ndarray:
         """Calculates how much the pointer should shift by to point to the new index.
 
@@ -1634,12 +3230,8 @@ class MArrayPointer(VGroup):
 
         return (
             (
-                self.__arr._MArray__sum_elem_len(index_start, index_end)
-                - (
-                    self.__arr.fetch_mob_arr()[self.__index]
-                    .fetch_mob_square()
-                    .side_length
-                )
+                self.__arr.fetch_elems_len(index_start, index_end)
+                - self.__arr.fetch_layout().fetch_tree().fetch_value(self.__index)
             )
             * self.__dir_map[self.__arr.fetch_arr_dir().value]["np"]
             * (-1 if to_lesser_index else 1)
@@ -1690,6 +3282,8 @@ class MArrayPointer(VGroup):
         self.__arrow_gap: float = arrow_gap
         self.__label_gap: float = label_gap
         self.__pointer_pos: MArrayDirection = pointer_pos
+        self.__arrow_pos_np: np.ndarray = None
+        self.__pos_version: int = None
 
     def __update_props(
         self, mob_arrow_args: dict = {}, mob_label_args: dict = {}
@@ -1723,12 +3317,14 @@ class MArrayPointer(VGroup):
         """
 
         if init_arrow:
-            arrow_pos_np = self.__calc_arrow_pos()
+            self.__arrow_pos_np = self.__calc_arrow_pos()
+            arrow_pos_np = self.__arrow_pos_np
             self.__mob_arrow = Arrow(
                 start=(-arrow_pos_np + (arrow_pos_np * self.__arrow_len)),
                 end=-arrow_pos_np,
                 **self.__mob_arrow_props
             )
+            stats.count("Arrow")
             self.__mob_arrow.next_to(
                 self.__arr.fetch_mob_arr()[self.__index].fetch_mob_square(),
                 arrow_pos_np,
@@ -1737,7 +3333,7 @@ class MArrayPointer(VGroup):
             self.add(self.__mob_arrow)
 
         if init_label:
-            self.__mob_label = Text(**self.__mob_label_props)
+            self.__mob_label = text_cache.fetch(**self.__mob_label_props)
             self.__mob_label.next_to(
                 self.__mob_arrow,
                 self.__dir_map[self.__pointer_pos.value]["np"],
@@ -1748,16 +3344,17 @@ class MArrayPointer(VGroup):
     def __init_pos(self) -> None:
         """Initializes the position of the object"""
 
-        arrow_pos_np = self.__calc_arrow_pos()
         self.next_to(
             self.__arr.fetch_mob_arr()[self.__index].fetch_mob_square(),
-            arrow_pos_np,
+            self.__arrow_pos_np,
             self.__arrow_gap,
         )
+        self.__pos_version = self.__arr.fetch_geometry_version()
 
     def __deepcopy__(self, memo):
         """Deepcopy that excludes attributes specified in `exclude_list`."""
 
+        stats.count("deepcopy")
         exclude_list = ["_MArrayPointer__scene", "_MArrayPointer__arr"]
 
         cls = self.__class__
@@ -1826,6 +3423,9 @@ class MArrayPointer(VGroup):
         # Add updater
         self.__add_updater()
 
+        # Keep the index and position consistent with changes to the array
+        self.__arr.subscribe(self.__on_event)
+
     def fetch_mob_arrow(self) -> Arrow:
         """Fetches the arrow mobject of the pointer.
 
@@ -1905,10 +3505,15 @@ class MArrayPointer(VGroup):
         # Add new mob_label to group
         self.add(self.__mob_label)
 
+        # Reposition against the new label on the next frame
+        self.__pos_version = None
+
         # Animate change
         if play_anim:
-            self.__scene.play(
-                update_anim(self.__mob_label, **update_anim_args), **play_anim_args
+            stats.play(
+                self.__scene,
+                update_anim(self.__mob_label, **update_anim_args),
+                **play_anim_args
             )
 
         return self.__mob_label
@@ -1937,7 +3542,7 @@ class MArrayPointer(VGroup):
 
     def shift_to_elem(
         self, index: int, play_anim: bool = True, play_anim_args: dict = {}
-    ) -> ApplyMethod:
+    ) -> MTranslate:
         """Shifts pointer to the specified element.
 
         Parameters
@@ -1951,20 +3556,18 @@ class MArrayPointer(VGroup):
 
         Returns
         -------
-        :class:`~manim.animation.transform.ApplyMethod`
+        :class:`~.m_animation.MTranslate`
             Shift animation.
         """
 
         if index < 0 or index > len(self.__arr.fetch_mob_arr()):
             raise Exception("Index out of bounds!")
 
-        shift_anim = ApplyMethod(
-            self.shift, self.__calc_shift_np(index), suspend_mobject_updating=True
-        )
+        shift_anim = MTranslate(self, self.__calc_shift_np(index))
         self.__index = index
 
         if play_anim:
-            self.__scene.play(shift_anim, **play_anim_args)
+            stats.play(self.__scene, shift_anim, **play_anim_args)
 
         return shift_anim
 
@@ -2036,16 +3639,10 @@ class MArraySlidingWindow(VGroup):
         Represents the label of the sliding window.
     __updater_pos : :data:`typing.Callable`\0[[], None]
         The updater function that keeps the sliding window intact with the array.
+    __pos_version : :class:`int`
+        The geometry version of :attr:`__arr` the sliding window was last positioned against, `None` if the sliding window must be repositioned.
     """
 
-    __dir_map = [
-        {"np": UP, "dir": MArrayDirection.UP},
-        {"np": DOWN, "dir": MArrayDirection.DOWN},
-        {"np": RIGHT, "dir": MArrayDirection.RIGHT},
-        {"np": LEFT, "dir": MArrayDirection.LEFT},
-    ]
-    """Maps :class:`~.m_enum.MArrayDirection` to :class:`np.ndarray`."""
-
     def __calc_window_dim(self) -> typing.Tuple[float, float]:
         """Calculates dimensions of window mobject.
 
@@ -2057,15 +3654,7 @@ class MArraySlidingWindow(VGroup):
             Width of :attr:`__mob_window`.
         """
 
-        height = self.__arr.fetch_mob_arr()[self.__index].fetch_mob_square().side_length
-        width = self.__arr._MArray__sum_elem_len(
-            self.__index, self.__index + self.__size - 1
-        )
-
-        if self.__arr.fetch_arr_dir() in (MArrayDirection.UP, MArrayDirection.DOWN):
-            height, width = width, height
-
-        return (height, width)
+        return self.__arr.fetch_layout().calc_window_dim(self.__index, self.__size)
 
     def __calc_window_pos_np(self) -> typing.Tuple[np.ndarray, np.ndarray]:
         """Calculates position vector and align vector for the window mobject.
@@ -2078,27 +3667,12 @@ class MArraySlidingWindow(VGroup):
             Align vector for :attr:`__mob_window`
         """
 
+        align_np = self.__arr.fetch_layout().calc_window_align()
         point_np = (
-            self.__arr.fetch_mob_arr()[self.__index].fetch_mob_square().get_left()
+            self.__arr.fetch_mob_arr()[self.__index]
+            .fetch_mob_square()
+            .get_critical_point(align_np)
         )
-        align_np = LEFT
-
-        arr_dir = self.__arr.fetch_arr_dir()
-        if arr_dir == MArrayDirection.LEFT:
-            point_np = (
-                self.__arr.fetch_mob_arr()[self.__index].fetch_mob_square().get_right()
-            )
-            align_np = RIGHT
-        elif arr_dir == MArrayDirection.UP:
-            point_np = (
-                self.__arr.fetch_mob_arr()[self.__index].fetch_mob_square().get_bottom()
-            )
-            align_np = DOWN
-        elif arr_dir == MArrayDirection.DOWN:
-            point_np = (
-                self.__arr.fetch_mob_arr()[self.__index].fetch_mob_square().get_top()
-            )
-            align_np = UP
 
         return (point_np, align_np)
 
@@ -2111,22 +3685,7 @@ class MArraySlidingWindow(VGroup):
             Position vector for :attr:`__mob_label`
         """
 
-        arr_dir = self.__arr.fetch_arr_dir()
-        # Label position is parallel to array growth direction
-        if np.array_equal(
-            self.__dir_map[self.__label_pos.value]["np"],
-            self.__dir_map[arr_dir.value]["np"],
-        ) or np.array_equal(
-            self.__dir_map[self.__label_pos.value]["np"],
-            -self.__dir_map[arr_dir.value]["np"],
-        ):
-            return self.__dir_map[(self.__label_pos.value + 2) % len(self.__dir_map)][
-                "np"
-            ]
-
-        # Label position is perpendicular to array growth direction
-        else:
-            return self.__dir_map[self.__label_pos.value]["np"]
+        return self.__arr.fetch_layout().calc_window_label_dir(self.__label_pos)
 
     def __pos_mobs(self, pos_window: bool = False, pos_label: bool = False) -> None:
         """Positions mobjects of the class.
@@ -2150,11 +3709,73 @@ class MArraySlidingWindow(VGroup):
                 self.__label_gap,
             )
 
+    def __calc_resize_anim(
+        self, window_pos_np: np.ndarray, window_align_np: np.ndarray
+    ) -> AnimationGroup:
+        """Calculates the animation that fits the window to :attr:`__size` elements.
+
+        Parameters
+        ----------
+        window_pos_np
+            Specifies where the aligned edge of the resized window ends up.
+        window_align_np
+            Specifies the edge of the window that is aligned with `window_pos_np`.
+
+        Returns
+        -------
+        :class:`~manim.animation.composition.AnimationGroup`
+            Resize animation.
+        """
+
+        height, width = self.__calc_window_dim()
+        label_pos_np = self.__calc_label_pos_np()
+
+        # Box of the window once it is resized and aligned with window_pos_np
+        window_half_np = np.array([width / 2, height / 2, 0])
+        window_center_np = window_pos_np - window_align_np * window_half_np
+
+        # Where the label ends up when placed next to the resized window
+        label_half_np = np.array(
+            [self.__mob_label.get_width() / 2, self.__mob_label.get_height() / 2, 0]
+        )
+        label_center_np = (
+            window_center_np
+            + label_pos_np * window_half_np
+            + label_pos_np * self.__label_gap
+            + label_pos_np * label_half_np
+        )
+
+        if self.__arr.fetch_arr_dir() in (MArrayDirection.UP, MArrayDirection.DOWN):
+            stretch_len, stretch_dim = height, 1
+        else:
+            stretch_len, stretch_dim = width, 0
+
+        return AnimationGroup(
+            MStretch(
+                self,
+                stretch_len,
+                stretch_dim,
+                point=window_pos_np,
+                aligned_edge=window_align_np,
+                targets=[self.__mob_window],
+            ),
+            MTranslate(
+                self,
+                label_center_np - self.__mob_label.get_center(),
+                targets=[self.__mob_label],
+            ),
+        )
+
     def __add_updater(self) -> None:
         """Attaches the position updater function with the pointer."""
 
         def updater_pos(mob: Mobject) -> None:
-            self.__init_pos()
+            # Only reposition once the geometry of the array has changed
+            if (
+                len(self.__arr.fetch_mob_arr())
+                and self.__arr.fetch_geometry_version() != self.__pos_version
+            ):
+                self.__init_pos()
 
         self.__updater_pos = updater_pos
 
@@ -2165,6 +3786,57 @@ class MArraySlidingWindow(VGroup):
 
         self.remove_updater(self.__updater_pos)
 
+    def __on_event(self, event: MArrayEvent, index: int) -> typing.List[Animation]:
+        """Keeps the sliding window enclosing the same elements after a change to the array.
+
+        Parameters
+        ----------
+        event
+            Specifies the change.
+        index
+            Specifies the index of the element that changed.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`~manim.animation.animation.Animation`]
+            Animations to play alongside the change.
+        """
+
+        if event == MArrayEvent.INSERT:
+            if index <= self.__index:
+                self.__index += 1
+            elif index < self.__index + self.__size:
+                # An element inserted inside the window widens it
+                return [self.resize_window(self.__size + 1, play_anim=False)]
+        elif event == MArrayEvent.REMOVE:
+            if index < self.__index:
+                self.__index -= 1
+            elif index < self.__index + self.__size and self.__size > 1:
+                # The edge the window is aligned with stays in place while it shrinks
+                self.__size -= 1
+                (_, window_align_np) = self.__calc_window_pos_np()
+                return [
+                    self.__calc_resize_anim(
+                        self.__mob_window.get_critical_point(window_align_np),
+                        window_align_np,
+                    )
+                ]
+            arr_len = len(self.__arr.fetch_mob_arr())
+            if arr_len and self.__index + self.__size > arr_len:
+                self.__index = max(0, arr_len - self.__size)
+        elif event == MArrayEvent.MOVE and len(self.__arr.fetch_mob_arr()):
+            self.__init_pos()
+        elif event == MArrayEvent.RESIZE and (
+            index is None or self.__index <= index < self.__index + self.__size
+        ):
+            # Fit the window to the new lengths of the enclosed elements
+            height, width = self.__calc_window_dim()
+            self.__mob_window.stretch_to_fit_height(height)
+            self.__mob_window.stretch_to_fit_width(width)
+            self.__init_pos()
+
+        return []
+
     def __init_props(
         self,
         scene: Scene,
@@ -2208,6 +3880,7 @@ class MArraySlidingWindow(VGroup):
         self.__label: str = label
         self.__label_gap: float = label_gap
         self.__label_pos: MArrayDirection = label_pos
+        self.__pos_version: int = None
 
     def __update_props(
         self, mob_window_args: dict = {}, mob_label_args: dict = {}
@@ -2245,11 +3918,12 @@ class MArraySlidingWindow(VGroup):
             self.__mob_window = Rectangle(
                 height=height, width=width, **self.__mob_window_props
             )
+            stats.count("Rectangle")
             self.__pos_mobs(pos_window=True)
             self.add(self.__mob_window)
 
         if init_label:
-            self.__mob_label = Text(**self.__mob_label_props)
+            self.__mob_label = text_cache.fetch(**self.__mob_label_props)
             self.__pos_mobs(pos_label=True)
             self.add(self.__mob_label)
 
@@ -2257,10 +3931,12 @@ class MArraySlidingWindow(VGroup):
         """Initializes the position of the object"""
 
         self.__pos_mobs(True, True)
+        self.__pos_version = self.__arr.fetch_geometry_version()
 
     def __deepcopy__(self, memo):
         """Deepcopy that excludes attributes specified in `exclude_list`."""
 
+        stats.count("deepcopy")
         exclude_list = ["_MArraySlidingWindow__scene", "_MArraySlidingWindow__arr"]
 
         cls = self.__class__
@@ -2324,6 +4000,9 @@ class MArraySlidingWindow(VGroup):
         # Add updater
         self.__add_updater()
 
+        # Keep the index and position consistent with changes to the array
+        self.__arr.subscribe(self.__on_event)
+
     def fetch_mob_window(self) -> Rectangle:
         """Fetches the window mobject of the sliding window.
 
@@ -2346,6 +4025,28 @@ class MArraySlidingWindow(VGroup):
 
         return self.__mob_label
 
+    def fetch_index(self) -> int:
+        """Fetches the index of the first element inside the sliding window.
+
+        Returns
+        -------
+        :class:`int`
+            :attr:`__index`.
+        """
+
+        return self.__index
+
+    def fetch_size(self) -> int:
+        """Fetches the number of elements inside the sliding window.
+
+        Returns
+        -------
+        :class:`int`
+            :attr:`__size`.
+        """
+
+        return self.__size
+
     def update_mob_label(
         self,
         label: str,
@@ -2392,10 +4093,15 @@ class MArraySlidingWindow(VGroup):
         # Add new mob_label to group
         self.add(self.__mob_label)
 
+        # Reposition against the new label on the next frame
+        self.__pos_version = None
+
         # Animate change
         if play_anim:
-            self.__scene.play(
-                update_anim(self.__mob_label, **update_anim_args), **play_anim_args
+            stats.play(
+                self.__scene,
+                update_anim(self.__mob_label, **update_anim_args),
+                **play_anim_args
             )
 
         return self.__mob_label
@@ -2424,7 +4130,7 @@ class MArraySlidingWindow(VGroup):
 
     def shift_to_elem(
         self, index: int, play_anim: bool = True, play_anim_args: dict = {}
-    ) -> ApplyFunction:
+    ) -> AnimationGroup:
         """Shifts sliding window to the specified element.
 
         Parameters
@@ -2438,7 +4144,7 @@ class MArraySlidingWindow(VGroup):
 
         Returns
         -------
-        :class:`~manim.animation.transform.ApplyFunction`
+        :class:`~manim.animation.composition.AnimationGroup`
             Shift animation.
         """
 
@@ -2471,7 +4177,7 @@ class MArraySlidingWindow(VGroup):
 
     def resize_window(
         self, size: int, play_anim: bool = True, play_anim_args: dict = {}
-    ) -> ApplyFunction:
+    ) -> AnimationGroup:
         """Expands or shrinks the window according to the specified size.
 
         Parameters
@@ -2485,7 +4191,7 @@ class MArraySlidingWindow(VGroup):
 
         Returns
         -------
-        :class:`~manim.animation.transform.ApplyFunction`
+        :class:`~manim.animation.composition.AnimationGroup`
             Resize animation.
         """
 
@@ -2494,34 +4200,13 @@ class MArraySlidingWindow(VGroup):
 
         self.__size = size
 
-        # Variables for resize_and_shift method
-        arr_dir = self.__arr.fetch_arr_dir()
-        height, width = self.__calc_window_dim()
         window_pos_np, window_align_np = self.__calc_window_pos_np()
-        label_pos_np = self.__calc_label_pos_np()
-
-        def resize_and_shift(mob: MArraySlidingWindow) -> MArraySlidingWindow:
-            """Resizes and shifts the sliding window
-
-            Returns
-            -------
-            :class:`MArraySlidingWindow`
-                Represents the modified mobject.
-            """
-
-            if arr_dir in (MArrayDirection.UP, MArrayDirection.DOWN):
-                mob.__mob_window.stretch_to_fit_height(height)
-            else:
-                mob.__mob_window.stretch_to_fit_width(width)
-            mob.__mob_window.move_to(window_pos_np, window_align_np)
-            mob.__mob_label.next_to(mob.__mob_window, label_pos_np, mob.__label_gap)
-            return mob
-
-        resize_anim = ApplyFunction(
-            resize_and_shift, self, suspend_mobject_updating=True
-        )
+        resize_anim = self.__calc_resize_anim(window_pos_np, window_align_np)
 
         if play_anim:
-            self.__scene.play(resize_anim, **play_anim_args)
+            stats.play(self.__scene, resize_anim, **play_anim_args)
 
         return resize_anim
+
+
+stats.register(MArrayElement, MArray, MArrayPointer, MArraySlidingWindow)
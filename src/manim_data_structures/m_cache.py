@@ -0,0 +1,398 @@
+"""Contains classes to cache rendered mobjects."""
+
+from collections import OrderedDict
+
+from manim import *
+
+from .m_stats import stats
+
+
+class MTextCache:
+    """A class that represents a size-bounded LRU cache of rendered :class:`~manim.mobject.text.text_mobject.Text` mobjects.
+
+    Rendering a :class:`~manim.mobject.text.text_mobject.Text` goes through Pango, SVG and path parsing. The cache renders each distinct combination of arguments once and hands out copies of the rendered prototype afterwards.
+
+    Numeric text can instead be composed from a glyph atlas with :meth:`fetch_numeric`. Every glyph in :attr:`ATLAS_CHARS` is rendered once per style and numbers are composed by copying and offsetting the glyphs, so a new number costs no render at all.
+
+    Parameters
+    ----------
+    max_size
+        Specifies the maximum number of prototypes, and separately of glyph atlases, held by the cache.
+
+    Attributes
+    ----------
+    __max_size : :class:`int`
+        The maximum number of prototypes, and separately of glyph atlases, held by the cache.
+    __prototypes : :class:`~collections.OrderedDict`
+        Maps argument keys to rendered :class:`~manim.mobject.text.text_mobject.Text` prototypes in least recently used order.
+    __hits : :class:`int`
+        The number of fetches served by copying a prototype.
+    __misses : :class:`int`
+        The number of fetches that required a render.
+    __evictions : :class:`int`
+        The number of prototypes and glyph atlases evicted to respect :attr:`__max_size`.
+    __atlases : :class:`~collections.OrderedDict`
+        Maps style keys to glyph atlases in least recently used order, each holding the rendered `glyphs` by character and the `gap` between adjacent glyphs.
+    """
+
+    ATLAS_CHARS = "0123456789+-.xabcdefABCDEF"
+    """Characters that :meth:`fetch_numeric` composes from the glyph atlas."""
+
+    def __make_key(self, text_args: dict) -> tuple:
+        """Makes a hashable key from the arguments of a :class:`~manim.mobject.text.text_mobject.Text`.
+
+        Parameters
+        ----------
+        text_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text`.
+
+        Returns
+        -------
+        :class:`tuple`
+            Hashable key that identifies the arguments.
+        """
+
+        key = []
+        for k in sorted(text_args):
+            v = text_args[k]
+            try:
+                hash(v)
+            except TypeError:
+                v = repr(v)
+            key.append((k, type(v).__name__, v))
+        return tuple(key)
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        max_size
+            Specifies the maximum number of prototypes, and separately of glyph atlases, held by the cache.
+        """
+
+        if max_size < 0:
+            raise Exception("Invalid cache size!")
+
+        self.__max_size: int = max_size
+        self.__prototypes: OrderedDict = OrderedDict()
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__evictions: int = 0
+        self.__atlases: OrderedDict = OrderedDict()
+
+    def fetch(self, **kwargs) -> Text:
+        """Fetches a :class:`~manim.mobject.text.text_mobject.Text` for the specified arguments.
+
+        Parameters
+        ----------
+        **kwargs
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text`.
+
+        Returns
+        -------
+        :class:`~manim.mobject.text.text_mobject.Text`
+            A copy of the cached prototype, rendered on the first fetch.
+        """
+
+        key = self.__make_key(kwargs)
+
+        prototype = self.__prototypes.get(key)
+        if prototype is not None:
+            self.__hits += 1
+            self.__prototypes.move_to_end(key)
+            stats.count("Text.copy")
+            return prototype.copy()
+
+        self.__misses += 1
+        prototype = Text(**kwargs)
+        stats.count("Text")
+        if self.__max_size:
+            self.__prototypes[key] = prototype
+            self.__evict()
+            stats.count("Text.copy")
+            return prototype.copy()
+        return prototype
+
+    def __fetch_atlas(self, style_args: dict) -> dict:
+        """Fetches the glyph atlas of a style, rendering it on the first fetch.
+
+        Parameters
+        ----------
+        style_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` without the `text`.
+
+        Returns
+        -------
+        :class:`dict`
+            The atlas, `None` if the glyphs couldn't be told apart.
+        """
+
+        key = self.__make_key(style_args)
+        if key in self.__atlases:
+            self.__atlases.move_to_end(key)
+            return self.__atlases[key]
+
+        mob_atlas = Text(text=self.ATLAS_CHARS, **style_args)
+        stats.count("Text")
+
+        atlas = None
+        # Text holds one submobject per visible character
+        if len(mob_atlas.submobjects) == len(self.ATLAS_CHARS):
+            glyphs = mob_atlas.submobjects
+            gaps = [
+                glyphs[i + 1].get_left()[0] - glyphs[i].get_right()[0]
+                for i in range(len(glyphs) - 1)
+            ]
+            atlas = {
+                "glyphs": dict(zip(self.ATLAS_CHARS, glyphs)),
+                "gap": sum(gaps) / len(gaps),
+            }
+
+        if self.__max_size:
+            self.__atlases[key] = atlas
+            self.__evict()
+        return atlas
+
+    def fetch_numeric(self, **kwargs) -> VMobject:
+        """Fetches a mobject for numeric text composed from the glyph atlas.
+
+        Text with characters outside :attr:`ATLAS_CHARS` is fetched with :meth:`fetch` instead. Like a :class:`~manim.mobject.text.text_mobject.Text`, a composed :class:`~manim.mobject.types.vectorized_mobject.VGroup` holds its string in `text`.
+
+        Parameters
+        ----------
+        **kwargs
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text`.
+
+        Returns
+        -------
+        :class:`~manim.mobject.types.vectorized_mobject.VMobject`
+            A :class:`~manim.mobject.types.vectorized_mobject.VGroup` of glyph copies centered at the origin, or a :class:`~manim.mobject.text.text_mobject.Text`.
+        """
+
+        text = kwargs.get("text", "")
+        if not text or any(c not in self.ATLAS_CHARS for c in text):
+            return self.fetch(**kwargs)
+
+        style_args = dict(kwargs)
+        del style_args["text"]
+        atlas = self.__fetch_atlas(style_args)
+        if atlas is None:
+            return self.fetch(**kwargs)
+
+        mob = VGroup()
+        cursor = 0
+        for c in text:
+            glyph = atlas["glyphs"][c].copy()
+            # Keep the height of the glyph in the atlas, so glyphs share a baseline
+            glyph.shift(RIGHT * (cursor - glyph.get_left()[0]))
+            cursor += glyph.get_width() + atlas["gap"]
+            mob.add(glyph)
+        mob.move_to(ORIGIN)
+        mob.text = text
+
+        stats.count("Text.glyph")
+        return mob
+
+    def __evict(self) -> None:
+        """Evicts least recently used prototypes and glyph atlases until :attr:`__max_size` is respected."""
+
+        for cache in (self.__prototypes, self.__atlases):
+            while len(cache) > self.__max_size:
+                cache.popitem(last=False)
+                self.__evictions += 1
+
+    def resize(self, max_size: int) -> None:
+        """Changes the maximum number of prototypes, and separately of glyph atlases, held by the cache.
+
+        Parameters
+        ----------
+        max_size
+            Specifies the maximum number of prototypes, and separately of glyph atlases, held by the cache.
+        """
+
+        if max_size < 0:
+            raise Exception("Invalid cache size!")
+
+        self.__max_size = max_size
+        self.__evict()
+
+    def clear(self) -> None:
+        """Removes all prototypes and glyph atlases and resets the counters."""
+
+        self.__prototypes.clear()
+        self.__atlases.clear()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def fetch_stats(self) -> dict:
+        """Fetches the counters of the cache.
+
+        Returns
+        -------
+        :class:`dict`
+            Number of `hits`, `misses` and `evictions` along with the current `size`, the number of glyph `atlases` and `max_size`.
+        """
+
+        return {
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "evictions": self.__evictions,
+            "size": len(self.__prototypes),
+            "atlases": len(self.__atlases),
+            "max_size": self.__max_size,
+        }
+
+
+text_cache = MTextCache()
+"""Process-wide :class:`MTextCache` shared by all classes of the package."""
+
+
+class MElementPool:
+    """A class that represents a size-bounded pool of removed :class:`~.m_array.MArrayElement`\0s.
+
+    Constructing an element instantiates a :class:`~manim.mobject.geometry.polygram.Square` and up to three :class:`~manim.mobject.text.text_mobject.Text` mobjects. An element released into the pool is reset on its next acquisition instead: its body takes the points and style of a cached :class:`~manim.mobject.geometry.polygram.Square` prototype and its value and index are fetched from :data:`text_cache`, so no mobject is constructed.
+
+    Parameters
+    ----------
+    max_size
+        Specifies the maximum number of elements held by the pool.
+
+    Attributes
+    ----------
+    __max_size : :class:`int`
+        The maximum number of elements held by the pool.
+    __elems : :class:`~typing.List`\0[:class:`~.m_array.MArrayElement`]
+        The released elements, most recently released last.
+    __squares : :class:`dict`
+        Maps argument keys to :class:`~manim.mobject.geometry.polygram.Square` prototypes.
+    __hits : :class:`int`
+        The number of acquisitions served by a pooled element.
+    __misses : :class:`int`
+        The number of acquisitions that found the pool empty.
+    __releases : :class:`int`
+        The number of elements released into the pool.
+    __discards : :class:`int`
+        The number of released elements dropped to respect :attr:`__max_size`.
+    """
+
+    def __init__(self, max_size: int = 64) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        max_size
+            Specifies the maximum number of elements held by the pool.
+        """
+
+        if max_size < 0:
+            raise Exception("Invalid pool size!")
+
+        self.__max_size: int = max_size
+        self.__elems: typing.List[VGroup] = []
+        self.__squares: dict = {}
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__releases: int = 0
+        self.__discards: int = 0
+
+    def acquire(self) -> VGroup:
+        """Takes the most recently released element out of the pool.
+
+        Returns
+        -------
+        :class:`~.m_array.MArrayElement`
+            The element, to be reset by the caller, or `None` if the pool is empty.
+        """
+
+        if not len(self.__elems):
+            self.__misses += 1
+            return None
+
+        self.__hits += 1
+        return self.__elems.pop()
+
+    def release(self, mob: VGroup) -> None:
+        """Puts an element that is no longer displayed into the pool. The element is dropped if the pool is full.
+
+        Parameters
+        ----------
+        mob
+            Specifies the :class:`~.m_array.MArrayElement` to release.
+        """
+
+        if len(self.__elems) >= self.__max_size:
+            self.__discards += 1
+            return
+
+        self.__releases += 1
+        self.__elems.append(mob)
+
+    def fetch_square(self, **kwargs) -> Square:
+        """Fetches the :class:`~manim.mobject.geometry.polygram.Square` prototype for the specified arguments.
+
+        Parameters
+        ----------
+        **kwargs
+            Arguments for :class:`~manim.mobject.geometry.polygram.Square`.
+
+        Returns
+        -------
+        :class:`~manim.mobject.geometry.polygram.Square`
+            The prototype, instantiated on the first fetch. It must not be modified.
+        """
+
+        key = tuple(sorted((k, repr(v)) for k, v in kwargs.items()))
+
+        square = self.__squares.get(key)
+        if square is None:
+            square = Square(**kwargs)
+            stats.count("Square")
+            self.__squares[key] = square
+        return square
+
+    def resize(self, max_size: int) -> None:
+        """Changes the maximum number of elements held by the pool.
+
+        Parameters
+        ----------
+        max_size
+            Specifies the maximum number of elements held by the pool.
+        """
+
+        if max_size < 0:
+            raise Exception("Invalid pool size!")
+
+        self.__max_size = max_size
+        if len(self.__elems) > max_size:
+            self.__discards += len(self.__elems) - max_size
+            self.__elems = self.__elems[len(self.__elems) - max_size :]
+
+    def clear(self) -> None:
+        """Removes all elements and prototypes and resets the counters."""
+
+        self.__elems = []
+        self.__squares = {}
+        self.__hits = 0
+        self.__misses = 0
+        self.__releases = 0
+        self.__discards = 0
+
+    def fetch_stats(self) -> dict:
+        """Fetches the counters of the pool.
+
+        Returns
+        -------
+        :class:`dict`
+            Number of `hits`, `misses`, `releases` and `discards` along with the current `size` and `max_size`.
+        """
+
+        return {
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "releases": self.__releases,
+            "discards": self.__discards,
+            "size": len(self.__elems),
+            "max_size": self.__max_size,
+        }
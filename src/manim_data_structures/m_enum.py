@@ -33,3 +33,22 @@ class MArrayDirection(Enum):
 
     LEFT = 3
     """Leftward direction."""
+
+
+class MArrayEvent(Enum):
+    """Refers to the changes :class:`~.m_array.MArray` notifies its subscribers of."""
+
+    APPEND = 0
+    """An element is appended to the array."""
+
+    INSERT = 1
+    """An element is inserted in the array."""
+
+    REMOVE = 2
+    """An element is removed from the array."""
+
+    MOVE = 3
+    """The array is moved. Moves are coalesced, so a burst of moves notifies the subscribers once."""
+
+    RESIZE = 4
+    """An element, or the whole array if no index is given, changed its length along the growth direction of the array."""
@@ -0,0 +1,809 @@
+"""Contains classes to compute the layout of data structures."""
+
+import typing
+
+import numpy as np
+
+from .m_enum import MArrayDirection
+
+
+class MFenwickTree:
+    """A class that represents a Fenwick (binary indexed) tree over a list of lengths.
+
+    Appending, popping the last value and updating a value take O(log n). Range and prefix sums take O(log n). Inserting or removing in the middle rebuilds the tree in O(n).
+
+    Parameters
+    ----------
+    values
+        Specifies the initial values.
+
+    Attributes
+    ----------
+    __values : :class:`~typing.List`\0[:class:`float`]
+        The values the tree is built over.
+    __tree : :class:`~typing.List`\0[:class:`float`]
+        The 1-based Fenwick tree nodes.
+    """
+
+    def __lowbit(self, i: int) -> int:
+        """Calculates the lowest set bit of the specified node index.
+
+        Parameters
+        ----------
+        i
+            Specifies the 1-based node index.
+
+        Returns
+        -------
+        :class:`int`
+            Lowest set bit of `i`.
+        """
+
+        return i & -i
+
+    def __build(self) -> None:
+        """Builds :attr:`__tree` from :attr:`__values` in O(n)."""
+
+        n = len(self.__values)
+        self.__tree = [0.0] + list(self.__values)
+        for i in range(1, n + 1):
+            parent = i + self.__lowbit(i)
+            if parent <= n:
+                self.__tree[parent] += self.__tree[i]
+
+    def __init__(self, values: typing.Iterable[float] = ()) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        values
+            Specifies the initial values.
+        """
+
+        self.__values: typing.List[float] = [float(v) for v in values]
+        self.__tree: typing.List[float] = []
+        self.__build()
+
+    def __len__(self) -> int:
+        """Returns the number of values."""
+
+        return len(self.__values)
+
+    def fetch_value(self, index: int) -> float:
+        """Fetches the value at the specified index.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the value.
+
+        Returns
+        -------
+        :class:`float`
+            Value at `index`.
+        """
+
+        return self.__values[index]
+
+    def fetch_values(self) -> typing.List[float]:
+        """Fetches all values.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`float`]
+            :attr:`__values`.
+        """
+
+        return self.__values
+
+    def prefix_sum(self, count: int) -> float:
+        """Sums the first `count` values.
+
+        Parameters
+        ----------
+        count
+            Specifies the number of leading values to sum.
+
+        Returns
+        -------
+        :class:`float`
+            Sum of the values in the range [0, `count`).
+        """
+
+        if count < 0 or count > len(self.__values):
+            raise Exception("Index out of bounds!")
+
+        total = 0.0
+        i = count
+        while i > 0:
+            total += self.__tree[i]
+            i -= self.__lowbit(i)
+        return total
+
+    def range_sum(self, index_start: int, index_end: int) -> float:
+        """Sums the values between the specified range.
+
+        Parameters
+        ----------
+        index_start
+            Starting index of the range (inclusive).
+        index_end
+            Ending index of the range (inclusive).
+
+        Returns
+        -------
+        :class:`float`
+            Sum of the values in the range, `0` if the range is empty.
+        """
+
+        if index_end < index_start:
+            return 0.0
+
+        return self.prefix_sum(index_end + 1) - self.prefix_sum(index_start)
+
+    def total(self) -> float:
+        """Sums all values.
+
+        Returns
+        -------
+        :class:`float`
+            Sum of all values.
+        """
+
+        return self.prefix_sum(len(self.__values))
+
+    def update(self, index: int, value: float) -> None:
+        """Updates the value at the specified index.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the value to update.
+        value
+            Specifies the new value.
+        """
+
+        if index < 0 or index >= len(self.__values):
+            raise Exception("Index out of bounds!")
+
+        delta = float(value) - self.__values[index]
+        self.__values[index] = float(value)
+        i = index + 1
+        while i <= len(self.__values):
+            self.__tree[i] += delta
+            i += self.__lowbit(i)
+
+    def append(self, value: float) -> None:
+        """Appends a value at the end.
+
+        Parameters
+        ----------
+        value
+            Specifies the value to append.
+        """
+
+        i = len(self.__values) + 1
+        # Node i covers (i - lowbit(i), i], of which all but the new value already exist
+        node = (
+            float(value)
+            + self.prefix_sum(i - 1)
+            - self.prefix_sum(i - self.__lowbit(i))
+        )
+        self.__values.append(float(value))
+        self.__tree.append(node)
+
+    def insert(self, index: int, value: float) -> None:
+        """Inserts a value at the specified index.
+
+        Parameters
+        ----------
+        index
+            Specifies the index at which the value is to be inserted.
+        value
+            Specifies the value to insert.
+        """
+
+        if index < 0 or index > len(self.__values):
+            raise Exception("Index out of bounds!")
+
+        if index == len(self.__values):
+            self.append(value)
+            return
+
+        self.__values.insert(index, float(value))
+        self.__build()
+
+    def remove(self, index: int) -> float:
+        """Removes the value at the specified index.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the value to remove.
+
+        Returns
+        -------
+        :class:`float`
+            The removed value.
+        """
+
+        if index < 0 or index >= len(self.__values):
+            raise Exception("Index out of bounds!")
+
+        value = self.__values.pop(index)
+        if index == len(self.__values):
+            # Nodes never cover positions beyond themselves, so popping the tail is enough
+            self.__tree.pop()
+        else:
+            self.__build()
+        return value
+
+
+class MArrayLayout:
+    """A class that computes the geometry of an array without instantiating any mobject.
+
+    Positions and sizes are computed from the side lengths of the elements and the style parameters of the array. :class:`~.m_array.MArray`, :class:`~.m_array.MArrayPointer` and :class:`~.m_array.MArraySlidingWindow` only apply its results, so a layout can be computed and validated without rendering anything.
+
+    Parameters
+    ----------
+    side_lengths
+        Specifies the side lengths of the elements.
+    arr_dir
+        Specifies the growth direction of the array.
+    start
+        Specifies the point where the first element begins. Defaults to centering the first element at the origin.
+    switch_index_pos
+        If `True`, places the indices on the other side of the array.
+    index_gap
+        Specifies the distance between the indices and the elements.
+    arr_label_pos
+        Specifies the position of the array label w.r.t the array.
+    arr_label_gap
+        Specifies the distance between the array label and the array.
+
+    Attributes
+    ----------
+    __tree : :class:`MFenwickTree`
+        The side lengths of the elements.
+    __arr_dir : :class:`~.m_enum.MArrayDirection`
+        The growth direction of the array.
+    __start_np : :class:`np.ndarray`
+        The point where the first element begins.
+    __switch_index_pos : :class:`bool`
+        If `True`, places the indices on the other side of the array.
+    __index_gap : :class:`float`
+        The distance between the indices and the elements.
+    __arr_label_pos : :class:`~.m_enum.MArrayDirection`
+        The position of the array label w.r.t the array.
+    __arr_label_gap : :class:`float`
+        The distance between the array label and the array.
+    """
+
+    __dir_map = [
+        np.array([0.0, 1.0, 0.0]),
+        np.array([0.0, -1.0, 0.0]),
+        np.array([1.0, 0.0, 0.0]),
+        np.array([-1.0, 0.0, 0.0]),
+    ]
+    """Maps :class:`~.m_enum.MArrayDirection` to :class:`np.ndarray`."""
+
+    @staticmethod
+    def calc_next_to(
+        center_np: np.ndarray,
+        half_np: np.ndarray,
+        direction_np: np.ndarray,
+        buff: float,
+        mob_half_np: np.ndarray,
+    ) -> np.ndarray:
+        """Calculates where a box ends up when placed next to another box, like :meth:`~manim.mobject.mobject.Mobject.next_to` does.
+
+        Parameters
+        ----------
+        center_np
+            Specifies the center of the box to place next to.
+        half_np
+            Specifies the half dimensions of the box to place next to.
+        direction_np
+            Specifies the direction of placement.
+        buff
+            Specifies the distance between the boxes.
+        mob_half_np
+            Specifies the half dimensions of the box being placed.
+
+        Returns
+        -------
+        :class:`np.ndarray`
+            Center of the box being placed.
+        """
+
+        direction_np = np.asarray(direction_np, dtype=float)
+        sign_np = np.sign(direction_np)
+        return (
+            np.asarray(center_np, dtype=float)
+            + sign_np * np.asarray(half_np, dtype=float)
+            + direction_np * buff
+            + sign_np * np.asarray(mob_half_np, dtype=float)
+        )
+
+    def __reset_start(self) -> None:
+        """Centers the first element at the origin once an empty array receives an element."""
+
+        if len(self.__tree):
+            self.__start_np = -self.fetch_dir_np() * (self.__tree.fetch_value(0) / 2)
+
+    def __init__(
+        self,
+        side_lengths: typing.Iterable[float] = (),
+        arr_dir: MArrayDirection = MArrayDirection.RIGHT,
+        start: np.ndarray = None,
+        switch_index_pos: bool = False,
+        index_gap: float = 0.25,
+        arr_label_pos: MArrayDirection = MArrayDirection.LEFT,
+        arr_label_gap: float = 0.5,
+    ) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        side_lengths
+            Specifies the side lengths of the elements.
+        arr_dir
+            Specifies the growth direction of the array.
+        start
+            Specifies the point where the first element begins. Defaults to centering the first element at the origin.
+        switch_index_pos
+            If `True`, places the indices on the other side of the array.
+        index_gap
+            Specifies the distance between the indices and the elements.
+        arr_label_pos
+            Specifies the position of the array label w.r.t the array.
+        arr_label_gap
+            Specifies the distance between the array label and the array.
+        """
+
+        self.__tree: MFenwickTree = MFenwickTree(side_lengths)
+        self.__arr_dir: MArrayDirection = arr_dir
+        self.__start_np: np.ndarray = np.zeros(3)
+        self.__switch_index_pos: bool = switch_index_pos
+        self.__index_gap: float = index_gap
+        self.__arr_label_pos: MArrayDirection = arr_label_pos
+        self.__arr_label_gap: float = arr_label_gap
+
+        if start is None:
+            self.__reset_start()
+        else:
+            self.__start_np = np.array(start, dtype=float)
+
+    def __len__(self) -> int:
+        """Returns the number of elements."""
+
+        return len(self.__tree)
+
+    def fetch_tree(self) -> MFenwickTree:
+        """Fetches the side lengths of the elements.
+
+        Returns
+        -------
+        :class:`MFenwickTree`
+            :attr:`__tree`.
+        """
+
+        return self.__tree
+
+    def fetch_start(self) -> np.ndarray:
+        """Fetches the point where the first element begins.
+
+        Returns
+        -------
+        :class:`np.ndarray`
+            :attr:`__start_np`.
+        """
+
+        return self.__start_np
+
+    def fetch_dir_np(self) -> np.ndarray:
+        """Fetches the growth direction vector of the array.
+
+        Returns
+        -------
+        :class:`np.ndarray`
+            Unit vector of :attr:`__arr_dir`.
+        """
+
+        return self.__dir_map[self.__arr_dir.value]
+
+    def set_start(self, start: np.ndarray) -> None:
+        """Moves the array so that the first element begins at the specified point.
+
+        Parameters
+        ----------
+        start
+            Specifies the point where the first element begins.
+        """
+
+        self.__start_np = np.array(start, dtype=float)
+
+    def shift(self, vector: np.ndarray) -> None:
+        """Moves the array by the specified vector.
+
+        Parameters
+        ----------
+        vector
+            Specifies the vector to move by.
+        """
+
+        self.__start_np = self.__start_np + np.asarray(vector, dtype=float)
+
+    def append(self, side_length: float) -> None:
+        """Appends an element.
+
+        Parameters
+        ----------
+        side_length
+            Specifies the side length of the element.
+        """
+
+        self.__tree.append(side_length)
+        if len(self.__tree) == 1:
+            self.__reset_start()
+
+    def extend(self, side_lengths: typing.Iterable[float]) -> None:
+        """Appends elements in bulk.
+
+        Parameters
+        ----------
+        side_lengths
+            Specifies the side lengths of the elements.
+        """
+
+        if len(self.__tree):
+            for side_length in side_lengths:
+                self.__tree.append(side_length)
+        else:
+            self.__tree = MFenwickTree(side_lengths)
+            self.__reset_start()
+
+    def insert(self, index: int, side_length: float) -> None:
+        """Inserts an element at the specified index. The first element keeps where it begins.
+
+        Parameters
+        ----------
+        index
+            Specifies the index at which the element is to be inserted.
+        side_length
+            Specifies the side length of the element.
+        """
+
+        self.__tree.insert(index, side_length)
+        if len(self.__tree) == 1:
+            self.__reset_start()
+
+    def update_side_length(self, index: int, side_length: float) -> None:
+        """Replaces the side length of the element at the specified index. The first element keeps where it begins.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element.
+        side_length
+            Specifies the side length of the element.
+        """
+
+        self.__tree.update(index, side_length)
+
+    def update_side_lengths(self, side_lengths: typing.Iterable[float]) -> None:
+        """Replaces the side lengths of all elements. The first element keeps where it begins.
+
+        Parameters
+        ----------
+        side_lengths
+            Specifies the side lengths of the elements.
+        """
+
+        self.__tree = MFenwickTree(side_lengths)
+
+    def remove(self, index: int) -> float:
+        """Removes the element at the specified index. The following elements close the gap.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element to remove.
+
+        Returns
+        -------
+        :class:`float`
+            Side length of the removed element.
+        """
+
+        return self.__tree.remove(index)
+
+    def calc_elems_len(self, index_start: int, index_end: int) -> float:
+        """Calculates the total length of the elements between the specified range.
+
+        Parameters
+        ----------
+        index_start
+            Starting index of the range (inclusive).
+        index_end
+            Ending index of the range (inclusive).
+
+        Returns
+        -------
+        :class:`float`
+            Sum of the side lengths in the range.
+        """
+
+        return self.__tree.range_sum(index_start, index_end)
+
+    def calc_elem_center(self, index: int) -> np.ndarray:
+        """Calculates the center of the specified element.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element.
+
+        Returns
+        -------
+        :class:`np.ndarray`
+            Center of the element.
+        """
+
+        if index < 0 or index >= len(self.__tree):
+            raise Exception("Index out of bounds!")
+
+        return self.__start_np + self.fetch_dir_np() * (
+            self.__tree.prefix_sum(index) + self.__tree.fetch_value(index) / 2
+        )
+
+    def calc_elem_centers(
+        self, index_start: int = 0, index_end: int = None
+    ) -> np.ndarray:
+        """Calculates the centers of the elements between the specified range in a single pass.
+
+        Parameters
+        ----------
+        index_start
+            Starting index of the range (inclusive).
+        index_end
+            Ending index of the range (exclusive). Defaults to the number of elements.
+
+        Returns
+        -------
+        :class:`np.ndarray`
+            Centers of the elements, one per row.
+        """
+
+        if index_end is None:
+            index_end = len(self.__tree)
+
+        side_lens = np.array(
+            self.__tree.fetch_values()[index_start:index_end], dtype=float
+        )
+        offsets = (
+            self.__tree.prefix_sum(index_start) + np.cumsum(side_lens) - side_lens / 2
+        )
+        return self.__start_np + np.outer(offsets, self.fetch_dir_np())
+
+    def calc_index_dir(self) -> np.ndarray:
+        """Calculates the position of the indices w.r.t the elements.
+
+        Returns
+        -------
+        :class:`np.ndarray`
+            Direction vector of the indices.
+        """
+
+        if self.__arr_dir in (MArrayDirection.UP, MArrayDirection.DOWN):
+            index_dir_np = self.__dir_map[MArrayDirection.RIGHT.value]
+        else:
+            index_dir_np = self.__dir_map[MArrayDirection.UP.value]
+
+        return -index_dir_np if self.__switch_index_pos else index_dir_np
+
+    def calc_index_center(self, index: int, index_half_np: np.ndarray) -> np.ndarray:
+        """Calculates the center of the index of the specified element.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element.
+        index_half_np
+            Specifies the half dimensions of the index.
+
+        Returns
+        -------
+        :class:`np.ndarray`
+            Center of the index.
+        """
+
+        side_len = self.__tree.fetch_value(index)
+        return self.calc_next_to(
+            self.calc_elem_center(index),
+            np.array([side_len / 2, side_len / 2, 0]),
+            self.calc_index_dir(),
+            self.__index_gap,
+            index_half_np,
+        )
+
+    def calc_arr_label_center(self, label_half_np: np.ndarray) -> np.ndarray:
+        """Calculates the center of the array label.
+
+        A label along the growth direction is placed next to the first or last element. Otherwise it is centered along the array.
+
+        Parameters
+        ----------
+        label_half_np
+            Specifies the half dimensions of the array label.
+
+        Returns
+        -------
+        :class:`np.ndarray`
+            Center of the array label.
+        """
+
+        if not len(self.__tree):
+            return np.array(self.__start_np)
+
+        arr_dir_np = self.fetch_dir_np()
+        label_dir_np = self.__dir_map[self.__arr_label_pos.value]
+
+        if np.array_equal(label_dir_np, arr_dir_np):
+            index = len(self.__tree) - 1
+            center_np = self.calc_elem_center(index)
+        elif np.array_equal(label_dir_np, -arr_dir_np):
+            index = 0
+            center_np = self.calc_elem_center(index)
+        else:
+            index = len(self.__tree) // 2
+            center_np = self.__start_np + arr_dir_np * (self.__tree.total() / 2)
+
+        side_len = self.__tree.fetch_value(index)
+        return self.calc_next_to(
+            center_np,
+            np.array([side_len / 2, side_len / 2, 0]),
+            label_dir_np,
+            self.__arr_label_gap,
+            label_half_np,
+        )
+
+    def calc_arrow_dir(
+        self, pointer_pos: MArrayDirection
+    ) -> typing.Tuple[np.ndarray, MArrayDirection]:
+        """Calculates the direction of a pointer arrow. Pointers along the growth direction are turned to its side.
+
+        Parameters
+        ----------
+        pointer_pos
+            Specifies the position of the pointer w.r.t the array.
+
+        Returns
+        -------
+        :class:`np.ndarray`
+            Direction vector of the arrow.
+        :class:`~.m_enum.MArrayDirection`
+            Position of the pointer once turned.
+        """
+
+        arrow_pos_np = np.copy(self.__dir_map[pointer_pos.value])
+
+        # If array's direction and pointer's direction are not perpendicular to each other
+        if np.dot(self.fetch_dir_np(), arrow_pos_np):
+            arrow_pos_np[0], arrow_pos_np[1] = arrow_pos_np[1], arrow_pos_np[0]
+            pointer_pos = MArrayDirection((pointer_pos.value + 2) % len(self.__dir_map))
+
+        return (arrow_pos_np, pointer_pos)
+
+    def calc_pointer_center(
+        self,
+        index: int,
+        pointer_pos: MArrayDirection,
+        arrow_gap: float,
+        pointer_half_np: np.ndarray,
+    ) -> np.ndarray:
+        """Calculates the center of a pointer attached to the specified element.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element.
+        pointer_pos
+            Specifies the position of the pointer w.r.t the array.
+        arrow_gap
+            Specifies the distance between the pointer and the element.
+        pointer_half_np
+            Specifies the half dimensions of the pointer.
+
+        Returns
+        -------
+        :class:`np.ndarray`
+            Center of the pointer.
+        """
+
+        (arrow_pos_np, _) = self.calc_arrow_dir(pointer_pos)
+        side_len = self.__tree.fetch_value(index)
+        return self.calc_next_to(
+            self.calc_elem_center(index),
+            np.array([side_len / 2, side_len / 2, 0]),
+            arrow_pos_np,
+            arrow_gap,
+            pointer_half_np,
+        )
+
+    def calc_window_dim(self, index: int, size: int) -> typing.Tuple[float, float]:
+        """Calculates the dimensions of a sliding window.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the first enclosed element.
+        size
+            Specifies the number of enclosed elements.
+
+        Returns
+        -------
+        :class:`float`
+            Height of the window.
+        :class:`float`
+            Width of the window.
+        """
+
+        height = self.__tree.fetch_value(index)
+        width = self.__tree.range_sum(index, index + size - 1)
+
+        if self.__arr_dir in (MArrayDirection.UP, MArrayDirection.DOWN):
+            height, width = width, height
+
+        return (height, width)
+
+    def calc_window_align(self) -> np.ndarray:
+        """Calculates the edge of a sliding window that is aligned with its first enclosed element.
+
+        Returns
+        -------
+        :class:`np.ndarray`
+            Direction vector of the edge.
+        """
+
+        return -self.fetch_dir_np()
+
+    def calc_window_center(self, index: int, size: int) -> np.ndarray:
+        """Calculates the center of a sliding window.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the first enclosed element.
+        size
+            Specifies the number of enclosed elements.
+
+        Returns
+        -------
+        :class:`np.ndarray`
+            Center of the window.
+        """
+
+        return self.__start_np + self.fetch_dir_np() * (
+            self.__tree.prefix_sum(index)
+            + self.__tree.range_sum(index, index + size - 1) / 2
+        )
+
+    def calc_window_label_dir(self, label_pos: MArrayDirection) -> np.ndarray:
+        """Calculates the position of a sliding window label w.r.t the window. Labels along the growth direction are turned to its side.
+
+        Parameters
+        ----------
+        label_pos
+            Specifies the position of the label w.r.t the window.
+
+        Returns
+        -------
+        :class:`np.ndarray`
+            Direction vector of the label.
+        """
+
+        label_dir_np = self.__dir_map[label_pos.value]
+        if np.dot(self.fetch_dir_np(), label_dir_np):
+            return self.__dir_map[(label_pos.value + 2) % len(self.__dir_map)]
+        return label_dir_np
@@ -0,0 +1,401 @@
+"""Contains classes to construct a queue."""
+
+from manim import *
+
+from .m_array import MArray, MArrayPointer
+from .m_enum import MArrayDirection
+from .m_stats import stats
+
+
+class MQueue(VGroup):
+    """A class that represents a fixed-capacity circular queue.
+
+    The queue is a ring buffer over an :class:`~.m_array.MArray` with one slot per unit of capacity. A head and a tail :class:`~.m_array.MArrayPointer` mark the front of the queue and the next free slot and wrap around to the first slot past the last one. Enqueueing and dequeueing only update the value of one slot and shift one pointer, so no element is moved or re-indexed and every operation plays a constant number of animations regardless of the capacity.
+
+    Parameters
+    ----------
+    scene
+        Specifies the scene where the object is to be rendered.
+    capacity
+        Specifies the number of slots of the queue.
+    arr
+        Specifies the initial values of the queue, front first.
+    empty_value
+        Specifies the value displayed by empty slots.
+    mob_head_args
+        Arguments for :class:`~.m_array.MArrayPointer` that represents the head pointer.
+    mob_tail_args
+        Arguments for :class:`~.m_array.MArrayPointer` that represents the tail pointer.
+    **kwargs
+        Forwarded to constructor of :class:`~.m_array.MArray`.
+
+    Attributes
+    ----------
+    __scene : :class:`~manim.scene.scene.Scene`
+        The scene where the object is to be rendered.
+    __capacity : :class:`int`
+        The number of slots of the queue.
+    __empty_value : Any
+        The value displayed by empty slots.
+    __head : :class:`int`
+        The slot of the front of the queue.
+    __tail : :class:`int`
+        The slot the next enqueued value is written to.
+    __size : :class:`int`
+        The number of values in the queue.
+    __mob_head_props : :class:`dict`
+        Arguments for :class:`~.m_array.MArrayPointer` that represents the head pointer.
+    __mob_tail_props : :class:`dict`
+        Arguments for :class:`~.m_array.MArrayPointer` that represents the tail pointer.
+    __mob_arr : :class:`~.m_array.MArray`
+        Represents the slots of the queue.
+    __mob_head : :class:`~.m_array.MArrayPointer`
+        Represents the head pointer.
+    __mob_tail : :class:`~.m_array.MArrayPointer`
+        Represents the tail pointer.
+    """
+
+    def __init_props(
+        self, scene: Scene, capacity: int, arr: list, empty_value: Any
+    ) -> None:
+        """Initializes the attributes for the class.
+
+        Parameters
+        ----------
+        scene
+            Specifies the scene where the object is to be rendered.
+        capacity
+            Specifies the number of slots of the queue.
+        arr
+            Specifies the initial values of the queue, front first.
+        empty_value
+            Specifies the value displayed by empty slots.
+        """
+
+        self.__mob_head_props: dict = {
+            "label": "head",
+            "pointer_pos": MArrayDirection.UP,
+            "arrow_gap": 0.75,
+        }
+        self.__mob_tail_props: dict = {
+            "label": "tail",
+            "pointer_pos": MArrayDirection.DOWN,
+        }
+        self.__scene: Scene = scene
+        self.__capacity: int = capacity
+        self.__empty_value: Any = empty_value
+        self.__head: int = 0
+        self.__tail: int = len(arr) % capacity
+        self.__size: int = len(arr)
+
+    def __update_props(
+        self, mob_head_args: dict = {}, mob_tail_args: dict = {}
+    ) -> None:
+        """Updates the attributes of the class.
+
+        Parameters
+        ----------
+        mob_head_args
+            Arguments for :class:`~.m_array.MArrayPointer` that represents the head pointer.
+        mob_tail_args
+            Arguments for :class:`~.m_array.MArrayPointer` that represents the tail pointer.
+        """
+
+        self.__mob_head_props.update(mob_head_args)
+        self.__mob_tail_props.update(mob_tail_args)
+
+    def __init_mobs(self, arr: list, arr_args: dict) -> None:
+        """Initializes the mobjects for the class.
+
+        Parameters
+        ----------
+        arr
+            Specifies the initial values of the queue, front first.
+        arr_args
+            Arguments for :class:`~.m_array.MArray` that represents the slots of the queue.
+        """
+
+        self.__mob_arr: MArray = MArray(
+            self.__scene,
+            list(arr) + [self.__empty_value] * (self.__capacity - len(arr)),
+            **arr_args
+        )
+        self.__mob_head: MArrayPointer = MArrayPointer(
+            self.__scene, self.__mob_arr, self.__head, **self.__mob_head_props
+        )
+        self.__mob_tail: MArrayPointer = MArrayPointer(
+            self.__scene, self.__mob_arr, self.__tail, **self.__mob_tail_props
+        )
+        self.add(self.__mob_arr, self.__mob_head, self.__mob_tail)
+
+    def __init__(
+        self,
+        scene: Scene,
+        capacity: int,
+        arr: list = [],
+        empty_value: Any = "",
+        mob_head_args: dict = {},
+        mob_tail_args: dict = {},
+        **kwargs
+    ) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        scene
+            Specifies the scene where the object is to be rendered.
+        capacity
+            Specifies the number of slots of the queue.
+        arr
+            Specifies the initial values of the queue, front first.
+        empty_value
+            Specifies the value displayed by empty slots.
+        mob_head_args
+            Arguments for :class:`~.m_array.MArrayPointer` that represents the head pointer.
+        mob_tail_args
+            Arguments for :class:`~.m_array.MArrayPointer` that represents the tail pointer.
+        **kwargs
+            Forwarded to constructor of :class:`~.m_array.MArray`.
+        """
+
+        if capacity < 1:
+            raise Exception("Invalid queue capacity!")
+
+        if len(arr) > capacity:
+            raise Exception("Queue is full!")
+
+        super().__init__()
+
+        # Initialize props
+        self.__init_props(scene, capacity, arr, empty_value)
+
+        # Update props
+        self.__update_props(mob_head_args, mob_tail_args)
+
+        # Initialize mobjects
+        self.__init_mobs(arr, kwargs)
+
+    def fetch_arr(self) -> list:
+        """Fetches the values of the queue.
+
+        Returns
+        -------
+        :class:`list`
+            Values of the queue, front first.
+        """
+
+        slots = self.__mob_arr.fetch_arr()
+        return [slots[(self.__head + i) % self.__capacity] for i in range(self.__size)]
+
+    def fetch_front(self) -> Any:
+        """Fetches the value at the front of the queue.
+
+        Returns
+        -------
+        Any
+            The value at the front of the queue.
+        """
+
+        if not self.__size:
+            raise Exception("Queue is empty!")
+
+        return self.__mob_arr.fetch_arr()[self.__head]
+
+    def fetch_capacity(self) -> int:
+        """Fetches the number of slots of the queue.
+
+        Returns
+        -------
+        :class:`int`
+            :attr:`__capacity`.
+        """
+
+        return self.__capacity
+
+    def fetch_size(self) -> int:
+        """Fetches the number of values in the queue.
+
+        Returns
+        -------
+        :class:`int`
+            :attr:`__size`.
+        """
+
+        return self.__size
+
+    def fetch_head(self) -> int:
+        """Fetches the slot of the front of the queue.
+
+        Returns
+        -------
+        :class:`int`
+            :attr:`__head`.
+        """
+
+        return self.__head
+
+    def fetch_tail(self) -> int:
+        """Fetches the slot the next enqueued value is written to.
+
+        Returns
+        -------
+        :class:`int`
+            :attr:`__tail`.
+        """
+
+        return self.__tail
+
+    def fetch_mob_arr(self) -> MArray:
+        """Fetches the array that represents the slots of the queue.
+
+        Returns
+        -------
+        :class:`~.m_array.MArray`
+            :attr:`__mob_arr`.
+        """
+
+        return self.__mob_arr
+
+    def fetch_mob_head(self) -> MArrayPointer:
+        """Fetches the head pointer of the queue.
+
+        Returns
+        -------
+        :class:`~.m_array.MArrayPointer`
+            :attr:`__mob_head`.
+        """
+
+        return self.__mob_head
+
+    def fetch_mob_tail(self) -> MArrayPointer:
+        """Fetches the tail pointer of the queue.
+
+        Returns
+        -------
+        :class:`~.m_array.MArrayPointer`
+            :attr:`__mob_tail`.
+        """
+
+        return self.__mob_tail
+
+    def is_empty(self) -> bool:
+        """Checks whether the queue holds no values.
+
+        Returns
+        -------
+        :class:`bool`
+            `True` if :attr:`__size` is `0`.
+        """
+
+        return self.__size == 0
+
+    def is_full(self) -> bool:
+        """Checks whether every slot of the queue holds a value.
+
+        Returns
+        -------
+        :class:`bool`
+            `True` if :attr:`__size` equals :attr:`__capacity`.
+        """
+
+        return self.__size == self.__capacity
+
+    def enqueue(
+        self,
+        value: Any,
+        mob_value_args: dict = {},
+        update_anim: Animation = Write,
+        update_anim_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> typing.List[Animation]:
+        """Writes a value to the tail slot and advances the tail pointer, wrapping around past the last slot.
+
+        Parameters
+        ----------
+        value
+            Specifies the value to enqueue.
+        mob_value_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the element value.
+        update_anim
+            Animation to be applied to the written value.
+        update_anim_args
+            Arguments for update :class:`~manim.animation.animation.Animation`.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`~manim.animation.animation.Animation`]
+            List of enqueue animations.
+        """
+
+        if self.__size == self.__capacity:
+            raise Exception("Queue is full!")
+
+        mob_value = self.__mob_arr.update_elem_value(
+            self.__tail, value, mob_value_args, play_anim=False
+        )
+        self.__tail = (self.__tail + 1) % self.__capacity
+        self.__size += 1
+
+        anim_list = [
+            update_anim(mob_value, **update_anim_args),
+            self.__mob_tail.shift_to_elem(self.__tail, play_anim=False),
+        ]
+
+        if play_anim:
+            stats.play(self.__scene, *anim_list, **play_anim_args)
+
+        return anim_list
+
+    def dequeue(
+        self,
+        removal_anim: Animation = FadeOut,
+        removal_anim_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> typing.List[Animation]:
+        """Clears the head slot and advances the head pointer, wrapping around past the last slot.
+
+        Parameters
+        ----------
+        removal_anim
+            Animation to be applied to the dequeued value.
+        removal_anim_args
+            Arguments for removal :class:`~manim.animation.animation.Animation`.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`~manim.animation.animation.Animation`]
+            List of dequeue animations.
+        """
+
+        if not self.__size:
+            raise Exception("Queue is empty!")
+
+        mob_value = self.__mob_arr.fetch_mob_arr()[self.__head].fetch_mob_value()
+        self.__mob_arr.update_elem_value(
+            self.__head, self.__empty_value, play_anim=False
+        )
+        self.__head = (self.__head + 1) % self.__capacity
+        self.__size -= 1
+
+        anim_list = [
+            removal_anim(mob_value, **removal_anim_args),
+            self.__mob_head.shift_to_elem(self.__head, play_anim=False),
+        ]
+
+        if play_anim:
+            stats.play(self.__scene, *anim_list, **play_anim_args)
+
+        return anim_list
+
+
+stats.register(MQueue)
@@ -0,0 +1,503 @@
+"""Contains classes to record operations on an array and compile them into animations."""
+
+from manim import *
+
+from .m_array import MArray, MArrayPointer
+from .m_enum import MArrayElementComp
+from .m_stats import stats
+
+
+class MArrayRecordedValue:
+    """A class that represents a value read from a :class:`MArrayRecorder`.
+
+    Comparing two recorded values records a compare operation between the elements they were read from.
+
+    Parameters
+    ----------
+    recorder
+        Specifies the recorder the value was read from.
+    value
+        Specifies the value.
+    index
+        Specifies the index of the element the value was read from.
+    version
+        Specifies the version of the element when the value was read.
+
+    Attributes
+    ----------
+    __recorder : :class:`MArrayRecorder`
+        The recorder the value was read from.
+    __value : Any
+        The value.
+    __index : :class:`int`
+        The index of the element the value was read from.
+    __version : :class:`int`
+        The version of the element when the value was read.
+    """
+
+    def __init__(
+        self, recorder: "MArrayRecorder", value: Any, index: int, version: int
+    ) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        recorder
+            Specifies the recorder the value was read from.
+        value
+            Specifies the value.
+        index
+            Specifies the index of the element the value was read from.
+        version
+            Specifies the version of the element when the value was read.
+        """
+
+        self.__recorder: "MArrayRecorder" = recorder
+        self.__value: Any = value
+        self.__index: int = index
+        self.__version: int = version
+
+    def __compare(self, other: Any) -> Any:
+        """Records a compare operation with the other value and unwraps it.
+
+        Parameters
+        ----------
+        other
+            Specifies the value compared with.
+
+        Returns
+        -------
+        Any
+            The unwrapped other value.
+        """
+
+        if isinstance(other, MArrayRecordedValue):
+            self.__recorder._MArrayRecorder__record_compare(self, other)
+            return other.fetch_value()
+        return other
+
+    def fetch_value(self) -> Any:
+        """Fetches the value.
+
+        Returns
+        -------
+        Any
+            :attr:`__value`.
+        """
+
+        return self.__value
+
+    def fetch_source(self) -> typing.Tuple[int, int]:
+        """Fetches where the value was read from.
+
+        Returns
+        -------
+        :class:`int`
+            :attr:`__index`.
+        :class:`int`
+            :attr:`__version`.
+        """
+
+        return (self.__index, self.__version)
+
+    def __lt__(self, other: Any) -> bool:
+        return self.__value < self.__compare(other)
+
+    def __le__(self, other: Any) -> bool:
+        return self.__value <= self.__compare(other)
+
+    def __gt__(self, other: Any) -> bool:
+        return self.__value > self.__compare(other)
+
+    def __ge__(self, other: Any) -> bool:
+        return self.__value >= self.__compare(other)
+
+    def __eq__(self, other: Any) -> bool:
+        return self.__value == self.__compare(other)
+
+    def __ne__(self, other: Any) -> bool:
+        return self.__value != self.__compare(other)
+
+    def __hash__(self) -> int:
+        return hash(self.__value)
+
+    def __str__(self) -> str:
+        return str(self.__value)
+
+    def __repr__(self) -> str:
+        return repr(self.__value)
+
+
+class MArrayRecorder:
+    """A class that records the operations a function performs on an array.
+
+    The recorder behaves like a :class:`list` holding the values of the array. Reads return :class:`MArrayRecordedValue`\0s, so an unmodified sorting function records compare and write operations. The array itself is left untouched until the compiled :class:`MArrayTrace` is played.
+
+    Parameters
+    ----------
+    scene
+        Specifies the scene where the array is rendered.
+    arr
+        Specifies the array to record operations for.
+
+    Attributes
+    ----------
+    __scene : :class:`~manim.scene.scene.Scene`
+        The scene where the array is rendered.
+    __arr : :class:`~.m_array.MArray`
+        The array to record operations for.
+    __values : :class:`list`
+        The current values of the recorded array.
+    __versions : :class:`~typing.List`\0[:class:`int`]
+        The number of writes to each element.
+    __ops : :class:`~typing.List`\0[:class:`tuple`]
+        The recorded operations. Either `("compare", indices)` or `("write", index, value, source, version)`, where `source` is the `(index, version)` the written value was read from and `version` is the version of the element before the write.
+    """
+
+    def __init__(self, scene: Scene, arr: MArray) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        scene
+            Specifies the scene where the array is rendered.
+        arr
+            Specifies the array to record operations for.
+        """
+
+        self.__scene: Scene = scene
+        self.__arr: MArray = arr
+        self.__values: list = list(arr.fetch_arr())
+        self.__versions: typing.List[int] = [0] * len(self.__values)
+        self.__ops: typing.List[tuple] = []
+
+    def __record_compare(
+        self, value_1: MArrayRecordedValue, value_2: MArrayRecordedValue
+    ) -> None:
+        """Records a compare operation between the elements the values were read from.
+
+        Values read before their element was overwritten no longer live in the array and are left out.
+
+        Parameters
+        ----------
+        value_1
+            Specifies the first compared value.
+        value_2
+            Specifies the second compared value.
+        """
+
+        indices = []
+        for value in (value_1, value_2):
+            (index, version) = value.fetch_source()
+            if self.__versions[index] == version and index not in indices:
+                indices.append(index)
+
+        if len(indices):
+            self.__ops.append(("compare", tuple(indices)))
+
+    def __len__(self) -> int:
+        """Returns the number of values."""
+
+        return len(self.__values)
+
+    def __getitem__(
+        self, index: typing.Union[int, slice]
+    ) -> typing.Union[MArrayRecordedValue, typing.List[MArrayRecordedValue]]:
+        """Reads the value at the specified index."""
+
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.__values)))]
+
+        if index < 0:
+            index += len(self.__values)
+        if index < 0 or index >= len(self.__values):
+            raise IndexError("Index out of bounds!")
+
+        return MArrayRecordedValue(
+            self, self.__values[index], index, self.__versions[index]
+        )
+
+    def __setitem__(self, index: typing.Union[int, slice], value: Any) -> None:
+        """Records a write of the value at the specified index.
+
+        A slice is assigned element by element and must keep the length of the array.
+        """
+
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self.__values)))
+            values = list(value)
+            if len(values) != len(indices):
+                raise ValueError("Slice assignment can't change the array length!")
+            for i, v in zip(indices, values):
+                self[i] = v
+            return
+
+        if index < 0:
+            index += len(self.__values)
+        if index < 0 or index >= len(self.__values):
+            raise IndexError("Index out of bounds!")
+
+        source = None
+        if isinstance(value, MArrayRecordedValue):
+            source = value.fetch_source()
+            value = value.fetch_value()
+
+        self.__ops.append(("write", index, value, source, self.__versions[index]))
+        self.__values[index] = value
+        self.__versions[index] += 1
+
+    def __iter__(self) -> typing.Iterator[MArrayRecordedValue]:
+        """Reads the values in order."""
+
+        for i in range(len(self.__values)):
+            yield self[i]
+
+    def fetch_values(self) -> list:
+        """Fetches the current values of the recorded array.
+
+        Returns
+        -------
+        :class:`list`
+            :attr:`__values`.
+        """
+
+        return self.__values
+
+    def fetch_ops(self) -> typing.List[tuple]:
+        """Fetches the recorded operations.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`tuple`]
+            :attr:`__ops`.
+        """
+
+        return self.__ops
+
+    def compile(self, fold_writes: bool = True) -> "MArrayTrace":
+        """Compiles the recorded operations into rounds of independent operations.
+
+        Pairs of writes that exchange two elements are turned into swaps. Every operation is then placed in the earliest round after the last operation on the same elements, so operations on disjoint elements share a round.
+
+        Parameters
+        ----------
+        fold_writes
+            If `True`, drops writes that are overwritten before the element is read.
+
+        Returns
+        -------
+        :class:`MArrayTrace`
+            The compiled trace.
+        """
+
+        # Turn write pairs that exchange two elements into swaps
+        ops = []
+        k = 0
+        while k < len(self.__ops):
+            op = self.__ops[k]
+            if op[0] == "write" and op[3] is not None and k + 1 < len(self.__ops):
+                next_op = self.__ops[k + 1]
+                if (
+                    next_op[0] == "write"
+                    and next_op[3] is not None
+                    and op[1] != next_op[1]
+                    and op[3] == (next_op[1], next_op[4])
+                    and next_op[3] == (op[1], op[4])
+                ):
+                    ops.append(("swap", (op[1], next_op[1])))
+                    k += 2
+                    continue
+            if op[0] == "write":
+                ops.append(("write", (op[1],), op[2], op[3]))
+            else:
+                ops.append(op)
+            k += 1
+
+        # Drop writes that are overwritten before being read
+        if fold_writes:
+            last_write = {}
+            for k, op in enumerate(ops):
+                read_indices = list(op[1]) if op[0] != "write" else []
+                if op[0] == "write" and op[3] is not None:
+                    read_indices.append(op[3][0])
+                for i in read_indices:
+                    last_write.pop(i, None)
+                if op[0] == "write":
+                    if op[1][0] in last_write:
+                        ops[last_write[op[1][0]]] = None
+                    last_write[op[1][0]] = k
+            ops = [op for op in ops if op is not None]
+
+        # Place each operation in the earliest round its elements are free in
+        rounds = []
+        free_round = {}
+        for op in ops:
+            r = max(free_round.get(i, 0) for i in op[1])
+            if r == len(rounds):
+                rounds.append([])
+            rounds[r].append(op)
+            for i in op[1]:
+                free_round[i] = r + 1
+
+        return MArrayTrace(self.__scene, self.__arr, rounds)
+
+
+class MArrayTrace:
+    """A class that represents operations on an array compiled into rounds that are each played with a single :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+    Parameters
+    ----------
+    scene
+        Specifies the scene where the array is rendered.
+    arr
+        Specifies the array the operations are played on.
+    rounds
+        Specifies the rounds of operations. Operations of a round touch disjoint elements.
+
+    Attributes
+    ----------
+    __scene : :class:`~manim.scene.scene.Scene`
+        The scene where the array is rendered.
+    __arr : :class:`~.m_array.MArray`
+        The array the operations are played on.
+    __rounds : :class:`~typing.List`\0[:class:`~typing.List`\0[:class:`tuple`]]
+        The rounds of operations. Either `("compare", indices)`, `("swap", indices)` or `("write", (index,), value, source)`.
+    """
+
+    def __init__(
+        self, scene: Scene, arr: MArray, rounds: typing.List[typing.List[tuple]]
+    ) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        scene
+            Specifies the scene where the array is rendered.
+        arr
+            Specifies the array the operations are played on.
+        rounds
+            Specifies the rounds of operations. Operations of a round touch disjoint elements.
+        """
+
+        self.__scene: Scene = scene
+        self.__arr: MArray = arr
+        self.__rounds: typing.List[typing.List[tuple]] = rounds
+
+    def __len__(self) -> int:
+        """Returns the number of rounds."""
+
+        return len(self.__rounds)
+
+    def fetch_rounds(self) -> typing.List[typing.List[tuple]]:
+        """Fetches the rounds of operations.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`~typing.List`\0[:class:`tuple`]]
+            :attr:`__rounds`.
+        """
+
+        return self.__rounds
+
+    def fetch_stats(self) -> dict:
+        """Fetches the number of rounds and of each kind of operation.
+
+        Returns
+        -------
+        :class:`dict`
+            Number of `rounds`, `compares`, `swaps` and `writes`.
+        """
+
+        counts = {"rounds": len(self.__rounds), "compares": 0, "swaps": 0, "writes": 0}
+        for ops in self.__rounds:
+            for op in ops:
+                counts[op[0] + "s"] += 1
+        return counts
+
+    def play(
+        self,
+        round_time: float = 0.5,
+        run_time: float = None,
+        compare_anim: Animation = Indicate,
+        compare_anim_args: dict = {},
+        write_anim: Animation = Write,
+        write_anim_args: dict = {},
+        swap_target: MArrayElementComp = MArrayElementComp.VALUE,
+        path_arc: float = 0,
+        pointer_1: MArrayPointer = None,
+        pointer_2: MArrayPointer = None,
+        play_anim_args: dict = {},
+    ) -> None:
+        """Plays the rounds of operations on the array.
+
+        Parameters
+        ----------
+        round_time
+            Specifies the run time of each round.
+        run_time
+            Specifies the run time budget of the whole trace. Rounds are shortened to fit the budget.
+        compare_anim
+            Animation to be applied to the value mobjects of compared elements.
+        compare_anim_args
+            Arguments for compare :class:`~manim.animation.animation.Animation`.
+        write_anim
+            Animation to be applied to the value mobjects of written elements.
+        write_anim_args
+            Arguments for write :class:`~manim.animation.animation.Animation`.
+        swap_target
+            Specifies whether swaps move the value mobjects or the whole elements. See :meth:`~.m_array.MArray.swap_elems`.
+        path_arc
+            Specifies the angle of the arc along which swapped mobjects travel.
+        pointer_1
+            Specifies the pointer that follows the first element of each round's first compare.
+        pointer_2
+            Specifies the pointer that follows the second element of each round's first compare.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+        """
+
+        if not len(self.__rounds):
+            return
+
+        if run_time is not None:
+            round_time = min(round_time, run_time / len(self.__rounds))
+
+        mob_arr = self.__arr.fetch_mob_arr()
+        for ops in self.__rounds:
+            anims = []
+            followed = False
+            for op in ops:
+                if op[0] == "compare":
+                    for i in op[1]:
+                        anims.append(
+                            compare_anim(
+                                mob_arr[i].fetch_mob_value(), **compare_anim_args
+                            )
+                        )
+                    if not followed:
+                        followed = True
+                        for pointer, i in zip((pointer_1, pointer_2), op[1]):
+                            if pointer is not None and pointer.fetch_index() != i:
+                                anims.append(pointer.shift_to_elem(i, play_anim=False))
+                elif op[0] == "swap":
+                    anims.append(
+                        self.__arr.swap_elems(
+                            op[1][0],
+                            op[1][1],
+                            swap_target=swap_target,
+                            path_arc=path_arc,
+                            play_anim=False,
+                        )
+                    )
+                else:
+                    mob_value = self.__arr.update_elem_value(
+                        op[1][0], op[2], play_anim=False
+                    )
+                    anims.append(write_anim(mob_value, **write_anim_args))
+
+            stats.play(
+                self.__scene, *anims, **{"run_time": round_time, **play_anim_args}
+            )
+
+
+stats.register(MArrayRecorder, MArrayTrace)
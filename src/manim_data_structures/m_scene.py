@@ -0,0 +1,240 @@
+"""Contains scenes that stand in for :class:`~manim.scene.scene.Scene`."""
+
+from manim import *
+from manim.animation.animation import prepare_animation
+
+
+class MRecordingScene:
+    """A class that stands in for a :class:`~manim.scene.scene.Scene` and records played animations instead of rendering them.
+
+    It accepts the :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`, :py:meth:`Scene.wait() <manim.scene.scene.Scene.wait>`, :py:meth:`Scene.add() <manim.scene.scene.Scene.add>`, :py:meth:`Scene.remove() <manim.scene.scene.Scene.remove>` and :py:meth:`Scene.replace() <manim.scene.scene.Scene.replace>` calls made by the classes of this package and by the animations they play, which look up :py:meth:`Scene.get_mobject_family_members() <manim.scene.scene.Scene.get_mobject_family_members>` when they introduce a mobject. Each play is recorded with its animations, their targets and its run time. Nothing is rasterized or encoded, so neither a renderer nor ffmpeg is needed.
+
+    Parameters
+    ----------
+    apply_anims
+        If `True`, every played animation is jumped to its end state, so mobjects are left exactly where a rendered scene would leave them.
+
+    Attributes
+    ----------
+    __apply_anims : :class:`bool`
+        If `True`, every played animation is jumped to its end state.
+    __mobjects : :class:`~typing.List`\0[:class:`~manim.mobject.mobject.Mobject`]
+        The mobjects added to the scene.
+    __plays : :class:`~typing.List`\0[:class:`dict`]
+        The recorded plays, each with its `animations`, their `targets`, its `run_time` and the `time` it started at.
+    __time : :class:`float`
+        The time of the scene after all recorded plays.
+    """
+
+    def __collect_targets(self, animation: Animation) -> typing.List[Mobject]:
+        """Collects the target mobjects of an animation, looking into animation groups.
+
+        Parameters
+        ----------
+        animation
+            Specifies the animation whose targets are collected.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`~manim.mobject.mobject.Mobject`]
+            Target mobjects of the animation.
+        """
+
+        if hasattr(animation, "animations"):
+            targets = []
+            for sub_animation in animation.animations:
+                targets.extend(self.__collect_targets(sub_animation))
+            return targets
+
+        return [] if animation.mobject is None else [animation.mobject]
+
+    def __init__(self, apply_anims: bool = True) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        apply_anims
+            If `True`, every played animation is jumped to its end state, so mobjects are left exactly where a rendered scene would leave them.
+        """
+
+        self.__apply_anims: bool = apply_anims
+        self.__mobjects: typing.List[Mobject] = []
+        self.__plays: typing.List[dict] = []
+        self.__time: float = 0
+
+    def add(self, *mobjects: Mobject) -> "MRecordingScene":
+        """Adds mobjects to the scene, moving already added ones to the front.
+
+        Parameters
+        ----------
+        *mobjects
+            Mobjects to add.
+
+        Returns
+        -------
+        :class:`MRecordingScene`
+            The same scene after adding the mobjects.
+        """
+
+        self.remove(*mobjects)
+        self.__mobjects.extend(mobjects)
+
+        return self
+
+    def remove(self, *mobjects: Mobject) -> "MRecordingScene":
+        """Removes mobjects from the scene.
+
+        Parameters
+        ----------
+        *mobjects
+            Mobjects to remove.
+
+        Returns
+        -------
+        :class:`MRecordingScene`
+            The same scene after removing the mobjects.
+        """
+
+        self.__mobjects = [mob for mob in self.__mobjects if mob not in mobjects]
+
+        return self
+
+    def replace(self, old_mobject: Mobject, new_mobject: Mobject) -> None:
+        """Replaces a mobject in the scene, or inside an added group, with another one in place.
+
+        Parameters
+        ----------
+        old_mobject
+            Specifies the mobject to replace.
+        new_mobject
+            Specifies the mobject that takes its place.
+        """
+
+        for mobs in [self.__mobjects] + [
+            mob.submobjects for mob in self.get_mobject_family_members()
+        ]:
+            if old_mobject in mobs:
+                mobs[mobs.index(old_mobject)] = new_mobject
+                return
+
+        raise Exception("Mobject not in scene!")
+
+    def get_mobject_family_members(self) -> typing.List[Mobject]:
+        """Fetches the added mobjects along with all of their submobjects.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`~manim.mobject.mobject.Mobject`]
+            Family members of the added mobjects.
+        """
+
+        return [member for mob in self.__mobjects for member in mob.get_family()]
+
+    def play(self, *args, **kwargs) -> None:
+        """Records the animations as one play.
+
+        Parameters
+        ----------
+        *args
+            Animations to be played.
+        **kwargs
+            Configuration for the play, e.g. `run_time` and `lag_ratio`, set on every animation.
+        """
+
+        if not len(args):
+            raise Exception("No animations to play!")
+
+        animations = [prepare_animation(arg) for arg in args]
+        for animation in animations:
+            for k, v in kwargs.items():
+                setattr(animation, k, v)
+
+        run_time = max(animation.run_time for animation in animations)
+        self.__plays.append(
+            {
+                "animations": animations,
+                "targets": [
+                    target
+                    for animation in animations
+                    for target in self.__collect_targets(animation)
+                ],
+                "run_time": run_time,
+                "time": self.__time,
+            }
+        )
+        self.__time += run_time
+
+        if not self.__apply_anims:
+            return
+
+        family = self.get_mobject_family_members()
+        for animation in animations:
+            if not animation.is_introducer():
+                mob = animation.mobject
+                if mob is not None and mob not in family:
+                    self.add(mob)
+                    family.extend(mob.get_family())
+            animation._setup_scene(self)
+            animation.begin()
+
+        for animation in animations:
+            animation.finish()
+            animation.clean_up_from_scene(self)
+
+        for mob in self.__mobjects:
+            mob.update(0)
+
+    def wait(self, duration: float = DEFAULT_WAIT_TIME, **kwargs) -> None:
+        """Records a play without animations.
+
+        Parameters
+        ----------
+        duration
+            Specifies the run time of the wait.
+        **kwargs
+            Ignored, accepted for compatibility with :py:meth:`Scene.wait() <manim.scene.scene.Scene.wait>`.
+        """
+
+        self.__plays.append(
+            {"animations": [], "targets": [], "run_time": duration, "time": self.__time}
+        )
+        self.__time += duration
+
+    def fetch_mobjects(self) -> typing.List[Mobject]:
+        """Fetches the mobjects added to the scene.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`~manim.mobject.mobject.Mobject`]
+            :attr:`__mobjects`.
+        """
+
+        return self.__mobjects
+
+    def fetch_plays(self) -> typing.List[dict]:
+        """Fetches the recorded plays.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`dict`]
+            :attr:`__plays`.
+        """
+
+        return self.__plays
+
+    def fetch_time(self) -> float:
+        """Fetches the time of the scene after all recorded plays.
+
+        Returns
+        -------
+        :class:`float`
+            :attr:`__time`.
+        """
+
+        return self.__time
+
+    def reset(self) -> None:
+        """Clears the recorded plays and the time, keeping the added mobjects."""
+
+        self.__plays = []
+        self.__time = 0
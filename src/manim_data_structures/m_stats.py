@@ -0,0 +1,299 @@
+"""Contains classes to instrument the package."""
+
+import functools
+import inspect
+import time
+import typing
+
+
+class MStats:
+    """A class that represents opt-in counters and timers of the package.
+
+    While enabled, the classes of the package count their :class:`~manim.mobject.text.text_mobject.Text` renders and copies, :class:`~manim.mobject.geometry.polygram.Square`, :class:`~manim.mobject.geometry.line.Arrow` and :class:`~manim.mobject.geometry.polygram.Rectangle` constructions, deep copies and :py:meth:`Scene.play() <manim.scene.scene.Scene.play>` calls. Every count is also attributed to the class whose public method is running. The public methods of the registered classes are wrapped to measure their calls and time. While disabled, the methods are left untouched and counting returns immediately.
+
+    Attributes
+    ----------
+    __enabled : :class:`bool`
+        If `True`, counters and timers are recorded.
+    __classes : :class:`~typing.List`\0[:class:`type`]
+        The classes whose public methods are timed.
+    __wrappers : :class:`~typing.List`\0[:class:`~typing.Tuple`]
+        The class, name and wrapper of every wrapped method.
+    __stack : :class:`~typing.List`\0[:class:`str`]
+        The names of the classes whose wrapped methods are running.
+    __counts : :class:`dict`
+        Maps counter names to counts.
+    __class_counts : :class:`dict`
+        Maps class names to their own counters.
+    __times : :class:`dict`
+        Maps qualified method names to the number of calls and total time in seconds.
+    """
+
+    def __wrap(self, cls: type, name: str, func: typing.Callable) -> typing.Callable:
+        """Wraps a method to record its calls and time.
+
+        Parameters
+        ----------
+        cls
+            Specifies the class the method belongs to.
+        name
+            Specifies the name of the method.
+        func
+            Specifies the method.
+
+        Returns
+        -------
+        :data:`~typing.Callable`
+            The wrapped method.
+        """
+
+        key = f"{cls.__name__}.{name}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Looked up on every call, so unwrap_method() can unlink the wrapper beneath
+            if not self.__enabled:
+                return wrapper.__wrapped__(*args, **kwargs)
+
+            self.__stack.append(cls.__name__)
+            start = time.perf_counter()
+            try:
+                return wrapper.__wrapped__(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.__stack.pop()
+                (calls, total) = self.__times.get(key, (0, 0.0))
+                self.__times[key] = (calls + 1, total + elapsed)
+
+        return wrapper
+
+    def __wrap_class(self, cls: type) -> None:
+        """Replaces the public methods and the constructor of a class with wrapped ones.
+
+        Parameters
+        ----------
+        cls
+            Specifies the class whose methods are wrapped.
+        """
+
+        for name, func in list(vars(cls).items()):
+            if not inspect.isfunction(func) or (
+                name.startswith("_") and name != "__init__"
+            ):
+                continue
+            wrapper = self.__wrap(cls, name, func)
+            self.__wrappers.append((cls, name, wrapper))
+            setattr(cls, name, wrapper)
+
+    def __init__(self) -> None:
+        """Initializes the class."""
+
+        self.__enabled: bool = False
+        self.__classes: typing.List[type] = []
+        self.__wrappers: typing.List[typing.Tuple] = []
+        self.__stack: typing.List[str] = []
+        self.__counts: dict = {}
+        self.__class_counts: dict = {}
+        self.__times: dict = {}
+
+    def register(self, *classes: type) -> None:
+        """Registers classes whose public methods are timed while enabled.
+
+        Parameters
+        ----------
+        *classes
+            Classes to register.
+        """
+
+        for cls in classes:
+            if cls in self.__classes:
+                continue
+            self.__classes.append(cls)
+            if self.__enabled:
+                self.__wrap_class(cls)
+
+    def enable(self) -> None:
+        """Starts recording counters and timers."""
+
+        if self.__enabled:
+            return
+
+        self.__enabled = True
+        for cls in self.__classes:
+            self.__wrap_class(cls)
+
+    def disable(self) -> None:
+        """Stops recording counters and timers and restores the original methods."""
+
+        if not self.__enabled:
+            return
+
+        self.__enabled = False
+        for cls, name, wrapper in reversed(self.__wrappers):
+            self.unwrap_method(cls, name, wrapper)
+        self.__wrappers = []
+        self.__stack = []
+
+    @staticmethod
+    def unwrap_method(cls: type, name: str, wrapper: typing.Callable) -> None:
+        """Removes a wrapper from the chain of wrappers of a method.
+
+        The chain is walked through `__wrapped__` from the method of the class, so the wrapper is removed even if other wrappers were installed on top of it since. Those stay in place and call the function beneath the removed wrapper from then on.
+
+        Parameters
+        ----------
+        cls
+            Specifies the class the method belongs to.
+        name
+            Specifies the name of the method.
+        wrapper
+            Specifies the wrapper to remove. It must look up the function it wraps through its `__wrapped__` attribute on every call.
+        """
+
+        outer = None
+        func = vars(cls).get(name)
+        while func is not None and func is not wrapper:
+            outer = func
+            func = getattr(func, "__wrapped__", None)
+
+        if func is None:
+            # The wrapper was replaced rather than wrapped
+            return
+
+        if outer is None:
+            setattr(cls, name, wrapper.__wrapped__)
+        else:
+            outer.__wrapped__ = wrapper.__wrapped__
+
+    def is_enabled(self) -> bool:
+        """Checks whether counters and timers are recorded.
+
+        Returns
+        -------
+        :class:`bool`
+            :attr:`__enabled`.
+        """
+
+        return self.__enabled
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Increments a counter, if enabled.
+
+        Parameters
+        ----------
+        name
+            Specifies the name of the counter.
+        n
+            Specifies the increment.
+        """
+
+        if not self.__enabled:
+            return
+
+        self.__counts[name] = self.__counts.get(name, 0) + n
+        if len(self.__stack):
+            class_counts = self.__class_counts.setdefault(self.__stack[-1], {})
+            class_counts[name] = class_counts.get(name, 0) + n
+
+    def play(self, scene: typing.Any, *args, **kwargs) -> None:
+        """Counts and issues a :py:meth:`Scene.play() <manim.scene.scene.Scene.play>` call on behalf of the package.
+
+        Parameters
+        ----------
+        scene
+            Specifies the scene to play the animations in.
+        *args
+            Animations to be played.
+        **kwargs
+            Forwarded to :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+        """
+
+        self.count("play")
+        scene.play(*args, **kwargs)
+
+    def fetch_classes(self) -> typing.List[type]:
+        """Fetches the registered classes.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`type`]
+            :attr:`__classes`.
+        """
+
+        return self.__classes
+
+    def reset(self) -> None:
+        """Resets all counters and timers."""
+
+        self.__counts = {}
+        self.__class_counts = {}
+        self.__times = {}
+
+    def snapshot(self, scene: typing.Any = None) -> dict:
+        """Takes a snapshot of the counters and timers.
+
+        Parameters
+        ----------
+        scene
+            Specifies the scene whose mobjects are counted.
+
+        Returns
+        -------
+        :class:`dict`
+            Copies of the `counts`, the `class_counts` and the `times` as `(calls, seconds)`, along with the number of live `mobjects` in the scene if specified.
+        """
+
+        snapshot = {
+            "counts": dict(self.__counts),
+            "class_counts": {
+                cls: dict(counts) for cls, counts in self.__class_counts.items()
+            },
+            "times": dict(self.__times),
+        }
+
+        if scene is not None:
+            mobjects = (
+                scene.fetch_mobjects()
+                if hasattr(scene, "fetch_mobjects")
+                else scene.mobjects
+            )
+            snapshot["mobjects"] = sum(len(mob.get_family()) for mob in mobjects)
+
+        return snapshot
+
+    def report(self, scene: typing.Any = None) -> str:
+        """Formats a snapshot as a human readable report.
+
+        Parameters
+        ----------
+        scene
+            Specifies the scene whose mobjects are counted.
+
+        Returns
+        -------
+        :class:`str`
+            The report.
+        """
+
+        snapshot = self.snapshot(scene)
+
+        lines = ["Counts:"]
+        for name, n in sorted(snapshot["counts"].items()):
+            lines.append(f"  {name:<32} {n:>10}")
+        for cls, counts in sorted(snapshot["class_counts"].items()):
+            lines.append(f"{cls} counts:")
+            for name, n in sorted(counts.items()):
+                lines.append(f"  {name:<32} {n:>10}")
+        lines.append("Times:")
+        for name, (calls, total) in sorted(
+            snapshot["times"].items(), key=lambda item: -item[1][1]
+        ):
+            lines.append(f"  {name:<32} {calls:>10} {total * 1000:>12.3f} ms")
+        if "mobjects" in snapshot:
+            lines.append(f"Live mobjects: {snapshot['mobjects']}")
+
+        return "\n".join(lines)
+
+
+stats = MStats()
+"""Process-wide :class:`MStats` used by all classes of the package."""
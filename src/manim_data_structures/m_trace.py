@@ -0,0 +1,261 @@
+"""Contains classes to trace the operations of the package."""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import typing
+
+from .m_cache import MTextCache
+from .m_layout import MArrayLayout
+from .m_stats import MStats, stats
+
+
+class MTracer:
+    """A class that records the operations of the package as Chrome trace events.
+
+    While enabled, the public methods (except `fetch_` getters) and constructors of the classes registered with :data:`~.m_stats.stats`, the public methods of :class:`~.m_layout.MArrayLayout`, the fetches of :class:`~.m_cache.MTextCache` and every :py:meth:`Scene.play() <manim.scene.scene.Scene.play>` issued by the package write a begin and an end event. The events carry the number of elements of the traced object and the sizes of the sized arguments. The written file can be opened in a trace viewer such as `chrome://tracing` or Perfetto, where layout, glyph rendering and frame rendering (which happens inside :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`) show up side by side. While disabled, no method is wrapped.
+
+    Attributes
+    ----------
+    __enabled : :class:`bool`
+        If `True`, events are recorded.
+    __path : :class:`str`
+        The file the events are written to when the tracer is disabled, `None` to keep them in memory.
+    __wrappers : :class:`~typing.List`\0[:class:`~typing.Tuple`]
+        The class, name and wrapper of every wrapped method.
+    __events : :class:`~typing.List`\0[:class:`dict`]
+        The recorded trace events.
+    __start : :class:`float`
+        The :func:`time.perf_counter` value the timestamps are relative to.
+    """
+
+    def __calc_args(self, args: tuple, kwargs: dict) -> dict:
+        """Calculates the arguments recorded with a begin event.
+
+        Parameters
+        ----------
+        args
+            Specifies the positional arguments of the call, starting with the object.
+        kwargs
+            Specifies the keyword arguments of the call.
+
+        Returns
+        -------
+        :class:`dict`
+            Number of `elems` of the object, if any, and the sizes of the sized arguments.
+        """
+
+        trace_args = {}
+
+        if len(args) and isinstance(args[0], MStats):
+            # Animations passed to stats.play() after the scene
+            trace_args["anims"] = len(args) - 2
+            return trace_args
+
+        if len(args) and hasattr(args[0], "fetch_mob_arr"):
+            try:
+                trace_args["elems"] = len(args[0].fetch_mob_arr())
+            except AttributeError:
+                # The object is still being initialized
+                pass
+
+        for i, arg in enumerate(args[1:]):
+            if hasattr(arg, "__len__") and not isinstance(arg, str):
+                trace_args[f"len(arg{i})"] = len(arg)
+        for k, v in kwargs.items():
+            if hasattr(v, "__len__") and not isinstance(v, str):
+                trace_args[f"len({k})"] = len(v)
+
+        return trace_args
+
+    def __emit(self, name: str, ph: str, cat: str, args: dict = None) -> None:
+        """Records a trace event.
+
+        Parameters
+        ----------
+        name
+            Specifies the name of the event.
+        ph
+            Specifies the phase of the event, `"B"` for begin and `"E"` for end.
+        cat
+            Specifies the category of the event.
+        args
+            Specifies the arguments of the event.
+        """
+
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": ph,
+            "ts": (time.perf_counter() - self.__start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self.__events.append(event)
+
+    def __wrap(
+        self, cls: type, name: str, func: typing.Callable, cat: str
+    ) -> typing.Callable:
+        """Wraps a method to record begin and end events around its calls.
+
+        Parameters
+        ----------
+        cls
+            Specifies the class the method belongs to.
+        name
+            Specifies the name of the method.
+        func
+            Specifies the method.
+        cat
+            Specifies the category of the events.
+
+        Returns
+        -------
+        :data:`~typing.Callable`
+            The wrapped method.
+        """
+
+        key = f"{cls.__name__}.{name}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Looked up on every call, so MStats.unwrap_method() can unlink the wrapper beneath
+            if not self.__enabled:
+                return wrapper.__wrapped__(*args, **kwargs)
+
+            self.__emit(key, "B", cat, self.__calc_args(args, kwargs))
+            try:
+                return wrapper.__wrapped__(*args, **kwargs)
+            finally:
+                self.__emit(key, "E", cat)
+
+        return wrapper
+
+    def __wrap_method(self, cls: type, name: str, cat: str) -> None:
+        """Replaces a method of a class with a wrapped one.
+
+        Parameters
+        ----------
+        cls
+            Specifies the class the method belongs to.
+        name
+            Specifies the name of the method.
+        cat
+            Specifies the category of the events.
+        """
+
+        wrapper = self.__wrap(cls, name, vars(cls)[name], cat)
+        self.__wrappers.append((cls, name, wrapper))
+        setattr(cls, name, wrapper)
+
+    def __wrap_class(self, cls: type, cat: str) -> None:
+        """Replaces the public methods and the constructor of a class with wrapped ones. Getters starting with `fetch_` are left untouched.
+
+        Parameters
+        ----------
+        cls
+            Specifies the class whose methods are wrapped.
+        cat
+            Specifies the category of the events.
+        """
+
+        for name, func in list(vars(cls).items()):
+            if (
+                not inspect.isfunction(func)
+                or name.startswith("fetch_")
+                or (name.startswith("_") and name != "__init__")
+            ):
+                continue
+            self.__wrap_method(cls, name, cat)
+
+    def __init__(self) -> None:
+        """Initializes the class."""
+
+        self.__enabled: bool = False
+        self.__path: str = None
+        self.__wrappers: typing.List[typing.Tuple] = []
+        self.__events: typing.List[dict] = []
+        self.__start: float = time.perf_counter()
+
+    def enable(self, path: str = None) -> None:
+        """Starts recording events.
+
+        Parameters
+        ----------
+        path
+            Specifies the file the events are written to when the tracer is disabled.
+        """
+
+        if self.__enabled:
+            return
+
+        self.__enabled = True
+        self.__path = path
+        for cls in stats.fetch_classes():
+            self.__wrap_class(cls, "op")
+        self.__wrap_class(MArrayLayout, "layout")
+        self.__wrap_method(MTextCache, "fetch", "glyph")
+        self.__wrap_method(MStats, "play", "render")
+
+    def disable(self) -> None:
+        """Stops recording events, restores the original methods and writes the events to the file specified when enabled."""
+
+        if not self.__enabled:
+            return
+
+        self.__enabled = False
+        for cls, name, wrapper in reversed(self.__wrappers):
+            MStats.unwrap_method(cls, name, wrapper)
+        self.__wrappers = []
+
+        if self.__path is not None:
+            self.save(self.__path)
+
+    def is_enabled(self) -> bool:
+        """Checks whether events are recorded.
+
+        Returns
+        -------
+        :class:`bool`
+            :attr:`__enabled`.
+        """
+
+        return self.__enabled
+
+    def fetch_events(self) -> typing.List[dict]:
+        """Fetches the recorded events.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`dict`]
+            :attr:`__events`.
+        """
+
+        return self.__events
+
+    def save(self, path: str) -> None:
+        """Writes the recorded events to a Chrome trace event JSON file.
+
+        Parameters
+        ----------
+        path
+            Specifies the file to write.
+        """
+
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.__events, "displayTimeUnit": "ms"}, f)
+
+    def reset(self) -> None:
+        """Clears the recorded events."""
+
+        self.__events = []
+        self.__start = time.perf_counter()
+
+
+tracer = MTracer()
+"""Process-wide :class:`MTracer` for the operations of the package."""
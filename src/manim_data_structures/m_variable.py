@@ -3,6 +3,7 @@
 from manim import *
 
 from .m_array import MArrayElement
+from .m_stats import stats
 
 
 class MVariable(MArrayElement):
@@ -133,7 +134,7 @@ class MVariable(MArrayElement):
         update_anim_args: dict = {},
         play_anim: bool = True,
         play_anim_args: dict = {},
-    ) -> Text:
+    ) -> VMobject:
         """Updates the value of the variable.
 
         Parameters
@@ -153,7 +154,7 @@ class MVariable(MArrayElement):
 
         Returns
         -------
-        :class:`~manim.mobject.text.text_mobject.Text`
+        :class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`
             Updated :attr:`__value`.
         """
 
@@ -171,7 +172,7 @@ class MVariable(MArrayElement):
         update_anim_args: dict = {},
         play_anim: bool = True,
         play_anim_args: dict = {},
-    ) -> Text:
+    ) -> VMobject:
         """Updates the index of the variable.
 
         Parameters
@@ -191,7 +192,7 @@ class MVariable(MArrayElement):
 
         Returns
         -------
-        :class:`~manim.mobject.text.text_mobject.Text`
+        :class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`
             Updated :attr:`__index`.
         """
 
@@ -238,3 +239,6 @@ class MVariable(MArrayElement):
         return self.update_mob_label(
             mob_label_args, update_anim, update_anim_args, play_anim, play_anim_args
         )
+
+
+stats.register(MVariable)
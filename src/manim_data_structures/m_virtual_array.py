@@ -0,0 +1,934 @@
+"""Contains classes to construct a virtualized array."""
+
+from copy import deepcopy
+from itertools import islice
+
+from manim import *
+
+from .m_array import MArray, MArrayPointer, MArraySlidingWindow
+from .m_cache import text_cache
+from .m_enum import MArrayDirection, MArrayElementComp
+from .m_stats import stats
+
+
+class MVirtualArray(MArray):
+    """A class that represents an array of which only a window of elements is materialized.
+
+    The full array is kept as the model while :class:`~.m_array.MArrayElement`\0s are only created for the elements inside the viewport. Scrolling the viewport recycles the existing elements by updating their values and indices.
+
+    Parameters
+    ----------
+    scene
+        Specifies the scene where the object is to be rendered.
+    arr
+        Specifies the array to represent.
+    view_start
+        Specifies the index of the first element inside the viewport.
+    view_size
+        Specifies the number of elements inside the viewport.
+    index_offset
+        Specifies the difference between successive displayable indices.
+    index_start
+        Specifies the starting value of displayable index.
+    index_hex_display
+        If `True`, displays indices in hex.
+    hide_index
+        If `True`, doesn't display indices.
+    overflow_gap
+        Specifies the distance between the overflow markers and the viewport.
+    mob_overflow_args
+        Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the overflow markers.
+    **kwargs
+        Forwarded to constructor of the parent.
+
+    Attributes
+    ----------
+    __scene : :class:`~manim.scene.scene.Scene`
+        The scene where the object is to be rendered.
+    __model : :class:`list`
+        The array to represent.
+    __view_start : :class:`int`
+        The index of the first element inside the viewport.
+    __view_size : :class:`int`
+        The number of elements inside the viewport.
+    __index_offset : :class:`int`
+        The difference between successive displayable indices.
+    __index_start : :class:`int`
+        The starting value of displayable index.
+    __index_hex_display : :class:`bool`
+        If `True`, displays indices in hex.
+    __hide_index : :class:`bool`
+        If `True`, doesn't display indices.
+    __overflow_gap : :class:`float`
+        The distance between the overflow markers and the viewport.
+    __mob_overflow_props : :class:`dict`
+        Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the overflow markers.
+    __mob_overflow_before : :class:`~manim.mobject.text.text_mobject.Text`
+        Marks that elements exist before the viewport.
+    __mob_overflow_after : :class:`~manim.mobject.text.text_mobject.Text`
+        Marks that elements exist after the viewport.
+    """
+
+    __dir_map = [UP, DOWN, RIGHT, LEFT]
+    """Maps :class:`~.m_enum.MArrayDirection` to :class:`np.ndarray`."""
+
+    def __calc_index(self, index: int) -> typing.Union[int, str]:
+        """Calculates the displayable index of the specified element of the model.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element in the model.
+
+        Returns
+        -------
+        :data:`~typing.Union`\0[:class:`int`, :class:`str`]
+            Displayable index.
+        """
+
+        return (
+            ""
+            if self.__hide_index
+            else (
+                self.__index_start + self.__index_offset * index
+                if self.__index_hex_display is False
+                else hex(self.__index_start + self.__index_offset * index)
+            )
+        )
+
+    def __calc_view_start(self, view_start: int) -> int:
+        """Clamps the start of the viewport so that the viewport stays filled.
+
+        Parameters
+        ----------
+        view_start
+            Specifies the prospective index of the first element inside the viewport.
+
+        Returns
+        -------
+        :class:`int`
+            Clamped index of the first element inside the viewport.
+        """
+
+        return max(0, min(view_start, len(self.__model) - self.__view_size))
+
+    def __init_mobs(self, init_overflow: bool = False) -> None:
+        """Initializes the mobjects for the class.
+
+        Parameters
+        ----------
+        init_overflow
+            If `True`, instantiates the overflow markers.
+        """
+
+        if init_overflow:
+            self.__mob_overflow_before = text_cache.fetch(**self.__mob_overflow_props)
+            self.__mob_overflow_after = text_cache.fetch(**self.__mob_overflow_props)
+            self.__pos_overflow()
+
+    def __pos_overflow(self) -> None:
+        """Positions the overflow markers and only keeps them in the group while elements exist beyond the viewport."""
+
+        mob_arr = self.fetch_mob_arr()
+        arr_dir_np = self.__dir_map[self.fetch_arr_dir().value]
+
+        for mob, visible, square, dir_np in (
+            (
+                self.__mob_overflow_before,
+                self.__view_start > 0,
+                mob_arr[0].fetch_mob_square() if len(mob_arr) else None,
+                -arr_dir_np,
+            ),
+            (
+                self.__mob_overflow_after,
+                self.__view_start + len(mob_arr) < len(self.__model),
+                mob_arr[-1].fetch_mob_square() if len(mob_arr) else None,
+                arr_dir_np,
+            ),
+        ):
+            if visible and square is not None:
+                mob.next_to(square, dir_np, self.__overflow_gap)
+                if mob not in self.submobjects:
+                    self.add(mob)
+            elif mob in self.submobjects:
+                self.remove(mob)
+
+    def __recycle(
+        self,
+        view_start: int,
+        update_anim: Animation = Write,
+        update_anim_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> typing.List[VMobject]:
+        """Moves the viewport and recycles the existing elements for the elements now inside it.
+
+        Parameters
+        ----------
+        view_start
+            Specifies the index of the first element inside the viewport.
+        update_anim
+            Animation to be applied to the recycled elements.
+        update_anim_args
+            Arguments for update :class:`~manim.animation.animation.Animation`.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`]
+            Value mobjects of the recycled elements.
+        """
+
+        old_view_start = self.__view_start
+        self.__view_start = view_start
+        slot_arr = super().fetch_arr()
+
+        mob_values = []
+        with self.batch(play_anim_args=play_anim_args):
+            for slot in range(len(slot_arr)):
+                value = self.__model[view_start + slot]
+                if str(slot_arr[slot]) != str(value):
+                    mob_values.append(
+                        super().update_elem_value(
+                            slot,
+                            value,
+                            update_anim=update_anim,
+                            update_anim_args=update_anim_args,
+                            play_anim=play_anim,
+                        )
+                    )
+                if view_start != old_view_start and not self.__hide_index:
+                    super().update_elem_index(
+                        slot,
+                        self.__calc_index(view_start + slot),
+                        update_anim=update_anim,
+                        update_anim_args=update_anim_args,
+                        play_anim=play_anim,
+                    )
+
+        self.__pos_overflow()
+
+        return mob_values
+
+    def __deepcopy__(self, memo):
+        """Deepcopy that excludes attributes specified in `exclude_list`."""
+
+        stats.count("deepcopy")
+        exclude_list = [
+            "_MArray__scene",
+            "_MArray__subscribers",
+            "_MVirtualArray__scene",
+        ]
+
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        for k, v in self.__dict__.items():
+            if k not in exclude_list:
+                setattr(result, k, deepcopy(v, memo))
+        # Copies don't notify the subscribers of the original
+        result._MArray__subscribers = []
+        return result
+
+    def __init__(
+        self,
+        scene: Scene,
+        arr: list = [],
+        view_start: int = 0,
+        view_size: int = 10,
+        index_offset: int = 1,
+        index_start: int = 0,
+        index_hex_display: bool = False,
+        hide_index: bool = False,
+        overflow_gap: float = 0.25,
+        mob_overflow_args: dict = {},
+        **kwargs
+    ) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        scene
+            Specifies the scene where the object is to be rendered.
+        arr
+            Specifies the array to represent. Its values are copied into :attr:`__model`, so any iterable can be passed and it is never modified.
+        view_start
+            Specifies the index of the first element inside the viewport.
+        view_size
+            Specifies the number of elements inside the viewport.
+        index_offset
+            Specifies the difference between successive displayable indices.
+        index_start
+            Specifies the starting value of displayable index.
+        index_hex_display
+            If `True`, displays indices in hex.
+        hide_index
+            If `True`, doesn't display indices.
+        overflow_gap
+            Specifies the distance between the overflow markers and the viewport.
+        mob_overflow_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the overflow markers.
+        **kwargs
+            Forwarded to constructor of the parent.
+        """
+
+        if view_size < 1:
+            raise Exception("Invalid view size!")
+
+        self.__scene: Scene = scene
+        self.__model: list = list(arr)
+        self.__view_size: int = view_size
+        self.__view_start: int = 0
+        self.__view_start = self.__calc_view_start(view_start)
+        self.__index_offset: int = index_offset
+        self.__index_start: int = index_start
+        self.__index_hex_display: bool = index_hex_display
+        self.__hide_index: bool = hide_index
+        self.__overflow_gap: float = overflow_gap
+        self.__mob_overflow_props: dict = {"text": "...", "color": BLUE_A}
+        self.__mob_overflow_props.update(mob_overflow_args)
+
+        super().__init__(
+            scene,
+            arr=self.__model[self.__view_start : self.__view_start + view_size],
+            index_offset=index_offset,
+            index_start=index_start + index_offset * self.__view_start,
+            index_hex_display=index_hex_display,
+            hide_index=hide_index,
+            **kwargs
+        )
+
+        self.__init_mobs(True)
+
+    @classmethod
+    def from_numpy(
+        cls, scene: Scene, arr: np.ndarray, fmt: str = "%g", **kwargs
+    ) -> "MVirtualArray":
+        """Creates a virtual array from a one-dimensional NumPy array.
+
+        All values are formatted in one vectorized pass and identical strings are shared. Unlike :meth:`MArray.from_numpy`, the formatted values become the model, since the slots are refilled from it while scrolling.
+
+        Parameters
+        ----------
+        scene
+            Specifies the scene where the object is to be rendered.
+        arr
+            Specifies the NumPy array to represent.
+        fmt
+            Specifies the printf-style format of the values, e.g. `"%.2f"` for a precision of two decimals.
+        **kwargs
+            Forwarded to constructor of the class.
+
+        Returns
+        -------
+        :class:`MVirtualArray`
+            The created virtual array.
+        """
+
+        arr = np.asarray(arr)
+        if arr.ndim != 1:
+            raise Exception("Array must be one-dimensional!")
+
+        (labels, inverse) = np.unique(np.char.mod(fmt, arr), return_inverse=True)
+        labels = labels.tolist()
+
+        return cls(scene, [labels[i] for i in inverse.tolist()], **kwargs)
+
+    def fetch_arr(self) -> list:
+        """Fetches the original array.
+
+        Returns
+        -------
+        :class:`list`
+            :attr:`__model`.
+        """
+
+        return self.__model
+
+    def fetch_view_start(self) -> int:
+        """Fetches the index of the first element inside the viewport.
+
+        Returns
+        -------
+        :class:`int`
+            :attr:`__view_start`.
+        """
+
+        return self.__view_start
+
+    def fetch_view_size(self) -> int:
+        """Fetches the number of elements inside the viewport.
+
+        Returns
+        -------
+        :class:`int`
+            :attr:`__view_size`.
+        """
+
+        return self.__view_size
+
+    def fetch_slot(self, index: int) -> int:
+        """Fetches the slot of the viewport that holds the specified element.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element in the model.
+
+        Returns
+        -------
+        :class:`int`
+            Index of the slot, `-1` if the element is outside the viewport.
+        """
+
+        slot = index - self.__view_start
+        return slot if 0 <= slot < len(self.fetch_mob_arr()) else -1
+
+    def scroll_to(
+        self,
+        view_start: int,
+        update_anim: Animation = Write,
+        update_anim_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> typing.List[VMobject]:
+        """Scrolls the viewport so that it starts at the specified element.
+
+        Parameters
+        ----------
+        view_start
+            Specifies the index of the first element inside the viewport.
+        update_anim
+            Animation to be applied to the recycled elements.
+        update_anim_args
+            Arguments for update :class:`~manim.animation.animation.Animation`.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`]
+            Value mobjects of the recycled elements.
+        """
+
+        return self.__recycle(
+            self.__calc_view_start(view_start),
+            update_anim,
+            update_anim_args,
+            play_anim,
+            play_anim_args,
+        )
+
+    def scroll_into_view(
+        self,
+        index: int,
+        size: int = 1,
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> int:
+        """Scrolls the viewport by the least amount that brings the specified elements inside it.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the first element to bring inside the viewport.
+        size
+            Specifies the number of elements to bring inside the viewport.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Returns
+        -------
+        :class:`int`
+            Slot of the viewport that holds the element at `index`.
+        """
+
+        if index < 0 or index + size > len(self.__model):
+            raise Exception("Index out of bounds!")
+
+        if size > self.__view_size:
+            raise Exception("Invalid window size!")
+
+        if index < self.__view_start:
+            self.scroll_to(index, play_anim=play_anim, play_anim_args=play_anim_args)
+        elif index + size > self.__view_start + self.__view_size:
+            self.scroll_to(
+                index + size - self.__view_size,
+                play_anim=play_anim,
+                play_anim_args=play_anim_args,
+            )
+
+        return self.fetch_slot(index)
+
+    def shift_pointer_to_elem(
+        self,
+        pointer: MArrayPointer,
+        index: int,
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> Animation:
+        """Shifts a pointer attached to the array to the specified element, scrolling the viewport if the element is outside it.
+
+        Parameters
+        ----------
+        pointer
+            Specifies the pointer to shift.
+        index
+            Specifies the index of the element in the model.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Returns
+        -------
+        :class:`~manim.animation.animation.Animation`
+            Shift animation of the pointer.
+        """
+
+        slot = self.scroll_into_view(index, 1, play_anim, play_anim_args)
+        return pointer.shift_to_elem(slot, play_anim, play_anim_args)
+
+    def shift_window_to_elem(
+        self,
+        window: MArraySlidingWindow,
+        index: int,
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> Animation:
+        """Shifts a sliding window attached to the array to the specified element, scrolling the viewport if the window doesn't fit inside it.
+
+        Parameters
+        ----------
+        window
+            Specifies the sliding window to shift.
+        index
+            Specifies the index of the element in the model.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Returns
+        -------
+        :class:`~manim.animation.animation.Animation`
+            Shift animation of the sliding window.
+        """
+
+        slot = self.scroll_into_view(
+            index, window.fetch_size(), play_anim, play_anim_args
+        )
+        return window.shift_to_elem(slot, play_anim, play_anim_args)
+
+    def update_elem_value(
+        self,
+        index: int,
+        value,
+        mob_value_args: dict = {},
+        update_anim: Animation = Write,
+        update_anim_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> VMobject:
+        """Updates the elements value.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of element in the model whose value to update.
+        value
+            New value to be assigned to the element.
+        mob_value_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the element value.
+        update_anim
+            Animation to be applied to the updated element.
+        update_anim_args
+            Arguments for update :class:`~manim.animation.animation.Animation`.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Returns
+        -------
+        :class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`
+            Updated element's value mobject, `None` if the element is outside the viewport.
+        """
+
+        if index < 0 or index >= len(self.__model):
+            raise Exception("Index out of bounds!")
+
+        self.__model[index] = value
+
+        slot = self.fetch_slot(index)
+        if slot == -1:
+            return None
+
+        return super().update_elem_value(
+            slot,
+            value,
+            mob_value_args,
+            update_anim,
+            update_anim_args,
+            play_anim,
+            play_anim_args,
+        )
+
+    def update_elem_values(
+        self,
+        indices: typing.Union[typing.Iterable[int], slice],
+        values: typing.Iterable,
+        mob_value_args: dict = {},
+        update_anim: Animation = Write,
+        update_anim_args: dict = {},
+        lag_ratio: float = 0,
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> AnimationGroup:
+        """Updates the values of many elements with a single animation. Only the elements inside the viewport are animated.
+
+        Parameters
+        ----------
+        indices
+            Specifies the indices of elements in the model whose values to update, or a slice of them.
+        values
+            New values to be assigned to the elements, one for each index.
+        mob_value_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the element value.
+        update_anim
+            Animation to be applied to each updated element.
+        update_anim_args
+            Arguments for update :class:`~manim.animation.animation.Animation`.
+        lag_ratio
+            Specifies the delay between the update animations as a fraction of their run time, as in :class:`~manim.animation.composition.LaggedStart`.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Returns
+        -------
+        :class:`~manim.animation.composition.AnimationGroup`
+            Update animations of the changed elements inside the viewport.
+        """
+
+        if isinstance(indices, slice):
+            indices = range(*indices.indices(len(self.__model)))
+        indices = list(indices)
+        values = list(values)
+
+        if len(indices) != len(values):
+            raise Exception("Number of indices and values don't match!")
+
+        for index in indices:
+            if index < 0 or index >= len(self.__model):
+                raise Exception("Index out of bounds!")
+
+        slots = []
+        slot_values = []
+        for index, value in zip(indices, values):
+            self.__model[index] = value
+            slot = self.fetch_slot(index)
+            if slot != -1:
+                slots.append(slot)
+                slot_values.append(value)
+
+        return super().update_elem_values(
+            slots,
+            slot_values,
+            mob_value_args,
+            update_anim,
+            update_anim_args,
+            lag_ratio,
+            play_anim,
+            play_anim_args,
+        )
+
+    def swap_elems(
+        self,
+        index_1: int,
+        index_2: int,
+        swap_target: MArrayElementComp = MArrayElementComp.VALUE,
+        path_arc: float = 0,
+        swap_anim_args: dict = {},
+        update_anim: Animation = Write,
+        update_anim_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> AnimationGroup:
+        """Swaps two elements of the model. Elements inside the viewport trade their mobjects, while an element whose partner is outside the viewport has its value updated.
+
+        Parameters
+        ----------
+        index_1
+            Specifies the index of the first element in the model.
+        index_2
+            Specifies the index of the second element in the model.
+        swap_target
+            Specifies whether to swap the value mobjects or the whole elements. See :meth:`~.m_array.MArray.swap_elems`.
+        path_arc
+            Specifies the angle of the arc along which the mobjects travel.
+        swap_anim_args
+            Arguments for the :class:`~.m_animation.MTranslate` that move the mobjects.
+        update_anim
+            Animation to be applied to an updated element.
+        update_anim_args
+            Arguments for update :class:`~manim.animation.animation.Animation`.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Returns
+        -------
+        :class:`~manim.animation.composition.AnimationGroup`
+            Swap or update animation of the elements inside the viewport.
+        """
+
+        if (
+            index_1 < 0
+            or index_1 >= len(self.__model)
+            or index_2 < 0
+            or index_2 >= len(self.__model)
+        ):
+            raise Exception("Index out of bounds!")
+
+        self.__model[index_1], self.__model[index_2] = (
+            self.__model[index_2],
+            self.__model[index_1],
+        )
+
+        slot_1 = self.fetch_slot(index_1)
+        slot_2 = self.fetch_slot(index_2)
+
+        if slot_1 != -1 and slot_2 != -1:
+            return super().swap_elems(
+                slot_1,
+                slot_2,
+                swap_target,
+                path_arc,
+                swap_anim_args,
+                play_anim,
+                play_anim_args,
+            )
+
+        slots = []
+        slot_values = []
+        for index, slot in ((index_1, slot_1), (index_2, slot_2)):
+            if slot != -1:
+                slots.append(slot)
+                slot_values.append(self.__model[index])
+
+        return super().update_elem_values(
+            slots,
+            slot_values,
+            update_anim=update_anim,
+            update_anim_args=update_anim_args,
+            play_anim=play_anim,
+            play_anim_args=play_anim_args,
+        )
+
+    def append_elem(
+        self, value: Any, play_anim: bool = True, play_anim_args: dict = {}, **kwargs
+    ) -> typing.List[Animation]:
+        """Appends a new element to the model. An element is only materialized if the viewport isn't filled.
+
+        Parameters
+        ----------
+        value
+            Specifies the value of the new element.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+        **kwargs
+            Forwarded to :meth:`~.m_array.MArray.append_elem`.
+
+        Returns
+        -------
+        :class:`typing.List`\0[:class:`~manim.animation.animation.Animation`]
+            List of append animations.
+        """
+
+        self.__model.append(value)
+
+        anim_list = []
+        if len(self.fetch_mob_arr()) < self.__view_size:
+            anim_list = super().append_elem(
+                value, play_anim=play_anim, play_anim_args=play_anim_args, **kwargs
+            )
+
+        self.__pos_overflow()
+
+        return anim_list
+
+    def extend_elems(
+        self,
+        values: typing.Iterable,
+        chunk_size: int = 100,
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+        **kwargs
+    ) -> int:
+        """Appends new elements to the model. Elements are only materialized until the viewport is filled, the remaining values are streamed straight into the model.
+
+        Parameters
+        ----------
+        values
+            Specifies the values of the new elements.
+        chunk_size
+            Specifies the number of elements created and played at a time.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+        **kwargs
+            Forwarded to :meth:`~.m_array.MArray.extend_elems`.
+
+        Returns
+        -------
+        :class:`int`
+            Number of appended elements.
+        """
+
+        values = iter(values)
+        model_len = len(self.__model)
+
+        view_values = list(
+            islice(values, max(self.__view_size - len(self.fetch_mob_arr()), 0))
+        )
+        self.__model.extend(view_values)
+        super().extend_elems(
+            view_values,
+            chunk_size,
+            play_anim=play_anim,
+            play_anim_args=play_anim_args,
+            **kwargs
+        )
+        self.__model.extend(values)
+
+        self.__pos_overflow()
+
+        return len(self.__model) - model_len
+
+    def insert_elem(
+        self,
+        index: int,
+        value: Any,
+        update_anim: Animation = Write,
+        update_anim_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+        **kwargs
+    ) -> typing.List[VMobject]:
+        """Inserts a new element in the model at the specified index and recycles the elements inside the viewport.
+
+        Parameters
+        ----------
+        index
+            Specifies the index at which the new element is to be inserted.
+        value
+            Specifies the value of the new element.
+        update_anim
+            Animation to be applied to the recycled elements.
+        update_anim_args
+            Arguments for update :class:`~manim.animation.animation.Animation`.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+        **kwargs
+            Forwarded to :meth:`~.m_array.MArray.append_elem` if the viewport isn't filled.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`]
+            Value mobjects of the recycled elements.
+        """
+
+        if index < 0 or index > len(self.__model):
+            raise Exception("Index out of bounds!")
+
+        self.__model.insert(index, value)
+
+        # Fill the viewport before recycling its slots
+        slot_count = len(self.fetch_mob_arr())
+        if slot_count < self.__view_size:
+            super().append_elem(
+                self.__model[self.__view_start + slot_count],
+                play_anim=play_anim,
+                play_anim_args=play_anim_args,
+                **kwargs
+            )
+
+        return self.__recycle(
+            self.__view_start,
+            update_anim,
+            update_anim_args,
+            play_anim,
+            play_anim_args,
+        )
+
+    def remove_elem(
+        self,
+        index: int,
+        update_anim: Animation = Write,
+        update_anim_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+        **kwargs
+    ) -> typing.List[VMobject]:
+        """Removes the element from the model at the specified index and recycles the elements inside the viewport.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element in the model to remove.
+        update_anim
+            Animation to be applied to the recycled elements.
+        update_anim_args
+            Arguments for update :class:`~manim.animation.animation.Animation`.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+        **kwargs
+            Forwarded to :meth:`~.m_array.MArray.remove_elem` if the last slot has to be removed.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`~manim.mobject.text.text_mobject.Text` | :class:`~manim.mobject.types.vectorized_mobject.VGroup`]
+            Value mobjects of the recycled elements.
+        """
+
+        if index < 0 or index >= len(self.__model):
+            raise Exception("Index out of bounds!")
+
+        del self.__model[index]
+
+        # Drop the last slot once the model can't fill the viewport anymore
+        if len(self.fetch_mob_arr()) > len(self.__model):
+            super().remove_elem(
+                len(self.fetch_mob_arr()) - 1,
+                play_anim=play_anim,
+                play_anim_args=play_anim_args,
+                **kwargs
+            )
+
+        return self.__recycle(
+            self.__calc_view_start(self.__view_start),
+            update_anim,
+            update_anim_args,
+            play_anim,
+            play_anim_args,
+        )
+
+
+stats.register(MVirtualArray)
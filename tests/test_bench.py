@@ -0,0 +1,62 @@
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+
+spec = importlib.util.spec_from_file_location(
+    "bench",
+    os.path.join(os.path.dirname(__file__), os.pardir, "benchmarks", "bench.py"),
+)
+bench = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bench)
+
+
+class TestBench(unittest.TestCase):
+    def setUp(self):
+        self.op_size = bench.OP_SIZE
+        bench.OP_SIZE = 10
+
+    def tearDown(self):
+        bench.OP_SIZE = self.op_size
+
+    def test_measure(self):
+        for name, factory in bench.BENCHMARKS.items():
+            if name.startswith("construct") and name != "construct[10]":
+                continue
+            with self.subTest(name=name):
+                result = bench.measure(factory, 1)
+                self.assertGreater(result["time_s"], 0)
+                self.assertGreater(result["peak_kib"], 0)
+
+    def test_compare(self):
+        baseline = {"a": {"time_s": 1.0, "peak_kib": 10.0}}
+
+        self.assertEqual(
+            bench.compare(baseline, {"a": {"time_s": 1.1, "peak_kib": 10.0}}, 0.2), []
+        )
+        self.assertEqual(
+            len(bench.compare(baseline, {"a": {"time_s": 1.5, "peak_kib": 13.0}}, 0.2)),
+            2,
+        )
+        self.assertEqual(
+            bench.compare(baseline, {"b": {"time_s": 9.0, "peak_kib": 9.0}}, 0.2), []
+        )
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "baseline.json")
+            args = ["--filter", "append_elem", "--repeat", "1"]
+
+            self.assertEqual(bench.main(args + ["--output", path]), 0)
+            with open(path) as f:
+                self.assertIn("append_elem", json.load(f)["results"])
+
+            # Only a regression of over a hundredfold fails the comparison
+            self.assertEqual(
+                bench.main(args + ["--compare", path, "--threshold", "100"]), 0
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,220 @@
+import unittest
+
+import numpy as np
+from manim import DOWN, UP, Indicate, Scene, tempconfig
+
+from manim_data_structures import *
+
+
+class TestMArrayGeometry(unittest.TestCase):
+    def setUp(self):
+        dry_run = tempconfig({"dry_run": True})
+        dry_run.__enter__()
+        self.addCleanup(dry_run.__exit__, None, None, None)
+
+        self.scene = Scene()
+        self.arr = MArray(self.scene, [1, 2, 3])
+        self.scene.add(self.arr)
+
+    def assert_contiguous(self, arr):
+        squares = [mob.fetch_mob_square() for mob in arr.fetch_mob_arr()]
+        for prev, curr in zip(squares, squares[1:]):
+            np.testing.assert_allclose(prev.get_right(), curr.get_left(), atol=1e-6)
+
+    def test_append_elem_after_scale(self):
+        self.arr.scale(0.5)
+
+        self.arr.append_elem(4)
+
+        self.assert_contiguous(self.arr)
+
+    def test_insert_elem_after_scale(self):
+        self.arr.scale(0.5)
+        left_np = self.arr.fetch_mob_arr()[0].fetch_mob_square().get_left()
+
+        self.arr.insert_elem(1, 9)
+
+        self.assert_contiguous(self.arr)
+        np.testing.assert_allclose(
+            self.arr.fetch_mob_arr()[0].fetch_mob_square().get_left(),
+            left_np,
+            atol=1e-6,
+        )
+
+    def test_remove_elem_after_scale(self):
+        self.arr.scale(0.5)
+
+        self.arr.remove_elem(0)
+
+        self.assert_contiguous(self.arr)
+
+    def test_append_elem_after_move(self):
+        self.arr.move_to(UP * 2)
+
+        self.arr.append_elem(4)
+
+        self.assert_contiguous(self.arr)
+
+    def test_elems_len_after_resizing_elem(self):
+        self.scene.play(self.arr.animate_elem_square(1).stretch(2, 0))
+
+        squares = [mob.fetch_mob_square() for mob in self.arr.fetch_mob_arr()]
+        self.assertAlmostEqual(
+            self.arr.fetch_elems_len(0, 2),
+            sum(square.width for square in squares),
+        )
+
+    def test_pointer_after_scale(self):
+        pointer = MArrayPointer(self.scene, self.arr, 0)
+        self.scene.add(pointer)
+        self.arr.scale(0.5)
+
+        pointer.shift_to_elem(2)
+
+        self.assertAlmostEqual(
+            pointer.fetch_mob_arrow().get_center()[0],
+            self.arr.fetch_mob_arr()[2].fetch_mob_square().get_center()[0],
+        )
+
+    def test_vertical_append_elem_after_scale(self):
+        arr = MArray(self.scene, [1, 2], arr_dir=MArrayDirection.DOWN)
+        self.scene.add(arr)
+        arr.scale(0.5)
+
+        arr.append_elem(3)
+
+        squares = [mob.fetch_mob_square() for mob in arr.fetch_mob_arr()]
+        np.testing.assert_allclose(
+            squares[1].get_edge_center(DOWN), squares[2].get_edge_center(UP), atol=1e-6
+        )
+
+
+class TestMArrayElementComponents(unittest.TestCase):
+    def setUp(self):
+        self.scene = MRecordingScene()
+        self.elem = MArrayElement(self.scene, mob_value_args={"text": 1})
+        self.scene.add(self.elem)
+
+    def test_update_mob_index_instantiates_empty_index(self):
+        mob_index = self.elem.update_mob_index({"text": ""})
+
+        self.assertIs(mob_index, self.elem.fetch_mob_index())
+        self.assertEqual(len(self.scene.fetch_plays()), 1)
+
+    def test_update_mob_label_instantiates_empty_label(self):
+        mob_label = self.elem.update_mob_label({"text": ""})
+
+        self.assertIs(mob_label, self.elem.fetch_mob_label())
+        self.assertEqual(len(self.scene.fetch_plays()), 1)
+
+
+class TestMArrayNumericGlyphs(unittest.TestCase):
+    def test_glyph_values_keep_text(self):
+        scene = MRecordingScene()
+        arr = MArray(scene, [12, 3], numeric_glyphs=True)
+        scene.add(arr)
+
+        mob_value = arr.update_elem_value(1, 45)
+
+        self.assertEqual(arr.fetch_mob_arr()[0].fetch_mob_value().text, "12")
+        self.assertEqual(mob_value.text, "45")
+        self.assertEqual(arr.fetch_mob_arr()[1].fetch_mob_index().text, "1")
+
+
+class TestMArrayUpdateElemValues(unittest.TestCase):
+    def setUp(self):
+        self.scene = MRecordingScene()
+        self.arr = MArray(self.scene, [1, 2, 3])
+        self.scene.add(self.arr)
+
+    def test_skips_unchanged_text(self):
+        self.arr.update_elem_values([0, 1], [1, 5])
+
+        self.assertEqual(
+            len(self.scene.fetch_plays()[0]["animations"][0].animations), 1
+        )
+        self.assertEqual(self.arr.fetch_arr(), [1, 5, 3])
+
+    def test_updates_equal_values_with_different_text(self):
+        self.arr.update_elem_values([0, 1], [True, 2.0])
+
+        self.assertEqual(
+            [mob.fetch_mob_value().text for mob in self.arr.fetch_mob_arr()],
+            ["True", "2.0", "3"],
+        )
+        self.assertEqual(self.arr.fetch_arr(), [True, 2.0, 3])
+
+
+class TestMArrayFromNumpy(unittest.TestCase):
+    def setUp(self):
+        self.scene = MRecordingScene()
+
+    def test_update_elem_value_writes_buffer(self):
+        buffer = np.array([1, 2, 3])
+        arr = MArray.from_numpy(self.scene, buffer)
+
+        arr.update_elem_value(0, 7)
+
+        self.assertIs(arr.fetch_arr(), buffer)
+        self.assertEqual(buffer.tolist(), [7, 2, 3])
+
+    def test_update_elem_value_detaches_on_lossy_cast(self):
+        buffer = np.array([1, 2, 3])
+        arr = MArray.from_numpy(self.scene, buffer)
+
+        arr.update_elem_values([0, 1], [2.5, "x"])
+
+        self.assertEqual(arr.fetch_arr(), [2.5, "x", 3])
+        self.assertEqual(buffer.tolist(), [1, 2, 3])
+
+    def test_constructor_fmt(self):
+        buffer = np.array([1.0, 2.5, 1.0])
+        arr = MArray(self.scene, buffer, fmt="%.1f")
+
+        self.assertIs(arr.fetch_arr(), buffer)
+        self.assertEqual(
+            [mob.fetch_mob_value().text for mob in arr.fetch_mob_arr()],
+            ["1.0", "2.5", "1.0"],
+        )
+
+    def test_fmt_applies_to_later_values(self):
+        arr = MArray.from_numpy(self.scene, np.array([1.0, 2.0]), fmt="%.2f")
+
+        arr.append_elem(3.0)
+        arr.update_elem_value(0, 1.5)
+
+        self.assertEqual(
+            [mob.fetch_mob_value().text for mob in arr.fetch_mob_arr()],
+            ["1.50", "2.00", "3.00"],
+        )
+
+
+class TestMArrayPool(unittest.TestCase):
+    def setUp(self):
+        self.scene = MRecordingScene()
+        self.arr = MArray(self.scene, [1, 2, 3])
+        self.scene.add(self.arr)
+
+    def test_remove_elem_releases_removed_elem(self):
+        self.arr.remove_elem(0)
+
+        self.assertEqual(self.arr.fetch_pool().fetch_stats()["releases"], 1)
+
+    def test_remove_elem_keeps_displayed_elem(self):
+        removed_mob = self.arr.fetch_mob_arr()[0]
+
+        self.arr.remove_elem(0, removal_anim=Indicate)
+        self.arr.append_elem(4)
+
+        self.assertEqual(self.arr.fetch_pool().fetch_stats()["releases"], 0)
+        self.assertIsNot(self.arr.fetch_mob_arr()[-1], removed_mob)
+
+    def test_batch_remove_elem_keeps_displayed_elem(self):
+        with self.arr.batch():
+            self.arr.remove_elem(0, removal_anim=Indicate)
+
+        self.assertEqual(self.arr.fetch_pool().fetch_stats()["releases"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+from manim import RED
+
+from manim_data_structures import *
+
+
+class TestMTextCacheAtlases(unittest.TestCase):
+    def test_atlases_bounded_by_max_size(self):
+        cache = MTextCache(max_size=1)
+
+        cache.fetch_numeric(text="12")
+        cache.fetch_numeric(text="12", color=RED)
+
+        cache_stats = cache.fetch_stats()
+        self.assertEqual(cache_stats["atlases"], 1)
+        self.assertEqual(cache_stats["evictions"], 1)
+
+    def test_recently_used_atlas_kept(self):
+        cache = MTextCache(max_size=2)
+
+        cache.fetch_numeric(text="1")
+        cache.fetch_numeric(text="1", color=RED)
+        cache.fetch_numeric(text="2")
+        cache.fetch_numeric(text="1", font_size=20)
+        cache.fetch_numeric(text="3")
+
+        self.assertEqual(cache.fetch_stats()["atlases"], 2)
+        self.assertEqual(cache.fetch_stats()["evictions"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
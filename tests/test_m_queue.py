@@ -0,0 +1,102 @@
+import unittest
+
+from manim_data_structures import *
+
+
+class TestMQueue(unittest.TestCase):
+    def setUp(self):
+        self.scene = MRecordingScene()
+        self.queue = MQueue(self.scene, 3)
+        self.scene.add(self.queue)
+
+    def fetch_mob_values(self):
+        return [
+            mob.fetch_mob_value() for mob in self.queue.fetch_mob_arr().fetch_mob_arr()
+        ]
+
+    def test_wrap_around(self):
+        for value in (1, 2, 3):
+            self.queue.enqueue(value)
+
+        self.assertEqual(self.queue.fetch_tail(), 0)
+
+        self.queue.dequeue()
+        self.queue.dequeue()
+        self.queue.enqueue(4)
+        self.queue.enqueue(5)
+
+        self.assertEqual((self.queue.fetch_head(), self.queue.fetch_tail()), (2, 2))
+        self.assertEqual(self.queue.fetch_arr(), [3, 4, 5])
+        self.assertEqual(self.queue.fetch_front(), 3)
+        self.assertEqual(self.queue.fetch_mob_arr().fetch_arr(), [4, 5, 3])
+
+    def test_pointers_follow_wrap_around(self):
+        for value in (1, 2, 3):
+            self.queue.enqueue(value)
+        for _ in range(3):
+            self.queue.dequeue()
+
+        squares = [
+            mob.fetch_mob_square() for mob in self.queue.fetch_mob_arr().fetch_mob_arr()
+        ]
+        for pointer in (self.queue.fetch_mob_head(), self.queue.fetch_mob_tail()):
+            self.assertEqual(pointer.fetch_index(), 0)
+            self.assertAlmostEqual(
+                pointer.fetch_mob_arrow().get_center()[0], squares[0].get_center()[0]
+            )
+
+    def test_full(self):
+        for value in (1, 2, 3):
+            self.queue.enqueue(value)
+
+        self.assertTrue(self.queue.is_full())
+        with self.assertRaises(Exception):
+            self.queue.enqueue(4)
+        with self.assertRaises(Exception):
+            MQueue(self.scene, 2, [1, 2, 3])
+
+    def test_empty(self):
+        self.assertTrue(self.queue.is_empty())
+        with self.assertRaises(Exception):
+            self.queue.dequeue()
+        with self.assertRaises(Exception):
+            self.queue.fetch_front()
+
+        self.queue.enqueue(1)
+        self.queue.dequeue()
+
+        self.assertTrue(self.queue.is_empty())
+        self.assertEqual(self.queue.fetch_arr(), [])
+
+    def test_one_play_per_operation(self):
+        self.queue.enqueue(1)
+        self.queue.enqueue(2)
+        self.queue.dequeue()
+
+        self.assertEqual(len(self.scene.fetch_plays()), 3)
+
+    def assert_one_slot_changed(self, operation, slot):
+        mob_values = self.fetch_mob_values()
+        plays = len(self.scene.fetch_plays())
+
+        operation()
+
+        self.assertEqual(len(self.scene.fetch_plays()), plays + 1)
+        changed = [
+            i
+            for i, (old, new) in enumerate(zip(mob_values, self.fetch_mob_values()))
+            if old is not new
+        ]
+        self.assertEqual(changed, [slot])
+
+    def test_operations_touch_one_slot(self):
+        self.queue.enqueue(1)
+        self.queue.enqueue(2)
+
+        self.assert_one_slot_changed(lambda: self.queue.enqueue(3), 2)
+        self.assert_one_slot_changed(self.queue.dequeue, 0)
+        self.assert_one_slot_changed(lambda: self.queue.enqueue(4), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
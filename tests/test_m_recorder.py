@@ -0,0 +1,81 @@
+import unittest
+
+from manim_data_structures import *
+
+
+class TestMArrayRecorder(unittest.TestCase):
+    def setUp(self):
+        self.scene = MRecordingScene()
+        self.arr = MArray(self.scene, [2, 1, 4, 3])
+        self.scene.add(self.arr)
+        self.recorder = MArrayRecorder(self.scene, self.arr)
+
+    def odd_even_pass(self, start):
+        a = self.recorder
+        for i in range(start, len(a) - 1, 2):
+            if a[i] > a[i + 1]:
+                a[i], a[i + 1] = a[i + 1], a[i]
+
+    def test_swap_pair(self):
+        a = self.recorder
+        a[0], a[3] = a[3], a[0]
+
+        trace = self.recorder.compile()
+
+        self.assertEqual(trace.fetch_rounds(), [[("swap", (0, 3))]])
+        self.assertEqual(self.recorder.fetch_values(), [3, 1, 4, 2])
+        self.assertEqual(self.arr.fetch_arr(), [2, 1, 4, 3])
+
+    def test_slice_swap_pair(self):
+        a = self.recorder
+        a[0:2] = [a[1], a[0]]
+
+        self.assertEqual(self.recorder.compile().fetch_rounds(), [[("swap", (0, 1))]])
+
+    def test_slice_length_change(self):
+        with self.assertRaises(ValueError):
+            self.recorder[0:2] = [5]
+
+    def test_fold_writes(self):
+        a = self.recorder
+        a[0] = 5
+        a[0] = 6
+
+        self.assertEqual(
+            self.recorder.compile().fetch_rounds(), [[("write", (0,), 6, None)]]
+        )
+        self.assertEqual(
+            self.recorder.compile(fold_writes=False).fetch_stats()["writes"], 2
+        )
+
+    def test_disjoint_swaps_share_round(self):
+        self.odd_even_pass(0)
+
+        trace = self.recorder.compile()
+
+        self.assertEqual(
+            trace.fetch_rounds(),
+            [
+                [("compare", (0, 1)), ("compare", (2, 3))],
+                [("swap", (0, 1)), ("swap", (2, 3))],
+            ],
+        )
+
+        trace.play()
+
+        self.assertEqual(len(self.scene.fetch_plays()), 2)
+        self.assertEqual(self.arr.fetch_arr(), [1, 2, 3, 4])
+
+    def test_run_time_budget(self):
+        self.odd_even_pass(0)
+
+        self.recorder.compile().play(round_time=1, run_time=1)
+
+        self.assertEqual(
+            [play["run_time"] for play in self.scene.fetch_plays()], [0.5, 0.5]
+        )
+        self.assertAlmostEqual(self.scene.fetch_time(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
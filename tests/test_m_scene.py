@@ -0,0 +1,197 @@
+import unittest
+
+import numpy as np
+from manim import ORIGIN, RIGHT, UP
+
+from manim_data_structures import *
+
+
+class TestMRecordingScene(unittest.TestCase):
+    def setUp(self):
+        self.scene = MRecordingScene()
+        self.arr = MArray(self.scene, [1, 2, 3])
+        self.scene.add(self.arr)
+
+    def assert_contiguous(self, arr):
+        squares = [mob.fetch_mob_square() for mob in arr.fetch_mob_arr()]
+        for prev, curr in zip(squares, squares[1:]):
+            np.testing.assert_allclose(prev.get_right(), curr.get_left(), atol=1e-6)
+
+    def test_get_mobject_family_members(self):
+        family = self.scene.get_mobject_family_members()
+
+        self.assertIn(self.arr, family)
+        self.assertIn(self.arr.fetch_mob_arr()[0].fetch_mob_square(), family)
+
+    def test_append_elem(self):
+        self.arr.append_elem(4)
+
+        self.assertEqual(len(self.scene.fetch_plays()), 1)
+        self.assertEqual(self.arr.fetch_arr(), [1, 2, 3, 4])
+        self.assert_contiguous(self.arr)
+
+    def test_update_elem_value(self):
+        mob_value = self.arr.update_elem_value(1, 9)
+
+        self.assertEqual(len(self.scene.fetch_plays()), 1)
+        self.assertEqual(self.arr.fetch_arr(), [1, 9, 3])
+        self.assertIn(mob_value, self.scene.get_mobject_family_members())
+
+    def test_insert_elem(self):
+        self.arr.insert_elem(1, 5)
+
+        self.assertEqual(self.arr.fetch_arr(), [1, 5, 2, 3])
+        self.assert_contiguous(self.arr)
+
+    def test_remove_elem(self):
+        left_np = self.arr.fetch_mob_arr()[0].fetch_mob_square().get_left()
+
+        self.arr.remove_elem(0)
+
+        self.assertEqual(self.arr.fetch_arr(), [2, 3])
+        np.testing.assert_allclose(
+            self.arr.fetch_mob_arr()[0].fetch_mob_square().get_left(),
+            left_np,
+            atol=1e-6,
+        )
+        self.assert_contiguous(self.arr)
+
+    def test_swap_elems(self):
+        self.arr.swap_elems(0, 2)
+
+        self.assertEqual(self.arr.fetch_arr(), [3, 2, 1])
+        self.assert_contiguous(self.arr)
+
+    def test_extend_elems(self):
+        self.assertEqual(self.arr.extend_elems(range(4, 9), chunk_size=2), 5)
+
+        self.assertEqual(len(self.scene.fetch_plays()), 3)
+        self.assertEqual(self.arr.fetch_arr(), [1, 2, 3, 4, 5, 6, 7, 8])
+        self.assert_contiguous(self.arr)
+
+    def test_batch(self):
+        with self.arr.batch():
+            self.arr.update_elem_value(0, 7)
+            self.arr.append_elem(4)
+
+        self.assertEqual(len(self.scene.fetch_plays()), 1)
+        self.assertEqual(self.arr.fetch_arr(), [7, 2, 3, 4])
+
+    def test_batch_flushes_around_insert_elem(self):
+        with self.arr.batch():
+            self.arr.update_elem_value(0, 7)
+            self.arr.insert_elem(1, 9)
+            self.arr.update_elem_value(3, 8)
+
+        self.assertEqual(len(self.scene.fetch_plays()), 3)
+        self.assertEqual(self.arr.fetch_arr(), [7, 9, 2, 8])
+        self.assert_contiguous(self.arr)
+
+    def test_pointer_shift_to_elem(self):
+        pointer = MArrayPointer(self.scene, self.arr, 0)
+        self.scene.add(pointer)
+
+        pointer.shift_to_elem(2)
+
+        self.assertEqual(pointer.fetch_index(), 2)
+        self.assertAlmostEqual(
+            pointer.fetch_mob_arrow().get_center()[0],
+            self.arr.fetch_mob_arr()[2].fetch_mob_square().get_center()[0],
+        )
+
+    def test_pointer_follows_remove_elem(self):
+        pointer = MArrayPointer(self.scene, self.arr, 2)
+        self.scene.add(pointer)
+
+        self.arr.remove_elem(0)
+
+        self.assertEqual(pointer.fetch_index(), 1)
+        self.assertAlmostEqual(
+            pointer.fetch_mob_arrow().get_center()[0],
+            self.arr.fetch_mob_arr()[1].fetch_mob_square().get_center()[0],
+        )
+
+    def test_geometry_version(self):
+        version = self.arr.fetch_geometry_version()
+
+        self.assertEqual(self.arr.fetch_geometry_version(), version)
+
+        self.arr.scale(0.5)
+
+        self.assertNotEqual(self.arr.fetch_geometry_version(), version)
+
+    def test_move_events_coalesced(self):
+        events = []
+        self.arr.subscribe(lambda event, index: events.append(event) or [])
+
+        self.arr.shift(UP)
+        self.arr.move_to(ORIGIN)
+        self.arr.next_to(ORIGIN, RIGHT)
+
+        self.assertEqual(events, [])
+
+        self.arr.fetch_geometry_version()
+
+        self.assertEqual(events, [MArrayEvent.MOVE])
+
+    def test_scale_emits_resize(self):
+        events = []
+        self.arr.subscribe(lambda event, index: events.append((event, index)) or [])
+
+        self.arr.scale(0.5)
+
+        self.assertEqual(events, [(MArrayEvent.RESIZE, None)])
+
+    def test_window_fits_after_scale(self):
+        window = MArraySlidingWindow(self.scene, self.arr, 0, 2)
+        self.scene.add(window)
+
+        self.arr.scale(0.5)
+
+        squares = [mob.fetch_mob_square() for mob in self.arr.fetch_mob_arr()]
+        self.assertAlmostEqual(
+            window.fetch_mob_window().get_left()[0], squares[0].get_left()[0]
+        )
+        self.assertAlmostEqual(
+            window.fetch_mob_window().get_right()[0], squares[1].get_right()[0]
+        )
+
+    def test_pointer_follows_array_animation(self):
+        pointer = MArrayPointer(self.scene, self.arr, 1)
+        self.scene.add(pointer)
+
+        self.scene.play(self.arr.animate.shift(UP))
+
+        square = self.arr.fetch_mob_arr()[1].fetch_mob_square()
+        self.assertAlmostEqual(
+            pointer.fetch_mob_arrow().get_top()[1], square.get_bottom()[1] - 0.25
+        )
+
+    def test_window_shift_and_resize(self):
+        window = MArraySlidingWindow(self.scene, self.arr, 0, 1)
+        self.scene.add(window)
+
+        window.shift_to_elem(1)
+        window.resize_window(2)
+
+        squares = [mob.fetch_mob_square() for mob in self.arr.fetch_mob_arr()]
+        self.assertEqual((window.fetch_index(), window.fetch_size()), (1, 2))
+        self.assertAlmostEqual(
+            window.fetch_mob_window().get_left()[0], squares[1].get_left()[0]
+        )
+        self.assertAlmostEqual(
+            window.fetch_mob_window().get_right()[0], squares[2].get_right()[0]
+        )
+
+    def test_reset(self):
+        self.arr.append_elem(4)
+
+        self.scene.reset()
+
+        self.assertEqual(self.scene.fetch_plays(), [])
+        self.assertEqual(self.scene.fetch_time(), 0)
+        self.assertIn(self.arr, self.scene.fetch_mobjects())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from manim_data_structures import *
+
+
+class Counter:
+    def increment(self, n):
+        return n + 1
+
+
+class TestMStatsUnwrap(unittest.TestCase):
+    def setUp(self):
+        self.original = Counter.increment
+        self.stats_1 = MStats()
+        self.stats_2 = MStats()
+        self.stats_1.register(Counter)
+        self.stats_2.register(Counter)
+
+    def tearDown(self):
+        self.stats_1.disable()
+        self.stats_2.disable()
+        Counter.increment = self.original
+
+    def test_disable_in_order(self):
+        self.stats_1.enable()
+        self.stats_2.enable()
+
+        self.stats_2.disable()
+        self.stats_1.disable()
+
+        self.assertIs(Counter.increment, self.original)
+
+    def test_disable_beneath_other_wrapper(self):
+        self.stats_1.enable()
+        self.stats_2.enable()
+
+        self.stats_1.disable()
+
+        self.assertIs(Counter.increment.__wrapped__, self.original)
+        self.assertEqual(Counter().increment(1), 2)
+        self.assertEqual(self.stats_2.snapshot()["times"]["Counter.increment"][0], 1)
+
+        self.stats_2.disable()
+
+        self.assertIs(Counter.increment, self.original)
+
+
+if __name__ == "__main__":
+    unittest.main()
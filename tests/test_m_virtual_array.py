@@ -0,0 +1,86 @@
+import unittest
+
+from manim import Scene, tempconfig
+
+from manim_data_structures import *
+
+
+class TestMVirtualArraySwap(unittest.TestCase):
+    def setUp(self):
+        dry_run = tempconfig({"dry_run": True})
+        dry_run.__enter__()
+        self.addCleanup(dry_run.__exit__, None, None, None)
+
+        self.scene = Scene()
+        self.arr = MVirtualArray(self.scene, list(range(10)), view_size=4)
+        self.scene.add(self.arr)
+
+    def fetch_texts(self):
+        return [mob.fetch_mob_value().text for mob in self.arr.fetch_mob_arr()]
+
+    def test_swap_inside_viewport(self):
+        self.arr.swap_elems(0, 1)
+
+        self.assertEqual(self.arr.fetch_arr()[:4], [1, 0, 2, 3])
+        self.assertEqual(self.fetch_texts(), ["1", "0", "2", "3"])
+
+        self.arr.scroll_to(5)
+        self.arr.scroll_to(0)
+
+        self.assertEqual(self.fetch_texts(), ["1", "0", "2", "3"])
+
+    def test_swap_across_viewport(self):
+        self.arr.swap_elems(1, 8)
+
+        self.assertEqual(self.arr.fetch_arr()[1], 8)
+        self.assertEqual(self.arr.fetch_arr()[8], 1)
+        self.assertEqual(self.fetch_texts(), ["0", "8", "2", "3"])
+
+        self.arr.scroll_to(6)
+
+        self.assertEqual(self.fetch_texts(), ["6", "7", "1", "9"])
+
+    def test_swap_outside_viewport(self):
+        plays = self.scene.renderer.num_plays
+
+        self.arr.swap_elems(6, 7)
+
+        self.assertEqual(self.arr.fetch_arr()[6:8], [7, 6])
+        self.assertEqual(self.scene.renderer.num_plays, plays)
+
+
+class TestMVirtualArrayModel(unittest.TestCase):
+    def setUp(self):
+        self.scene = MRecordingScene()
+
+    def test_range_model(self):
+        arr = MVirtualArray(self.scene, range(6), view_size=4)
+
+        arr.append_elem(6)
+        arr.insert_elem(0, -1)
+
+        self.assertEqual(arr.fetch_arr(), [-1, 0, 1, 2, 3, 4, 5, 6])
+
+    def test_tuple_model(self):
+        values = (1, 2, 3)
+        arr = MVirtualArray(self.scene, values, view_size=2)
+
+        arr.update_elem_value(0, 7)
+        arr.append_elem(4)
+
+        self.assertEqual(arr.fetch_arr(), [7, 2, 3, 4])
+        self.assertEqual(values, (1, 2, 3))
+
+    def test_default_model_not_shared(self):
+        arr_1 = MVirtualArray(self.scene, view_size=2)
+        arr_2 = MVirtualArray(self.scene, view_size=2)
+
+        arr_1.append_elem(1)
+
+        self.assertEqual(arr_1.fetch_arr(), [1])
+        self.assertEqual(arr_2.fetch_arr(), [])
+        self.assertEqual(MVirtualArray(self.scene, view_size=2).fetch_arr(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()